@@ -0,0 +1,106 @@
+import argparse
+import asyncio
+import shutil
+import tempfile
+import time
+
+from src.domain import (
+    ProductCreatedPendingVerification,
+    ProductStatus,
+    ProductVerificationCompleted,
+)
+from src.infrastructure import EventLog, EventLogDispatcher
+
+
+def make_event(n: int):
+    if n % 2:
+        return ProductVerificationCompleted(
+            product_id=f"01a15417-0000-7000-8000-{n // 2:012d}",
+            status=ProductStatus.REJECTED,
+            reasons=["price must be greater than 0"],
+        )
+    return ProductCreatedPendingVerification(
+        product_id=f"01a15417-0000-7000-8000-{n // 2:012d}",
+        name=f"Benchmark product {n}",
+        price=9.99,
+        currency="USD",
+        category="Benchmark",
+    )
+
+
+async def append(dispatcher: EventLogDispatcher, events, producers: int) -> float:
+    # Each producer dispatches one request's events at a time, like the
+    # use cases do after commit.
+    per_producer = len(events) // producers
+
+    async def produce(start: int) -> None:
+        for n in range(start, start + per_producer, 2):
+            await dispatcher.dispatch_all(events[n : n + 2])
+
+    started = time.perf_counter()
+    await asyncio.gather(*(produce(p * per_producer) for p in range(producers)))
+    return time.perf_counter() - started
+
+
+async def main(args) -> None:
+    directory = tempfile.mkdtemp(prefix="event-log-benchmark-")
+    try:
+        events = [make_event(n) for n in range(args.events)]
+        log = EventLog(
+            directory,
+            segment_bytes=args.segment_mb * 1024 * 1024,
+            flush_interval=args.flush_interval_ms / 1000,
+        )
+        dispatcher = EventLogDispatcher(log)
+        elapsed = await append(dispatcher, events, args.producers)
+        appended = log.end_offset
+        megabytes = log.size_bytes / 1e6
+        print(
+            f"append  {appended / elapsed:>12,.0f} events/s  "
+            f"{megabytes / elapsed:>8.1f} MB/s  "
+            f"({args.producers} producers, {log.segment_count} segments)"
+        )
+
+        started = time.perf_counter()
+        raw = 0
+        offset = 0
+        while True:
+            records = log.read(offset, args.batch_size)
+            if not records:
+                break
+            raw += len(records)
+            offset = records[-1][0] + 1
+        elapsed = time.perf_counter() - started
+        print(
+            f"read    {raw / elapsed:>12,.0f} records/s  "
+            f"{megabytes / elapsed:>8.1f} MB/s  (raw payloads)"
+        )
+
+        started = time.perf_counter()
+        decoded = 0
+        async for _ in dispatcher.read_from(0, args.batch_size):
+            decoded += 1
+        elapsed = time.perf_counter() - started
+        print(f"replay  {decoded / elapsed:>12,.0f} events/s  (decoded DomainEvents)")
+
+        started = time.perf_counter()
+        middle = [
+            len(log.read(n, 1)) for n in range(0, appended, max(1, appended // 1000))
+        ]
+        elapsed = time.perf_counter() - started
+        print(f"seek    {elapsed / len(middle) * 1e6:>12.1f} us per random offset")
+        await log.close()
+    finally:
+        shutil.rmtree(directory)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Event log append (group-committed fsync) and replay throughput"
+    )
+    parser.add_argument("--events", type=int, default=200_000)
+    parser.add_argument("--producers", type=int, default=64)
+    parser.add_argument("--flush-interval-ms", type=float, default=2.0)
+    parser.add_argument("--segment-mb", type=int, default=16)
+    parser.add_argument("--batch-size", type=int, default=1000)
+    asyncio.run(main(parser.parse_args()))
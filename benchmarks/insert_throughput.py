@@ -0,0 +1,172 @@
+import argparse
+import asyncio
+import time
+from datetime import datetime
+from uuid import uuid4
+
+from sqlalchemy import (
+    CHAR,
+    Column,
+    DateTime,
+    Float,
+    Index,
+    Integer,
+    MetaData,
+    String,
+    Table,
+    text,
+)
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.types import BINARY
+
+from src.api.app import MYSQL_URL
+from src.domain.product_id import uuid7
+
+metadata = MetaData()
+
+
+def _bench_table(name: str, id_type) -> Table:
+    return Table(
+        name,
+        metadata,
+        Column("id", id_type, primary_key=True),
+        Column("name", String(255), nullable=False),
+        Column("price", Float, nullable=False),
+        Column("currency", String(10), nullable=False),
+        Column("category", String(255), nullable=False),
+        Column("stock_quantity", Integer, nullable=False),
+        Column("status", String(32), nullable=False),
+        Column("created_at", DateTime, nullable=False),
+        Index(f"ix_{name}_category", "category"),
+        Index(f"ix_{name}_status", "status"),
+    )
+
+
+LAYOUTS = {
+    "uuid4_char36": (
+        _bench_table("bench_products_uuid4", CHAR(36)),
+        lambda: str(uuid4()),
+    ),
+    "uuid7_binary16": (
+        _bench_table("bench_products_uuid7", BINARY(16)),
+        lambda: uuid7().bytes,
+    ),
+}
+
+CATEGORIES = ["Electronics", "Books", "Home", "Toys", "Garden", "Fashion"]
+
+
+def _rows(count: int, make_id):
+    now = datetime.utcnow()
+    return [
+        {
+            "id": make_id(),
+            "name": f"Product {i}",
+            "price": 9.99 + i % 100,
+            "currency": "USD",
+            "category": CATEGORIES[i % len(CATEGORIES)],
+            "stock_quantity": i % 500,
+            "status": "pending_verification",
+            "created_at": now,
+        }
+        for i in range(count)
+    ]
+
+
+async def _table_size_mb(conn, table: Table) -> tuple:
+    await conn.execute(text(f"ANALYZE TABLE {table.name}"))
+    result = await conn.execute(
+        text(
+            "SELECT DATA_LENGTH, INDEX_LENGTH FROM information_schema.TABLES "
+            "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = :name"
+        ),
+        {"name": table.name},
+    )
+    data_length, index_length = result.one()
+    return data_length / 1024 / 1024, index_length / 1024 / 1024
+
+
+async def run_layout(
+    engine, layout: str, total_rows: int, batch_size: int, report_every: int
+):
+    table, make_id = LAYOUTS[layout]
+
+    async with engine.begin() as conn:
+        await conn.run_sync(table.drop, checkfirst=True)
+        await conn.run_sync(table.create)
+
+    inserted = 0
+    started = time.perf_counter()
+    window_started = started
+    window_rows = 0
+
+    while inserted < total_rows:
+        batch = _rows(min(batch_size, total_rows - inserted), make_id)
+        async with engine.begin() as conn:
+            await conn.execute(table.insert(), batch)
+        inserted += len(batch)
+        window_rows += len(batch)
+
+        if window_rows >= report_every or inserted == total_rows:
+            now = time.perf_counter()
+            print(
+                f"[{layout}] {inserted:>12,} rows  "
+                f"window {window_rows / (now - window_started):>10,.0f} rows/s"
+            )
+            window_started = now
+            window_rows = 0
+
+    elapsed = time.perf_counter() - started
+    async with engine.connect() as conn:
+        data_mb, index_mb = await _table_size_mb(conn, table)
+
+    return {
+        "layout": layout,
+        "rows": inserted,
+        "seconds": elapsed,
+        "rows_per_second": inserted / elapsed,
+        "data_mb": data_mb,
+        "index_mb": index_mb,
+    }
+
+
+async def main(args) -> None:
+    engine = create_async_engine(MYSQL_URL, echo=False, pool_size=1)
+    results = []
+    try:
+        for layout in args.layouts:
+            results.append(
+                await run_layout(
+                    engine, layout, args.rows, args.batch_size, args.report_every
+                )
+            )
+        if not args.keep_tables:
+            async with engine.begin() as conn:
+                for layout in args.layouts:
+                    await conn.run_sync(LAYOUTS[layout][0].drop, checkfirst=True)
+    finally:
+        await engine.dispose()
+
+    print()
+    print(
+        f"{'layout':<16}{'rows':>14}{'seconds':>10}{'rows/s':>12}{'data MB':>10}{'index MB':>10}"
+    )
+    for r in results:
+        print(
+            f"{r['layout']:<16}{r['rows']:>14,}{r['seconds']:>10.1f}"
+            f"{r['rows_per_second']:>12,.0f}{r['data_mb']:>10.1f}{r['index_mb']:>10.1f}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Compare insert throughput of uuid4 CHAR(36) vs uuid7 BINARY(16) primary keys"
+    )
+    parser.add_argument("--rows", type=int, default=10_000_000)
+    parser.add_argument("--batch-size", type=int, default=5_000)
+    parser.add_argument("--report-every", type=int, default=1_000_000)
+    parser.add_argument(
+        "--layouts", nargs="+", choices=sorted(LAYOUTS), default=sorted(LAYOUTS)
+    )
+    parser.add_argument("--keep-tables", action="store_true")
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,476 @@
+import argparse
+import asyncio
+import math
+import os
+import random
+import subprocess
+import sys
+import time
+from collections import Counter, deque
+from dataclasses import dataclass, field
+from typing import Deque, Dict, List, Optional, Tuple
+
+import httpx
+
+PRODUCTS_PATH = "/api/v1/products"
+
+# Route name -> weight in the default traffic mix. The API has no batch
+# route, so search and catalogue stats stand in for the multi-product reads.
+DEFAULT_MIX = {
+    "create": 10,
+    "verify": 10,
+    "get": 45,
+    "get_with_verification": 10,
+    "search": 10,
+    "stats": 5,
+    "reserve": 10,
+}
+
+CATEGORIES = ["Phones", "Laptops", "Audio", "Cameras", "Home", "Garden", "Toys"]
+BRANDS = ["Apple", "Samsung", "Sony", "Lenovo", "Bosch", "Lego", "Canon", "Dell"]
+NOUNS = ["Pro", "Max", "Mini", "Ultra", "Lite", "Plus", "Air", "Edge"]
+CURRENCIES = ["USD", "EUR", "GBP"]
+INVALID_FIELDS = ["name", "category", "price", "stock_quantity", "assets"]
+
+
+class Histogram:
+    # Log-linear histogram in the HdrHistogram layout: every power of two
+    # range is split into sub_buckets linear buckets, so any recorded value
+    # is kept to within 1 / sub_buckets of its true value (2048 buckets is
+    # just over 3 significant digits) in constant memory. Percentiles report
+    # the highest value equivalent to the matching bucket, like HdrHistogram.
+    def __init__(self, significant_bits: int = 11):
+        self._bits = significant_bits
+        self._counts: Counter = Counter()
+        self.count = 0
+        self.total = 0
+        self.min = 0
+        self.max = 0
+
+    def record(self, value: int, count: int = 1) -> None:
+        if value < 0:
+            raise ValueError("Histogram values must be >= 0")
+        self._counts[self._index(value)] += count
+        if self.count == 0 or value < self.min:
+            self.min = value
+        self.max = max(self.max, value)
+        self.count += count
+        self.total += value * count
+
+    def merge(self, other: "Histogram") -> None:
+        if other.count == 0:
+            return
+        self._counts.update(other._counts)
+        self.min = other.min if self.count == 0 else min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self.count += other.count
+        self.total += other.total
+
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def percentile(self, pct: float) -> int:
+        if self.count == 0:
+            return 0
+        target = max(1, math.ceil(self.count * pct / 100))
+        seen = 0
+        for index in sorted(self._counts):
+            seen += self._counts[index]
+            if seen >= target:
+                return min(self._highest_equivalent(index), self.max)
+        return self.max
+
+    def _index(self, value: int) -> Tuple[int, int]:
+        shift = max(0, value.bit_length() - self._bits)
+        return shift, value >> shift
+
+    @staticmethod
+    def _highest_equivalent(index: Tuple[int, int]) -> int:
+        shift, sub_bucket = index
+        return ((sub_bucket + 1) << shift) - 1
+
+
+@dataclass
+class RouteStats:
+    # latency is measured from the time the request was scheduled to be
+    # sent, so time spent queued behind a stalled server or a late generator
+    # is counted (no coordinated omission). service_time starts when the
+    # request actually went out and is what a closed-loop tool would report.
+    # Requests that failed or were never sent still count in latency (see
+    # run_load), so the tail is not trimmed by the load generator itself.
+    latency: Histogram = field(default_factory=Histogram)
+    service_time: Histogram = field(default_factory=Histogram)
+    statuses: Counter = field(default_factory=Counter)
+    errors: int = 0
+    dropped: int = 0
+
+
+@dataclass
+class LoadReport:
+    routes: Dict[str, RouteStats]
+    target_rate: float
+    duration: float
+    scheduled: int
+    dropped: int
+
+    def overall(self) -> RouteStats:
+        total = RouteStats()
+        for stats in self.routes.values():
+            total.latency.merge(stats.latency)
+            total.service_time.merge(stats.service_time)
+            total.statuses.update(stats.statuses)
+            total.errors += stats.errors
+            total.dropped += stats.dropped
+        return total
+
+
+def synthetic_product(rng: random.Random, invalid_fraction: float) -> dict:
+    brand = rng.choice(BRANDS)
+    product = {
+        "name": f"{brand} {rng.choice(NOUNS)} {rng.randint(1, 999)}",
+        "price": round(rng.uniform(1, 2500), 2),
+        "currency": rng.choice(CURRENCIES),
+        "category": rng.choice(CATEGORIES),
+        "stock_quantity": rng.randint(0, 500),
+        "assets": [
+            f"https://cdn.example.com/{brand.lower()}/{rng.getrandbits(32):08x}.jpg"
+            for _ in range(rng.randint(1, 4))
+        ],
+    }
+    # Invalid products still pass request validation and are created; they
+    # exercise the rejection path when verified.
+    if rng.random() < invalid_fraction:
+        for name in rng.sample(INVALID_FIELDS, rng.randint(1, 2)):
+            if name in ("name", "category"):
+                product[name] = rng.choice(["", "   "])
+            elif name == "price":
+                product["price"] = rng.choice([0.0, -round(rng.uniform(1, 100), 2)])
+            elif name == "stock_quantity":
+                product["stock_quantity"] = -rng.randint(1, 50)
+            else:
+                product["assets"] = []
+    return product
+
+
+class Catalogue:
+    def __init__(self, rng: random.Random, invalid_fraction: float):
+        self._rng = rng
+        self._invalid_fraction = invalid_fraction
+        self.product_ids: List[str] = []
+        self.unverified: Deque[str] = deque()
+        self.search_terms = [term.lower() for term in BRANDS + CATEGORIES + NOUNS]
+
+    def new_product(self) -> dict:
+        return synthetic_product(self._rng, self._invalid_fraction)
+
+    def add(self, product_id: str) -> None:
+        self.product_ids.append(product_id)
+        self.unverified.append(product_id)
+
+    def any_product(self) -> Optional[str]:
+        return self._rng.choice(self.product_ids) if self.product_ids else None
+
+    def product_to_verify(self) -> Optional[str]:
+        # New products first, then repeats, which hit the verification memo.
+        if self.unverified:
+            return self.unverified.popleft()
+        return self.any_product()
+
+    def search_query(self) -> str:
+        term = self._rng.choice(self.search_terms)
+        return term[: self._rng.randint(2, len(term))]
+
+
+async def send(
+    client: httpx.AsyncClient, route: str, catalogue: Catalogue, rng: random.Random
+) -> Optional[httpx.Response]:
+    if route == "create":
+        response = await client.post(PRODUCTS_PATH, json=catalogue.new_product())
+        if response.status_code == 201:
+            catalogue.add(response.json()["product_id"])
+        return response
+    if route == "search":
+        return await client.get(
+            f"{PRODUCTS_PATH}/search", params={"q": catalogue.search_query()}
+        )
+    if route == "stats":
+        return await client.get(f"{PRODUCTS_PATH}/stats")
+
+    product_id = (
+        catalogue.product_to_verify() if route == "verify" else catalogue.any_product()
+    )
+    if product_id is None:
+        return None
+    if route == "verify":
+        return await client.post(f"{PRODUCTS_PATH}/{product_id}/verify")
+    if route == "get":
+        return await client.get(f"{PRODUCTS_PATH}/{product_id}")
+    if route == "get_with_verification":
+        return await client.get(
+            f"{PRODUCTS_PATH}/{product_id}", params={"include": "verification"}
+        )
+    if route == "reserve":
+        return await client.post(
+            f"{PRODUCTS_PATH}/{product_id}/stock/reserve",
+            json={"quantity": rng.randint(1, 3)},
+        )
+    raise ValueError(f"Unknown route {route!r}")
+
+
+async def seed_catalogue(
+    client: httpx.AsyncClient,
+    catalogue: Catalogue,
+    products: int,
+    verify_fraction: float,
+    rng: random.Random,
+    concurrency: int = 32,
+) -> None:
+    # Closed-loop warm-up so reads have something to hit; not measured.
+    semaphore = asyncio.Semaphore(concurrency)
+    created: List[str] = []
+
+    async def create() -> None:
+        async with semaphore:
+            response = await client.post(PRODUCTS_PATH, json=catalogue.new_product())
+            response.raise_for_status()
+            created.append(response.json()["product_id"])
+
+    async def verify(product_id: str) -> None:
+        async with semaphore:
+            await client.post(f"{PRODUCTS_PATH}/{product_id}/verify")
+
+    await asyncio.gather(*(create() for _ in range(products)))
+    created.sort()
+    to_verify = [product_id for product_id in created if rng.random() < verify_fraction]
+    await asyncio.gather(*(verify(product_id) for product_id in to_verify))
+    verified = set(to_verify)
+    for product_id in created:
+        catalogue.product_ids.append(product_id)
+        if product_id not in verified:
+            catalogue.unverified.append(product_id)
+
+
+async def run_load(
+    client: httpx.AsyncClient,
+    catalogue: Catalogue,
+    rate: float,
+    duration: float,
+    mix: Dict[str, int],
+    rng: random.Random,
+    max_in_flight: int = 1000,
+    poisson: bool = False,
+) -> LoadReport:
+    # Open loop: request i is due at start + i / rate (or after seeded
+    # exponential gaps with poisson), whether or not earlier requests have
+    # finished. Requests that would exceed max_in_flight are not sent; they
+    # are recorded at the end of the run with their latency from the
+    # intended send time up to then (a lower bound), not silently skipped.
+    routes = list(mix)
+    weights = [mix[route] for route in routes]
+    stats = {route: RouteStats() for route in routes}
+    tasks = set()
+    dropped: List[Tuple[str, float]] = []
+    scheduled = 0
+
+    async def issue(route: str, intended: float) -> None:
+        sent = time.perf_counter()
+        route_stats = stats[route]
+        try:
+            response = await send(client, route, catalogue, rng)
+        except httpx.HTTPError:
+            route_stats.errors += 1
+            route_stats.latency.record(int((time.perf_counter() - intended) * 1e6))
+            return
+        finished = time.perf_counter()
+        if response is None:
+            return
+        route_stats.statuses[response.status_code] += 1
+        route_stats.latency.record(int((finished - intended) * 1e6))
+        route_stats.service_time.record(int((finished - sent) * 1e6))
+
+    start = time.perf_counter()
+    end = start + duration
+    intended = start
+    while intended < end:
+        delay = intended - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        scheduled += 1
+        route = rng.choices(routes, weights)[0]
+        if len(tasks) >= max_in_flight:
+            dropped.append((route, intended))
+        else:
+            task = asyncio.create_task(issue(route, intended))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+        gap = rng.expovariate(rate) if poisson else 1 / rate
+        intended += gap
+
+    if tasks:
+        await asyncio.gather(*tasks)
+    finished = time.perf_counter()
+    for route, intended in dropped:
+        stats[route].dropped += 1
+        stats[route].latency.record(int((finished - intended) * 1e6))
+    return LoadReport(
+        routes=stats,
+        target_rate=rate,
+        duration=finished - start,
+        scheduled=scheduled,
+        dropped=len(dropped),
+    )
+
+
+def format_report(report: LoadReport) -> str:
+    lines = [
+        f"target {report.target_rate:.0f} req/s for {report.duration:.1f}s, "
+        f"scheduled {report.scheduled}, dropped at max in-flight {report.dropped}",
+        "",
+        "latency from intended send time (coordinated omission corrected; "
+        "dropped requests counted up to the end of the run), ms",
+        f"{'route':<24}{'count':>8}{'req/s':>9}{'2xx':>8}{'4xx':>7}{'503':>7}"
+        f"{'5xx':>6}{'err':>6}{'drop':>6}{'p50':>9}{'p90':>9}{'p99':>9}{'p99.9':>9}{'max':>9}",
+    ]
+    rows = [(route, stats) for route, stats in report.routes.items()]
+    rows.append(("all", report.overall()))
+    for route, stats in rows:
+        statuses = stats.statuses
+        ok = sum(n for code, n in statuses.items() if code < 400)
+        client_errors = sum(n for code, n in statuses.items() if 400 <= code < 500)
+        shed = statuses[503]
+        server_errors = sum(n for code, n in statuses.items() if code >= 500) - shed
+        latency = stats.latency
+        lines.append(
+            f"{route:<24}{latency.count:>8}{latency.count / report.duration:>9.1f}"
+            f"{ok:>8}{client_errors:>7}{shed:>7}{server_errors:>6}{stats.errors:>6}"
+            f"{stats.dropped:>6}"
+            + "".join(
+                f"{latency.percentile(pct) / 1000:>9.2f}" for pct in (50, 90, 99, 99.9)
+            )
+            + f"{latency.max / 1000:>9.2f}"
+        )
+    lines += [
+        "",
+        "service time from actual send (what a closed-loop tool reports), ms",
+        f"{'route':<24}{'p50':>9}{'p99':>9}{'p99.9':>9}",
+    ]
+    for route, stats in rows:
+        lines.append(
+            f"{route:<24}"
+            + "".join(
+                f"{stats.service_time.percentile(pct) / 1000:>9.2f}"
+                for pct in (50, 99, 99.9)
+            )
+        )
+    return "\n".join(lines)
+
+
+def parse_mix(value: str) -> Dict[str, int]:
+    mix = {}
+    for part in value.split(","):
+        route, _, weight = part.partition("=")
+        if route not in DEFAULT_MIX:
+            raise argparse.ArgumentTypeError(f"Unknown route {route!r}")
+        mix[route] = int(weight)
+    return mix
+
+
+async def wait_until_ready(base_url: str, timeout: float = 30.0) -> None:
+    deadline = time.monotonic() + timeout
+    async with httpx.AsyncClient(base_url=base_url) as client:
+        while True:
+            try:
+                await client.get("/api/v1/metrics")
+                return
+            except httpx.TransportError:
+                if time.monotonic() > deadline:
+                    raise
+                await asyncio.sleep(0.2)
+
+
+def spawn_memory_app(port: int) -> subprocess.Popen:
+    env = dict(os.environ, PRODUCT_API_STORAGE="memory")
+    return subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "uvicorn",
+            "src.api.app:app",
+            "--port",
+            str(port),
+            "--log-level",
+            "warning",
+        ],
+        env=env,
+    )
+
+
+async def main(args) -> None:
+    rng = random.Random(args.seed)
+    catalogue = Catalogue(rng, args.invalid_fraction)
+    await wait_until_ready(args.base_url)
+    limits = httpx.Limits(
+        max_connections=args.max_in_flight, max_keepalive_connections=args.max_in_flight
+    )
+    async with httpx.AsyncClient(
+        base_url=args.base_url, limits=limits, timeout=args.timeout
+    ) as client:
+        await seed_catalogue(
+            client, catalogue, args.catalogue, args.verify_fraction, rng
+        )
+        print(
+            f"seeded {len(catalogue.product_ids)} products "
+            f"({args.invalid_fraction:.0%} invalid), seed {args.seed}"
+        )
+        report = await run_load(
+            client,
+            catalogue,
+            args.rate,
+            args.duration,
+            args.mix,
+            rng,
+            args.max_in_flight,
+            args.poisson,
+        )
+    print(format_report(report))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Open-loop load generator for the products API: fixed arrival "
+        "rate, per-route latency percentiles corrected for coordinated omission"
+    )
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--rate", type=float, default=200.0, help="requests/second")
+    parser.add_argument("--duration", type=float, default=30.0, help="seconds")
+    parser.add_argument(
+        "--mix",
+        type=parse_mix,
+        default=DEFAULT_MIX,
+        help="route weights, e.g. get=60,create=20,verify=20",
+    )
+    parser.add_argument("--poisson", action="store_true", help="exponential gaps")
+    parser.add_argument("--catalogue", type=int, default=1000)
+    parser.add_argument("--invalid-fraction", type=float, default=0.2)
+    parser.add_argument("--verify-fraction", type=float, default=0.5)
+    parser.add_argument("--max-in-flight", type=int, default=1000)
+    parser.add_argument("--timeout", type=float, default=30.0)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument(
+        "--spawn-memory-app",
+        action="store_true",
+        help="start the app on --port with the in-memory storage backend",
+    )
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    app_process = None
+    if args.spawn_memory_app:
+        args.base_url = f"http://127.0.0.1:{args.port}"
+        app_process = spawn_memory_app(args.port)
+    try:
+        asyncio.run(main(args))
+    finally:
+        if app_process is not None:
+            app_process.terminate()
+            app_process.wait()
@@ -0,0 +1,137 @@
+import argparse
+import random
+import resource
+import statistics
+import time
+
+from src.application.product_search import ProductSearchIndex
+from src.domain import ProductStatus
+
+BRANDS = [
+    "Apple",
+    "Samsung",
+    "Sony",
+    "Lenovo",
+    "Dell",
+    "Bosch",
+    "Nike",
+    "Adidas",
+    "Lego",
+    "Philips",
+    "Canon",
+    "Nikon",
+    "Garmin",
+    "Logitech",
+    "Anker",
+]
+NOUNS = [
+    "Phone",
+    "Laptop",
+    "Headphones",
+    "Camera",
+    "Watch",
+    "Sneakers",
+    "Drill",
+    "Blender",
+    "Keyboard",
+    "Mouse",
+    "Charger",
+    "Speaker",
+    "Monitor",
+    "Tablet",
+    "Backpack",
+    "Jacket",
+    "Kettle",
+    "Router",
+    "Drone",
+    "Projector",
+]
+ADJECTIVES = [
+    "Pro",
+    "Max",
+    "Mini",
+    "Ultra",
+    "Lite",
+    "Plus",
+    "Air",
+    "Sport",
+    "Classic",
+    "Wireless",
+    "Smart",
+    "Compact",
+    "Deluxe",
+    "Portable",
+]
+CATEGORIES = [
+    "Electronics",
+    "Home & Garden",
+    "Sports",
+    "Fashion",
+    "Toys",
+    "Computers",
+    "Photography",
+    "Audio",
+    "Tools",
+    "Kitchen",
+]
+STATUSES = list(ProductStatus)
+
+QUERIES = {
+    "exact token": ["laptop", "camera", "garmin", "kitchen"],
+    "short prefix": ["la", "ca", "sm", "dr"],
+    "multi token": ["sony camera", "apple phone pro", "nike sneakers sport"],
+    "rare token": ["model9999", "sku123456"],
+}
+
+
+def build(count: int, seed: int) -> ProductSearchIndex:
+    rng = random.Random(seed)
+    index = ProductSearchIndex(max_products=count)
+    for i in range(count):
+        name = (
+            f"{rng.choice(BRANDS)} {rng.choice(NOUNS)} {rng.choice(ADJECTIVES)} "
+            f"model{rng.randrange(10_000)} sku{i}"
+        )
+        index.add(f"p{i}", name, rng.choice(CATEGORIES), rng.choice(STATUSES))
+    return index
+
+
+def percentile(samples, pct: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+def main(args) -> None:
+    started = time.perf_counter()
+    index = build(args.products, args.seed)
+    build_seconds = time.perf_counter() - started
+    rss_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+    print(
+        f"indexed {len(index):,} products in {build_seconds:.1f}s, max RSS {rss_mb:,.0f} MB"
+    )
+    # The first query merges the vocabulary built during bulk load.
+    index.search("warmup")
+
+    print(f"{'query kind':<14}{'status':<10}{'p50 ms':>10}{'p99 ms':>10}{'max ms':>10}")
+    for kind, queries in QUERIES.items():
+        for status in (None, ProductStatus.ACTIVE):
+            samples = []
+            for _ in range(args.iterations):
+                for query in queries:
+                    t0 = time.perf_counter()
+                    index.search(query, status=status, limit=20)
+                    samples.append((time.perf_counter() - t0) * 1000)
+            print(
+                f"{kind:<14}{(status.value if status else 'any'):<10}"
+                f"{statistics.median(samples):>10.2f}{percentile(samples, 99):>10.2f}"
+                f"{max(samples):>10.2f}"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Product search index query latency")
+    parser.add_argument("--products", type=int, default=1_000_000)
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=42)
+    main(parser.parse_args())
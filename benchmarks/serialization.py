@@ -0,0 +1,151 @@
+import argparse
+import statistics
+import time
+from datetime import datetime
+
+from fastapi.responses import JSONResponse
+
+from src.api.schemas import (
+    CatalogueStatsResponse,
+    ProductResponse,
+    ProductSearchResponse,
+    ProductWithVerificationResponse,
+)
+from src.api.serializers import (
+    catalogue_stats_json,
+    product_json,
+    product_with_verification_json,
+    search_results_json,
+)
+from src.application import SearchHit, SearchResults
+from src.domain import Product, ProductStatus
+
+PRODUCT = Product(
+    product_id="01a1540a-4ad1-758a-9196-61ffb3ecc3e4",
+    name="Apple iPhone 15 Pro Max 256GB",
+    price=1199.99,
+    currency="USD",
+    category="Phones",
+    stock_quantity=42,
+    assets=["https://example.com/a.jpg"],
+    status=ProductStatus.ACTIVE,
+    created_at=datetime(2024, 5, 1, 9, 30, 12, 345678),
+    updated_at=datetime(2024, 5, 2, 10, 0, 1, 5),
+)
+VERIFICATION = {
+    "checks": {
+        "name_present": True,
+        "category_present": True,
+        "currency_present": True,
+        "price_valid": True,
+        "stock_quantity_valid": True,
+        "assets_present": True,
+    },
+    "reasons": [],
+    "verified_at": datetime(2024, 5, 2, 10, 0, 1),
+    "policy_version": "1",
+}
+HITS = [
+    SearchHit(f"p{i}", f"Apple product {i}", "Phones", ProductStatus.ACTIVE, 6.0)
+    for i in range(100)
+]
+STATS = {
+    "total_products": 1_000_000,
+    "by_status": {"active": 700_000, "rejected": 200_000, "pending_verification": 1},
+    "by_category": {f"Category {i}": 10_000 for i in range(100)},
+    "by_currency": {"USD": 600_000, "EUR": 400_000},
+    "verifications": {
+        "total": 900_000,
+        "passed": 700_000,
+        "pass_rate": 7 / 9,
+        "top_rejection_reasons": [
+            {"reason": f"reason {i}", "count": 1000 - i} for i in range(10)
+        ],
+    },
+}
+
+
+def product_model(model=ProductResponse, **extra):
+    return model(
+        product_id=PRODUCT.product_id,
+        name=PRODUCT.name,
+        price=PRODUCT.price,
+        currency=PRODUCT.currency,
+        status=PRODUCT.status.value,
+        created_at=PRODUCT.created_at,
+        updated_at=PRODUCT.updated_at,
+        **extra,
+    )
+
+
+def render(model, exclude_unset: bool = False) -> bytes:
+    # The previous response path: model built in the route, validated again
+    # against response_model, dumped to JSON-able values, then json.dumps.
+    validated = type(model).model_validate(model.model_dump())
+    return JSONResponse(
+        validated.model_dump(mode="json", exclude_unset=exclude_unset)
+    ).body
+
+
+ROUTES = {
+    "GET /{id}": (
+        lambda: render(product_model()),
+        lambda: product_json(PRODUCT),
+    ),
+    "GET /{id}?include": (
+        lambda: render(
+            product_model(ProductWithVerificationResponse, verification=VERIFICATION),
+            exclude_unset=True,
+        ),
+        lambda: product_with_verification_json(PRODUCT, VERIFICATION),
+    ),
+    "GET /search (100)": (
+        lambda: render(
+            ProductSearchResponse(
+                results=[
+                    {
+                        "product_id": hit.product_id,
+                        "name": hit.name,
+                        "category": hit.category,
+                        "status": hit.status.value,
+                        "score": hit.score,
+                    }
+                    for hit in HITS
+                ]
+            )
+        ),
+        lambda: search_results_json(SearchResults(HITS)),
+    ),
+    "GET /stats": (
+        lambda: render(CatalogueStatsResponse(**STATS)),
+        lambda: catalogue_stats_json(STATS),
+    ),
+}
+
+
+def measure(function, iterations: int) -> float:
+    samples = []
+    for _ in range(5):
+        started = time.perf_counter()
+        for _ in range(iterations):
+            function()
+        samples.append((time.perf_counter() - started) / iterations * 1e6)
+    return statistics.median(samples)
+
+
+def main(args) -> None:
+    print(f"{'route':<20}{'models us':>12}{'bytes us':>12}{'speedup':>10}")
+    for route, (previous, current) in ROUTES.items():
+        assert previous() == current(), route
+        before = measure(previous, args.iterations)
+        after = measure(current, args.iterations)
+        print(f"{route:<20}{before:>12.2f}{after:>12.2f}{before / after:>9.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Per-route response serialization cost, response models vs "
+        "prebuilt orjson bytes"
+    )
+    parser.add_argument("--iterations", type=int, default=2000)
+    main(parser.parse_args())
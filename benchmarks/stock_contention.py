@@ -0,0 +1,123 @@
+import argparse
+import asyncio
+import time
+
+from sqlalchemy import delete
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
+
+from src.api.app import MYSQL_URL
+from src.domain import Product
+from src.domain.product_id import new_product_id
+from src.infrastructure import (
+    Base,
+    ProductModel,
+    MySQLProductRepository,
+    StockReservationAggregator,
+)
+
+
+async def seed_hot_products(session_factory, count: int, stock: int):
+    products = [
+        Product(
+            product_id=new_product_id(),
+            name=f"Hot product {i}",
+            price=9.99,
+            currency="USD",
+            category="Benchmark",
+            stock_quantity=stock,
+            assets=["image.jpg"],
+        )
+        for i in range(count)
+    ]
+    async with session_factory() as session:
+        repository = MySQLProductRepository(session)
+        for product in products:
+            await repository.save(product)
+        await session.commit()
+    return [product.product_id for product in products]
+
+
+async def direct_reserve(session_factory, product_id: str) -> bool:
+    async with session_factory() as session:
+        reserved = await MySQLProductRepository(session).reserve_stock(product_id, 1)
+        await session.commit()
+        return reserved
+
+
+async def run_mode(
+    session_factory, mode: str, product_ids, workers: int, seconds: float
+):
+    aggregator = (
+        StockReservationAggregator(session_factory) if mode == "aggregated" else None
+    )
+    counts = {product_id: 0 for product_id in product_ids}
+    deadline = time.perf_counter() + seconds
+
+    async def worker(n: int):
+        product_id = product_ids[n % len(product_ids)]
+        while time.perf_counter() < deadline:
+            if aggregator is not None:
+                reserved = await aggregator.reserve_stock(product_id, 1)
+            else:
+                reserved = await direct_reserve(session_factory, product_id)
+            if reserved:
+                counts[product_id] += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker(n) for n in range(workers)))
+    elapsed = time.perf_counter() - started
+    if aggregator is not None:
+        await aggregator.close()
+
+    per_row = [count / elapsed for count in counts.values()]
+    print(
+        f"{mode:<12}{workers:>8}{len(product_ids):>6}"
+        f"{sum(per_row):>14,.0f}{min(per_row):>14,.0f}{max(per_row):>14,.0f}"
+    )
+
+
+async def main(args) -> None:
+    engine = create_async_engine(
+        MYSQL_URL, echo=False, pool_size=args.pool_size, max_overflow=0
+    )
+    session_factory = async_sessionmaker(
+        engine, class_=AsyncSession, expire_on_commit=False
+    )
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    print(
+        f"{'mode':<12}{'workers':>8}{'rows':>6}{'total/s':>14}{'min row/s':>14}{'max row/s':>14}"
+    )
+    try:
+        for mode in args.modes:
+            product_ids = await seed_hot_products(
+                session_factory, args.rows, stock=10_000_000
+            )
+            await run_mode(
+                session_factory, mode, product_ids, args.workers, args.seconds
+            )
+            async with session_factory() as session:
+                await session.execute(
+                    delete(ProductModel).where(ProductModel.id.in_(product_ids))
+                )
+                await session.commit()
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Stock reservations per second per hot row, direct vs aggregated"
+    )
+    parser.add_argument("--rows", type=int, default=3)
+    parser.add_argument("--workers", type=int, default=200)
+    parser.add_argument("--seconds", type=float, default=10.0)
+    parser.add_argument("--pool-size", type=int, default=50)
+    parser.add_argument(
+        "--modes",
+        nargs="+",
+        choices=["direct", "aggregated"],
+        default=["direct", "aggregated"],
+    )
+    asyncio.run(main(parser.parse_args()))
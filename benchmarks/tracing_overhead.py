@@ -0,0 +1,73 @@
+import argparse
+import asyncio
+import time
+
+from src.observability import traced, tracer
+
+
+class CollectingExporter:
+    def __init__(self):
+        self.spans = 0
+
+    def export(self, spans):
+        self.spans += len(spans)
+
+
+@traced("service")
+async def traced_call():
+    pass
+
+
+async def plain_call():
+    pass
+
+
+async def ns_per_call(function, iterations: int) -> float:
+    started = time.perf_counter_ns()
+    for _ in range(iterations):
+        await function()
+    return (time.perf_counter_ns() - started) / iterations
+
+
+async def request(spans: int) -> None:
+    root = tracer.start_trace("GET /api/v1/products/{id}")
+    for _ in range(spans):
+        with tracer.span("repository", {"db.system": "mysql"}):
+            pass
+    tracer.finish_trace(root)
+
+
+async def main(args) -> None:
+    baseline = await ns_per_call(plain_call, args.iterations)
+    untraced = await ns_per_call(traced_call, args.iterations)
+
+    root = tracer.start_trace("benchmark")
+    tracer.configure(max_spans_per_trace=args.iterations + 1)
+    recorded = await ns_per_call(traced_call, args.iterations)
+    tracer.finish_trace(root)
+
+    print(f"{'case':<40}{'ns/call':>10}")
+    print(f"{'plain coroutine':<40}{baseline:>10.0f}")
+    print(f"{'@traced, no active trace':<40}{untraced:>10.0f}")
+    print(f"{'@traced, span recorded':<40}{recorded:>10.0f}")
+
+    print(f"\n{'per request (10 spans)':<28}{'us/request':>12}{'kept':>8}")
+    for label, rate, slow in (
+        ("head 1%, tail 500ms", 0.01, 0.5),
+        ("head 100%", 1.0, None),
+    ):
+        exporter = CollectingExporter()
+        tracer.configure(sample_rate=rate, slow_threshold=slow, exporter=exporter)
+        started = time.perf_counter_ns()
+        for _ in range(args.requests):
+            await request(10)
+        elapsed = (time.perf_counter_ns() - started) / args.requests / 1000
+        print(f"{label:<28}{elapsed:>12.1f}{exporter.spans // 11:>8}")
+    tracer.configure()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Tracing span creation overhead")
+    parser.add_argument("--iterations", type=int, default=200_000)
+    parser.add_argument("--requests", type=int, default=20_000)
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,146 @@
+import argparse
+import asyncio
+import random
+import statistics
+import time
+from datetime import datetime
+
+from src.application import ProductService
+from src.domain import Product, ProductVerificationPolicy
+
+
+class DelayedProducts:
+    # Stands in for MySQL with a fixed round trip plus jitter.
+    def __init__(self, delay: float, jitter: float):
+        self._delay = delay
+        self._jitter = jitter
+        self.products = {}
+
+    async def _round_trip(self) -> None:
+        await asyncio.sleep(self._delay + random.uniform(0, self._jitter))
+
+    async def update(self, product: Product) -> None:
+        await self._round_trip()
+        self.products[product.product_id] = product
+
+    async def find_by_id(self, product_id: str):
+        await self._round_trip()
+        return self.products.get(product_id)
+
+
+class DelayedVerifications:
+    def __init__(self, delay: float, jitter: float):
+        self._delay = delay
+        self._jitter = jitter
+        self.latest = {}
+
+    async def _round_trip(self) -> None:
+        await asyncio.sleep(self._delay + random.uniform(0, self._jitter))
+
+    async def save_verification(self, **record) -> None:
+        await self._round_trip()
+        self.latest[record["product_id"]] = record
+
+    async def find_by_product_id(self, product_id: str):
+        await self._round_trip()
+        return self.latest.get(product_id)
+
+
+def new_product(n: int) -> Product:
+    return Product(
+        product_id=f"p{n}",
+        name=f"Benchmark product {n}",
+        price=9.99,
+        currency="USD",
+        category="Benchmark",
+        stock_quantity=10,
+        assets=["https://example.com/image.jpg"],
+    )
+
+
+async def sequential_verify(service, products, verifications, product) -> None:
+    # The verify path before the writes were overlapped.
+    policy = ProductVerificationPolicy()
+    result = policy.evaluate(
+        name=product.name,
+        category=product.category,
+        currency=product.currency,
+        price=product.price,
+        stock_quantity=product.stock_quantity,
+        assets=product.assets,
+    )
+    product.transition_to_active(policy.version)
+    await verifications.save_verification(
+        product_id=product.product_id,
+        checks=result.checks,
+        reasons=result.reasons,
+        verified_at=datetime.utcnow(),
+        policy_version=policy.version,
+    )
+    await products.update(product)
+
+
+async def concurrent_verify(service, products, verifications, product) -> None:
+    await service.verify_product(product)
+
+
+async def sequential_read(service, products, verifications, product) -> None:
+    await service.get_product(product.product_id)
+    await verifications.find_by_product_id(product.product_id)
+
+
+async def concurrent_read(service, products, verifications, product) -> None:
+    await service.get_product_with_verification(product.product_id)
+
+
+def percentile(samples, pct: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+async def measure(operation, args) -> list:
+    products = DelayedProducts(args.mysql_ms / 1000, args.jitter_ms / 1000)
+    verifications = DelayedVerifications(args.mongo_ms / 1000, args.jitter_ms / 1000)
+    service = ProductService(products, verifications, ProductVerificationPolicy())
+    samples = []
+    for n in range(args.iterations):
+        product = new_product(n)
+        products.products[product.product_id] = product
+        started = time.perf_counter()
+        await operation(service, products, verifications, product)
+        samples.append((time.perf_counter() - started) * 1000)
+    return samples
+
+
+async def main(args) -> None:
+    random.seed(args.seed)
+    print(
+        f"injected delays: mysql {args.mysql_ms} ms, mongo {args.mongo_ms} ms, "
+        f"jitter up to {args.jitter_ms} ms"
+    )
+    print(f"{'path':<22}{'p50 ms':>10}{'p99 ms':>10}{'max ms':>10}")
+    operations = [
+        ("verify sequential", sequential_verify),
+        ("verify concurrent", concurrent_verify),
+        ("read sequential", sequential_read),
+        ("read concurrent", concurrent_read),
+    ]
+    for label, operation in operations:
+        samples = await measure(operation, args)
+        print(
+            f"{label:<22}{statistics.median(samples):>10.2f}"
+            f"{percentile(samples, 99):>10.2f}{max(samples):>10.2f}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Verify and product+verification read latency with injected "
+        "backend delays, sequential vs overlapped I/O"
+    )
+    parser.add_argument("--mysql-ms", type=float, default=8.0)
+    parser.add_argument("--mongo-ms", type=float, default=6.0)
+    parser.add_argument("--jitter-ms", type=float, default=2.0)
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=42)
+    asyncio.run(main(parser.parse_args()))
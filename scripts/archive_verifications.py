@@ -0,0 +1,47 @@
+import argparse
+import asyncio
+from datetime import timedelta
+
+from src.api.app import (
+    MYSQL_URL,
+    MONGO_URL,
+    MONGO_DB,
+    VERIFICATION_ARCHIVE_PATH,
+    VERIFICATION_ARCHIVE_MAX_AGE_DAYS,
+)
+from src.api.container import Container
+
+
+async def main(args) -> None:
+    container = Container(
+        MYSQL_URL,
+        MONGO_URL,
+        MONGO_DB,
+        verification_archive_path=args.archive_path,
+    )
+    try:
+        await container.ensure_verification_indexes()
+        use_case = container.get_archive_verifications_use_case(
+            timedelta(days=args.max_age_days), args.batch_size
+        )
+        state = await use_case.execute()
+    finally:
+        await container.close()
+    print(
+        f"Archived {state['archived']} verification records older than "
+        f"{state['cutoff']:%Y-%m-%d %H:%M} into {state['files']} files, "
+        f"deleted {state['deleted']} from MongoDB"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Move old verification records from MongoDB into compressed "
+        "columnar archive files"
+    )
+    parser.add_argument(
+        "--max-age-days", type=float, default=VERIFICATION_ARCHIVE_MAX_AGE_DAYS
+    )
+    parser.add_argument("--batch-size", type=int, default=10_000)
+    parser.add_argument("--archive-path", default=VERIFICATION_ARCHIVE_PATH)
+    asyncio.run(main(parser.parse_args()))
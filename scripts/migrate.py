@@ -0,0 +1,31 @@
+import argparse
+import asyncio
+
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import NullPool
+
+from src.api.app import MYSQL_URL
+from src.infrastructure.migrations import (
+    migrate_product_ids_to_binary,
+    add_missing_product_columns,
+)
+
+
+async def main(chunk_size: int) -> None:
+    engine = create_async_engine(MYSQL_URL, echo=False, poolclass=NullPool)
+    try:
+        backfilled = await migrate_product_ids_to_binary(engine, chunk_size)
+        added = await add_missing_product_columns(engine)
+    finally:
+        await engine.dispose()
+    print(f"Migrated products.id to BINARY(16), backfilled {backfilled} rows")
+    print(f"Added columns: {', '.join(added) or 'none'}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Bring an existing products table up to the current schema"
+    )
+    parser.add_argument("--chunk-size", type=int, default=10_000)
+    args = parser.parse_args()
+    asyncio.run(main(args.chunk_size))
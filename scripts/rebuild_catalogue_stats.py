@@ -0,0 +1,34 @@
+import argparse
+import asyncio
+
+from src.api.app import MYSQL_URL, MONGO_URL, MONGO_DB, VERIFICATION_ARCHIVE_PATH
+from src.api.container import Container
+
+
+async def main(chunk_size: int) -> None:
+    # Verification counts must include the records already moved out of
+    # Mongo by scripts.archive_verifications.
+    container = Container(
+        MYSQL_URL,
+        MONGO_URL,
+        MONGO_DB,
+        verification_archive_path=VERIFICATION_ARCHIVE_PATH,
+    )
+    try:
+        use_case = container.get_rebuild_catalogue_stats_use_case(chunk_size)
+        stats = await use_case.execute()
+    finally:
+        await container.close()
+    print(
+        f"Rebuilt catalogue stats: {stats['total_products']} products, "
+        f"{stats['verifications']['total']} verifications"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Recompute catalogue stats from MySQL and MongoDB"
+    )
+    parser.add_argument("--chunk-size", type=int, default=1000)
+    args = parser.parse_args()
+    asyncio.run(main(args.chunk_size))
@@ -0,0 +1,56 @@
+import argparse
+import asyncio
+
+from src.api.app import MYSQL_URL, MONGO_URL, MONGO_DB, VERIFICATION_ARCHIVE_PATH
+from src.api.container import Container
+
+
+async def main(args) -> None:
+    container = Container(
+        MYSQL_URL,
+        MONGO_URL,
+        MONGO_DB,
+        verification_archive_path=VERIFICATION_ARCHIVE_PATH,
+    )
+    try:
+        use_case = container.get_reverify_catalogue_use_case(
+            chunk_size=args.chunk_size,
+            workers=args.workers,
+            max_rows_per_second=args.max_rows_per_second,
+            write_duty_cycle=args.write_duty_cycle,
+        )
+        state = await use_case.execute(restart=args.restart)
+        if state["changed"]:
+            # Bumps the stats generation, so running instances adopt the
+            # rebuilt counters at their next checkpoint.
+            await container.get_rebuild_catalogue_stats_use_case().execute()
+    finally:
+        await container.close()
+    print(
+        f"Policy {state['policy_version']}: scanned {state['scanned']}, "
+        f"re-evaluated {state['evaluated']}, status changed {state['changed']}"
+    )
+    if state["changed"]:
+        print(
+            "Catalogue stats rebuilt; restart running instances to refresh "
+            "search status filters"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Re-evaluate verified products against the current policy version"
+    )
+    parser.add_argument("--chunk-size", type=int, default=1000)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--max-rows-per-second", type=float, default=None)
+    parser.add_argument(
+        "--write-duty-cycle",
+        type=float,
+        default=0.5,
+        help="fraction of wall time the sweep may spend writing (0-1)",
+    )
+    parser.add_argument(
+        "--restart", action="store_true", help="ignore the saved checkpoint"
+    )
+    asyncio.run(main(parser.parse_args()))
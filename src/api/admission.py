@@ -0,0 +1,211 @@
+import asyncio
+import json
+import math
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Callable, Deque, Dict, Optional
+
+from src.observability import MetricsRegistry
+
+READ = "read"
+QUERY = "query"
+WRITE = "write"
+VERIFY = "verify"
+
+
+@dataclass
+class AdmissionClass:
+    initial_limit: int
+    max_limit: int
+    target_latency: float
+    queue_timeout: float
+    max_queue: int
+    min_limit: int = 1
+
+
+class AdaptiveLimiter:
+    # AIMD concurrency limit: grows by one per window of fast completions made
+    # while the limit was in use, and shrinks multiplicatively when latency goes over target, so the limit
+    # settles around what the databases can serve without queueing.
+    def __init__(self, config: AdmissionClass, backoff: float = 0.9):
+        self._config = config
+        self._backoff = backoff
+        self.limit = float(config.initial_limit)
+        self.in_flight = 0
+        self._waiters: Deque[asyncio.Future] = deque()
+        self._last_decrease = 0.0
+
+    @property
+    def queued(self) -> int:
+        return len(self._waiters)
+
+    @property
+    def retry_after(self) -> int:
+        return max(1, math.ceil(self._config.queue_timeout))
+
+    def try_acquire(self) -> bool:
+        if self._waiters or self.in_flight >= int(self.limit):
+            return False
+        self.in_flight += 1
+        return True
+
+    async def acquire(self) -> bool:
+        if self.try_acquire():
+            return True
+        if len(self._waiters) >= self._config.max_queue:
+            return False
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await asyncio.wait_for(asyncio.shield(waiter), self._config.queue_timeout)
+            return True
+        except asyncio.TimeoutError:
+            # The slot may have been handed over as the deadline fired.
+            if waiter.done():
+                return True
+            self._waiters.remove(waiter)
+            return False
+        except asyncio.CancelledError:
+            if waiter.done():
+                self.release()
+            else:
+                self._waiters.remove(waiter)
+            raise
+
+    def release(self, latency: Optional[float] = None) -> None:
+        if latency is not None:
+            self._adjust(latency)
+        self.in_flight -= 1
+        while self._waiters and self.in_flight < int(self.limit):
+            waiter = self._waiters.popleft()
+            if waiter.done():
+                continue
+            self.in_flight += 1
+            waiter.set_result(True)
+
+    def _adjust(self, latency: float) -> None:
+        config = self._config
+        if latency <= config.target_latency:
+            # Fast completions under light load say nothing about how much
+            # more concurrency the databases take; growing on them would let
+            # the next burst in at max_limit.
+            if self._waiters or self.in_flight >= int(self.limit):
+                self.limit = min(config.max_limit, self.limit + 1 / self.limit)
+            return
+
+        # One decrease per latency window, otherwise a single slow burst
+        # completing together would collapse the limit to the floor.
+        now = time.monotonic()
+        if now - self._last_decrease < config.target_latency:
+            return
+        self._last_decrease = now
+        self.limit = max(config.min_limit, self.limit * self._backoff)
+
+
+def classify_product_request(method: str, path: str) -> Optional[str]:
+    if not path.startswith("/api/v1/products"):
+        return None
+    if method in ("GET", "HEAD"):
+        # Search, stats and history are CPU or scan heavy; their own class
+        # keeps a flood of them from shrinking the limit for point reads.
+        if path.endswith(("/search", "/stats", "/verifications")):
+            return QUERY
+        return READ
+    if path.endswith("/verify"):
+        return VERIFY
+    return WRITE
+
+
+class AdmissionController:
+    def __init__(
+        self,
+        classes: Dict[str, AdmissionClass],
+        metrics: Optional[MetricsRegistry] = None,
+    ):
+        self._limiters = {
+            name: AdaptiveLimiter(config) for name, config in classes.items()
+        }
+        self._metrics = metrics or MetricsRegistry()
+        for name, limiter in self._limiters.items():
+            self._metrics.register_gauge(
+                f"admission_{name}_limit", lambda limiter=limiter: limiter.limit
+            )
+            self._metrics.register_gauge(
+                f"admission_{name}_in_flight",
+                lambda limiter=limiter: limiter.in_flight,
+            )
+            self._metrics.register_gauge(
+                f"admission_{name}_queued", lambda limiter=limiter: limiter.queued
+            )
+
+    def limiter(self, name: str) -> Optional[AdaptiveLimiter]:
+        return self._limiters.get(name)
+
+    async def admit(self, name: str) -> bool:
+        limiter = self._limiters[name]
+        if limiter.try_acquire():
+            self._metrics.increment(f"admission_{name}_admitted")
+            return True
+
+        self._metrics.increment(f"admission_{name}_queued_total")
+        if await limiter.acquire():
+            self._metrics.increment(f"admission_{name}_admitted")
+            return True
+
+        self._metrics.increment(f"admission_{name}_shed")
+        return False
+
+
+class AdmissionControlMiddleware:
+    # Pure ASGI so shed requests are rejected before routing, dependency
+    # resolution or opening a unit of work.
+    def __init__(
+        self,
+        app,
+        controller: AdmissionController,
+        classify: Callable[[str, str], Optional[str]] = classify_product_request,
+    ):
+        self.app = app
+        self._controller = controller
+        self._classify = classify
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        name = self._classify(scope["method"], scope["path"])
+        limiter = self._controller.limiter(name) if name else None
+        if limiter is None:
+            await self.app(scope, receive, send)
+            return
+
+        if not await self._controller.admit(name):
+            await self._reject(send, limiter.retry_after)
+            return
+
+        started = time.perf_counter()
+        latency = None
+        try:
+            await self.app(scope, receive, send)
+            latency = time.perf_counter() - started
+        finally:
+            limiter.release(latency)
+
+    @staticmethod
+    async def _reject(send, retry_after: int) -> None:
+        body = json.dumps({"detail": "Service overloaded, retry later"}).encode()
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 503,
+                "headers": [
+                    (b"content-type", b"application/json"),
+                    (b"content-length", str(len(body)).encode()),
+                    (b"retry-after", str(retry_after).encode()),
+                ],
+            }
+        )
+        await send({"type": "http.response.body", "body": body})
@@ -0,0 +1,23 @@
+from typing import Optional
+
+PRODUCT_CACHE_CONTROL = "private, no-cache"
+
+
+def product_etag(product_id: str, version: int) -> str:
+    return f'"{product_id}.{version}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    # If-None-Match uses weak comparison (RFC 9110 13.1.2), so a W/ prefix
+    # sent back by an intermediary still matches our strong tag.
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
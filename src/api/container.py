@@ -1,43 +1,378 @@
+import asyncio
+from datetime import timedelta
+from typing import List, Optional
+
+import httpx
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 from motor.motor_asyncio import AsyncIOMotorClient
 
-from src.infrastructure import SQLAlchemyUnitOfWork
-from src.domain.event_dispatcher import InMemoryEventDispatcher
-from src.use_cases import CreateProductUseCase, VerifyProductUseCase, GetProductUseCase
+from src.infrastructure import (
+    SQLAlchemyUnitOfWork,
+    StockReservationAggregator,
+    CircuitBreaker,
+    VerificationSpool,
+    ResilientVerificationRepository,
+    MongoVerificationRepository,
+    InMemoryStore,
+    InMemoryUnitOfWork,
+    UnitOfWork,
+    VerificationArchive,
+    HttpAssetChecker,
+    EventLog,
+    EventLogDispatcher,
+    event_compaction_key,
+)
+from src.application import CatalogueStats, ProductSearchIndex
+from src.domain.event_dispatcher import EventDispatcher, InMemoryEventDispatcher
+from src.observability import MetricsRegistry, instrument_sqlalchemy
+from src.use_cases import (
+    CreateProductUseCase,
+    VerifyProductUseCase,
+    GetProductUseCase,
+    GetProductWithVerificationUseCase,
+    GetProductVersionUseCase,
+    GetCatalogueStatsUseCase,
+    CheckpointCatalogueStatsUseCase,
+    RestoreCatalogueStatsUseCase,
+    RebuildCatalogueStatsUseCase,
+    SearchProductsUseCase,
+    BuildProductSearchIndexUseCase,
+    ReserveStockUseCase,
+    ReleaseStockUseCase,
+    ReverifyCatalogueUseCase,
+    GetMetricsUseCase,
+    ArchiveVerificationsUseCase,
+    GetVerificationHistoryUseCase,
+)
+from src.application.product_service import (
+    VERIFICATION_MEMO_HITS,
+    VERIFICATION_MEMO_MISSES,
+)
 
 
 from sqlalchemy.pool import NullPool
 
+MYSQL_MONGO_BACKEND = "mysql"
+MEMORY_BACKEND = "memory"
+
 
 class Container:
-    def __init__(self, mysql_url: str, mongo_url: str, mongo_db: str):
+    def __init__(
+        self,
+        mysql_url: str,
+        mongo_url: str,
+        mongo_db: str,
+        stats_checkpoint_interval: float = 30.0,
+        search_index_max_products: int = 1_000_000,
+        stock_aggregation: bool = False,
+        stock_aggregation_tick: float = 0.002,
+        metrics: Optional[MetricsRegistry] = None,
+        mongo_operation_timeout: Optional[float] = None,
+        verification_spool_path: Optional[str] = None,
+        verification_breaker_threshold: int = 5,
+        verification_breaker_reset_timeout: float = 10.0,
+        verification_spool_replay_interval: float = 1.0,
+        backend: str = MYSQL_MONGO_BACKEND,
+        verification_archive_path: Optional[str] = None,
+        asset_check: bool = False,
+        asset_check_per_host_limit: int = 4,
+        asset_check_request_timeout: float = 2.0,
+        asset_check_deadline: float = 3.0,
+        asset_check_cache_ttl: float = 3600.0,
+        event_log_path: Optional[str] = None,
+        event_log_segment_bytes: int = 64 * 1024 * 1024,
+        event_log_retention_bytes: Optional[int] = None,
+        event_log_retention_seconds: Optional[float] = None,
+        event_log_compaction: bool = False,
+        event_log_maintenance_interval: float = 60.0,
+    ):
+        if backend not in (MYSQL_MONGO_BACKEND, MEMORY_BACKEND):
+            raise ValueError(f"Unknown storage backend {backend!r}")
+        self._memory_store = InMemoryStore() if backend == MEMORY_BACKEND else None
         self._mysql_engine = create_async_engine(
             mysql_url, echo=False, poolclass=NullPool
         )
+        instrument_sqlalchemy(self._mysql_engine)
         self._session_factory = async_sessionmaker(
             self._mysql_engine, class_=AsyncSession, expire_on_commit=False
         )
-        self._mongo_client = AsyncIOMotorClient(mongo_url)
+        mongo_options = {}
+        if mongo_operation_timeout is not None:
+            timeout_ms = int(mongo_operation_timeout * 1000)
+            mongo_options = {
+                "serverSelectionTimeoutMS": timeout_ms,
+                "connectTimeoutMS": timeout_ms,
+                "socketTimeoutMS": timeout_ms,
+            }
+        self._mongo_client = AsyncIOMotorClient(mongo_url, **mongo_options)
+        self._mongo_operation_timeout = mongo_operation_timeout
         self._mongo_db = mongo_db
-        self._event_dispatcher = InMemoryEventDispatcher()
+        self._event_log = (
+            EventLog(
+                event_log_path,
+                segment_bytes=event_log_segment_bytes,
+                retention_bytes=event_log_retention_bytes,
+                retention_seconds=event_log_retention_seconds,
+            )
+            if event_log_path
+            else None
+        )
+        self._event_log_compaction = event_log_compaction
+        self._metrics = metrics or MetricsRegistry()
+        self._event_log_maintenance_interval = event_log_maintenance_interval
+        self._event_dispatcher: EventDispatcher = (
+            EventLogDispatcher(self._event_log, self._metrics)
+            if self._event_log is not None
+            else InMemoryEventDispatcher()
+        )
+        self._catalogue_stats = CatalogueStats()
+        self._catalogue_stats_restored = False
+        self._event_dispatcher.subscribe(self._catalogue_stats.handle)
+        self._stats_checkpoint_interval = stats_checkpoint_interval
+        self._search_index = ProductSearchIndex(max_products=search_index_max_products)
+        self._event_dispatcher.subscribe(self._search_index.handle)
+        self._stock_aggregator = (
+            StockReservationAggregator(self._session_factory, stock_aggregation_tick)
+            if stock_aggregation and self._memory_store is None
+            else None
+        )
+        self._background_tasks: List[asyncio.Task] = []
+        self._metrics.register_gauge(
+            "verification_memo_hit_rate", self._verification_memo_hit_rate
+        )
+        self._verification_breaker = CircuitBreaker(
+            verification_breaker_threshold, verification_breaker_reset_timeout
+        )
+        self._verification_spool = (
+            VerificationSpool(verification_spool_path)
+            if verification_spool_path and self._memory_store is None
+            else None
+        )
+        self._verification_spool_replay_interval = verification_spool_replay_interval
+        self._verification_archive = (
+            VerificationArchive(verification_archive_path)
+            if verification_archive_path and self._memory_store is None
+            else None
+        )
+        self._asset_check_client = None
+        self._asset_checker = None
+        if asset_check:
+            self._asset_check_client = httpx.AsyncClient(
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+                headers={"User-Agent": "product-verification-asset-check"},
+            )
+            self._asset_checker = HttpAssetChecker(
+                self._asset_check_client,
+                per_host_limit=asset_check_per_host_limit,
+                request_timeout=asset_check_request_timeout,
+                deadline=asset_check_deadline,
+                cache_ttl=asset_check_cache_ttl,
+                metrics=self._metrics,
+            )
+        if self._verification_spool is not None:
+            self._metrics.register_gauge(
+                "verification_breaker_state", self._verification_breaker_state
+            )
+            self._metrics.register_gauge(
+                "verification_spool_pending",
+                lambda: self._verification_spool.pending,
+            )
 
-    def get_uow(self) -> SQLAlchemyUnitOfWork:
+    def get_uow(self) -> UnitOfWork:
+        if self._memory_store is not None:
+            return InMemoryUnitOfWork(self._memory_store)
         return SQLAlchemyUnitOfWork(
-            self._session_factory, self._mongo_client, self._mongo_db
+            self._session_factory,
+            self._mongo_client,
+            self._mongo_db,
+            mongo_timeout=self._mongo_operation_timeout,
+            verification_breaker=self._verification_breaker,
+            verification_spool=self._verification_spool,
+            metrics=self._metrics,
+            verification_archive=self._verification_archive,
         )
 
-    def get_event_dispatcher(self) -> InMemoryEventDispatcher:
+    def get_event_dispatcher(self) -> EventDispatcher:
         return self._event_dispatcher
 
     def get_create_product_use_case(self) -> CreateProductUseCase:
         return CreateProductUseCase(self.get_uow(), self.get_event_dispatcher())
 
     def get_verify_product_use_case(self) -> VerifyProductUseCase:
-        return VerifyProductUseCase(self.get_uow(), self.get_event_dispatcher())
+        return VerifyProductUseCase(
+            self.get_uow(),
+            self.get_event_dispatcher(),
+            self._metrics,
+            self._asset_checker,
+        )
 
     def get_get_product_use_case(self) -> GetProductUseCase:
         return GetProductUseCase(self.get_uow())
 
+    def get_get_product_with_verification_use_case(
+        self,
+    ) -> GetProductWithVerificationUseCase:
+        return GetProductWithVerificationUseCase(self.get_uow(), self._metrics)
+
+    def get_get_product_version_use_case(self) -> GetProductVersionUseCase:
+        return GetProductVersionUseCase(self.get_uow())
+
+    def get_get_catalogue_stats_use_case(self) -> GetCatalogueStatsUseCase:
+        return GetCatalogueStatsUseCase(self._catalogue_stats)
+
+    def get_checkpoint_catalogue_stats_use_case(
+        self,
+    ) -> CheckpointCatalogueStatsUseCase:
+        return CheckpointCatalogueStatsUseCase(self.get_uow(), self._catalogue_stats)
+
+    def get_restore_catalogue_stats_use_case(self) -> RestoreCatalogueStatsUseCase:
+        return RestoreCatalogueStatsUseCase(self.get_uow(), self._catalogue_stats)
+
+    def get_rebuild_catalogue_stats_use_case(
+        self, chunk_size: int = 1000
+    ) -> RebuildCatalogueStatsUseCase:
+        return RebuildCatalogueStatsUseCase(
+            self.get_uow(), self._catalogue_stats, chunk_size
+        )
+
+    def get_search_products_use_case(self) -> SearchProductsUseCase:
+        return SearchProductsUseCase(self._search_index)
+
+    def get_build_product_search_index_use_case(
+        self,
+    ) -> BuildProductSearchIndexUseCase:
+        return BuildProductSearchIndexUseCase(self.get_uow(), self._search_index)
+
+    def get_reserve_stock_use_case(self) -> ReserveStockUseCase:
+        return ReserveStockUseCase(self.get_uow(), self._stock_aggregator)
+
+    def get_release_stock_use_case(self) -> ReleaseStockUseCase:
+        return ReleaseStockUseCase(self.get_uow(), self._stock_aggregator)
+
+    def get_reverify_catalogue_use_case(self, **options) -> ReverifyCatalogueUseCase:
+        return ReverifyCatalogueUseCase(
+            self.get_uow(), self.get_event_dispatcher(), **options
+        )
+
+    def get_get_metrics_use_case(self) -> GetMetricsUseCase:
+        return GetMetricsUseCase(self._metrics)
+
+    def get_get_verification_history_use_case(self) -> GetVerificationHistoryUseCase:
+        return GetVerificationHistoryUseCase(self.get_uow())
+
+    def get_archive_verifications_use_case(
+        self, max_age: timedelta, batch_size: int = 10_000
+    ) -> ArchiveVerificationsUseCase:
+        if self._verification_archive is None:
+            raise ValueError("No verification archive configured")
+        return ArchiveVerificationsUseCase(
+            self.get_uow(), self._verification_archive, max_age, batch_size
+        )
+
+    async def ensure_verification_indexes(self):
+        await MongoVerificationRepository(
+            self._mongo_client, self._mongo_db
+        ).ensure_indexes()
+
+    def _verification_memo_hit_rate(self) -> float:
+        hits = self._metrics.counter(VERIFICATION_MEMO_HITS)
+        total = hits + self._metrics.counter(VERIFICATION_MEMO_MISSES)
+        return hits / total if total else 0.0
+
+    def _verification_breaker_state(self) -> float:
+        states = {CircuitBreaker.CLOSED: 0, CircuitBreaker.HALF_OPEN: 1}
+        return states.get(self._verification_breaker.state, 2)
+
+    async def start(self):
+        await self.get_restore_catalogue_stats_use_case().execute()
+        self._catalogue_stats_restored = True
+        self._background_tasks.append(
+            asyncio.create_task(self._checkpoint_catalogue_stats_periodically())
+        )
+        self._background_tasks.append(asyncio.create_task(self._build_search_index()))
+        if self._verification_spool is not None:
+            self._background_tasks.append(
+                asyncio.create_task(self._replay_verification_spool_periodically())
+            )
+        if self._event_log is not None:
+            self._background_tasks.append(
+                asyncio.create_task(self._maintain_event_log_periodically())
+            )
+
+    async def _build_search_index(self):
+        try:
+            indexed = await self.get_build_product_search_index_use_case().execute()
+            print(f"[SEARCH INDEX BUILT] {indexed} products")
+        except Exception as e:
+            print(f"[SEARCH INDEX BUILD FAILED] {e!r}")
+
+    async def _checkpoint_catalogue_stats_periodically(self):
+        # Single worker only: the checkpoint holds this process's counters.
+        while True:
+            await asyncio.sleep(self._stats_checkpoint_interval)
+            try:
+                await self.get_checkpoint_catalogue_stats_use_case().execute()
+            except Exception as e:
+                print(f"[STATS CHECKPOINT FAILED] {e!r}")
+
+    async def _replay_verification_spool_periodically(self):
+        repository = ResilientVerificationRepository(
+            MongoVerificationRepository(
+                self._mongo_client, self._mongo_db, self._mongo_operation_timeout
+            ),
+            self._verification_breaker,
+            self._verification_spool,
+            self._metrics,
+        )
+        while True:
+            await asyncio.sleep(self._verification_spool_replay_interval)
+            try:
+                replayed = await repository.replay_spool()
+                if replayed:
+                    print(f"[VERIFICATION SPOOL REPLAYED] {replayed} records")
+            except Exception as e:
+                print(f"[VERIFICATION SPOOL REPLAY FAILED] {e!r}")
+
+    async def _maintain_event_log_periodically(self):
+        while True:
+            await asyncio.sleep(self._event_log_maintenance_interval)
+            try:
+                if self._event_log_compaction:
+                    await asyncio.to_thread(
+                        self._event_log.compact, event_compaction_key
+                    )
+                removed = await asyncio.to_thread(self._event_log.apply_retention)
+                if removed:
+                    print(f"[EVENT LOG RETENTION] removed {removed} segments")
+            except Exception as e:
+                print(f"[EVENT LOG MAINTENANCE FAILED] {e!r}")
+
     async def close(self):
+        for task in self._background_tasks:
+            task.cancel()
+        await asyncio.gather(*self._background_tasks, return_exceptions=True)
+        self._background_tasks.clear()
+
+        if self._stock_aggregator is not None:
+            await self._stock_aggregator.close()
+
+        # Counters never restored from the checkpoint (scripts that do not
+        # call start()) only hold this process's deltas; saving them would
+        # replace the real totals.
+        if self._catalogue_stats_restored and self._catalogue_stats.dirty:
+            try:
+                await self.get_checkpoint_catalogue_stats_use_case().execute()
+            except Exception as e:
+                print(f"[STATS CHECKPOINT FAILED] {e!r}")
+
+        if self._verification_archive is not None:
+            self._verification_archive.close()
+
+        if self._asset_check_client is not None:
+            await self._asset_check_client.aclose()
+
+        if self._event_log is not None:
+            await self._event_log.close()
+
         await self._mysql_engine.dispose()
         self._mongo_client.close()
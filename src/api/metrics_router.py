@@ -0,0 +1,15 @@
+from fastapi import APIRouter, Depends
+
+from src.api.schemas import MetricsResponse
+from src.api.container import Container
+from src.api.router import get_container
+from src.use_cases import GetMetricsUseCase
+
+router = APIRouter(prefix="/api/v1/metrics", tags=["metrics"])
+
+
+@router.get("", response_model=MetricsResponse)
+async def get_metrics(container: Container = Depends(get_container)):
+    use_case: GetMetricsUseCase = container.get_get_metrics_use_case()
+
+    return MetricsResponse(**await use_case.execute())
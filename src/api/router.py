@@ -1,8 +1,45 @@
-from fastapi import APIRouter, HTTPException, Depends, Request
-
-from src.api.schemas import CreateProductRequest, ProductResponse, VerifyProductResponse
+from datetime import datetime
+from typing import Optional
+
+from fastapi import APIRouter, HTTPException, Depends, Request, Response, Header, Query
+
+from src.api.schemas import (
+    CreateProductRequest,
+    ProductResponse,
+    ProductWithVerificationResponse,
+    VerifyProductResponse,
+    CatalogueStatsResponse,
+    ProductSearchResponse,
+    StockReservationRequest,
+    StockReservationResponse,
+    VerificationHistoryResponse,
+)
 from src.api.container import Container
-from src.use_cases import CreateProductUseCase, VerifyProductUseCase, GetProductUseCase
+from src.domain import ProductStatus, InsufficientStockError
+from src.domain.repositories import VerificationStoreUnavailableError
+from src.api.caching import PRODUCT_CACHE_CONTROL, product_etag, etag_matches
+from src.api.serializers import (
+    JSONBytesResponse,
+    product_json,
+    product_with_verification_json,
+    verify_result_json,
+    stock_reservation_json,
+    catalogue_stats_json,
+    search_results_json,
+    verification_history_json,
+)
+from src.use_cases import (
+    CreateProductUseCase,
+    VerifyProductUseCase,
+    GetProductUseCase,
+    GetProductWithVerificationUseCase,
+    GetProductVersionUseCase,
+    GetCatalogueStatsUseCase,
+    SearchProductsUseCase,
+    ReserveStockUseCase,
+    ReleaseStockUseCase,
+    GetVerificationHistoryUseCase,
+)
 
 router = APIRouter(prefix="/api/v1/products", tags=["products"])
 
@@ -13,9 +50,9 @@ def get_container(request: Request) -> Container:
         return request.app.state.container
 
     # Fallback to creating a new container for this request (for tests/environments where lifespan didn't run)
-    from src.api.app import MYSQL_URL, MONGO_URL, MONGO_DB
+    from src.api.app import MYSQL_URL, MONGO_URL, MONGO_DB, metrics
 
-    return Container(MYSQL_URL, MONGO_URL, MONGO_DB)
+    return Container(MYSQL_URL, MONGO_URL, MONGO_DB, metrics=metrics)
 
 
 @router.post("", response_model=ProductResponse, status_code=201)
@@ -33,15 +70,7 @@ async def create_product(
         assets=request.assets,
     )
 
-    return ProductResponse(
-        product_id=product.product_id,
-        name=product.name,
-        price=product.price,
-        currency=product.currency,
-        status=product.status.value,
-        created_at=product.created_at,
-        updated_at=product.updated_at,
-    )
+    return JSONBytesResponse(product_json(product), status_code=201)
 
 
 @router.post("/{product_id}/verify", response_model=VerifyProductResponse)
@@ -59,28 +88,151 @@ async def verify_product(
             else "Product verification failed"
         )
 
-        return VerifyProductResponse(
-            product_id=product.product_id, status=product.status.value, message=message
+        return JSONBytesResponse(verify_result_json(product, message))
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+
+
+@router.post(
+    "/{product_id}/stock/reserve",
+    response_model=StockReservationResponse,
+    responses={409: {"description": "Insufficient stock"}},
+)
+async def reserve_stock(
+    product_id: str,
+    request: StockReservationRequest,
+    container: Container = Depends(get_container),
+):
+    use_case: ReserveStockUseCase = container.get_reserve_stock_use_case()
+
+    try:
+        await use_case.execute(product_id, request.quantity)
+
+        return JSONBytesResponse(
+            stock_reservation_json(product_id, request.quantity, "Stock reserved")
+        )
+    except InsufficientStockError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+
+
+@router.post(
+    "/{product_id}/stock/release",
+    response_model=StockReservationResponse,
+    responses={409: {"description": "More than the reserved quantity"}},
+)
+async def release_stock(
+    product_id: str,
+    request: StockReservationRequest,
+    container: Container = Depends(get_container),
+):
+    use_case: ReleaseStockUseCase = container.get_release_stock_use_case()
+
+    try:
+        await use_case.execute(product_id, request.quantity)
+
+        return JSONBytesResponse(
+            stock_reservation_json(product_id, request.quantity, "Stock released")
         )
+    except InsufficientStockError as e:
+        raise HTTPException(status_code=409, detail=str(e))
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
 
 
-@router.get("/{product_id}", response_model=ProductResponse)
-async def get_product(product_id: str, container: Container = Depends(get_container)):
-    use_case: GetProductUseCase = container.get_get_product_use_case()
+@router.get("/{product_id}/verifications", response_model=VerificationHistoryResponse)
+async def get_verification_history(
+    product_id: str,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+    limit: int = Query(50, ge=1, le=1000),
+    container: Container = Depends(get_container),
+):
+    use_case: GetVerificationHistoryUseCase = (
+        container.get_get_verification_history_use_case()
+    )
+    try:
+        verifications = await use_case.execute(product_id, since, until, limit)
+    except VerificationStoreUnavailableError as e:
+        raise HTTPException(status_code=503, detail=str(e))
+
+    return JSONBytesResponse(verification_history_json(product_id, verifications))
+
 
+@router.get("/stats", response_model=CatalogueStatsResponse)
+async def get_catalogue_stats(container: Container = Depends(get_container)):
+    use_case: GetCatalogueStatsUseCase = container.get_get_catalogue_stats_use_case()
+
+    stats = await use_case.execute()
+
+    return JSONBytesResponse(catalogue_stats_json(stats))
+
+
+@router.get("/search", response_model=ProductSearchResponse)
+async def search_products(
+    q: str = Query(..., min_length=1),
+    status: Optional[ProductStatus] = None,
+    limit: int = Query(20, ge=1, le=100),
+    container: Container = Depends(get_container),
+):
+    use_case: SearchProductsUseCase = container.get_search_products_use_case()
+
+    results = await use_case.execute(q, status=status, limit=limit)
+
+    return JSONBytesResponse(search_results_json(results))
+
+
+@router.get(
+    "/{product_id}",
+    response_model=ProductWithVerificationResponse,
+    responses={304: {"description": "Not Modified"}},
+)
+async def get_product(
+    product_id: str,
+    include: Optional[str] = Query(None, pattern="^verification$"),
+    if_none_match: Optional[str] = Header(None),
+    container: Container = Depends(get_container),
+):
     try:
+        if include == "verification":
+            return await _get_product_with_verification(product_id, container)
+
+        if if_none_match:
+            version_use_case: GetProductVersionUseCase = (
+                container.get_get_product_version_use_case()
+            )
+            version = await version_use_case.execute(product_id)
+            etag = product_etag(product_id, version)
+
+            if etag_matches(if_none_match, etag):
+                return Response(
+                    status_code=304,
+                    headers={"ETag": etag, "Cache-Control": PRODUCT_CACHE_CONTROL},
+                )
+
+        use_case: GetProductUseCase = container.get_get_product_use_case()
         product = await use_case.execute(product_id)
 
-        return ProductResponse(
-            product_id=product.product_id,
-            name=product.name,
-            price=product.price,
-            currency=product.currency,
-            status=product.status.value,
-            created_at=product.created_at,
-            updated_at=product.updated_at,
+        return JSONBytesResponse(
+            product_json(product),
+            headers={
+                "ETag": product_etag(product.product_id, product.version),
+                "Cache-Control": PRODUCT_CACHE_CONTROL,
+            },
         )
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
+
+
+async def _get_product_with_verification(
+    product_id: str, container: Container
+) -> JSONBytesResponse:
+    # No ETag here: spooled verification records can reach Mongo later
+    # without a product version change.
+    use_case: GetProductWithVerificationUseCase = (
+        container.get_get_product_with_verification_use_case()
+    )
+    product, verification = await use_case.execute(product_id)
+
+    return JSONBytesResponse(product_with_verification_json(product, verification))
@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field
-from typing import List
+from typing import Dict, List, Optional
 from datetime import datetime
 
 
@@ -22,7 +22,71 @@ class ProductResponse(BaseModel):
     updated_at: datetime
 
 
+class VerificationResponse(BaseModel):
+    checks: Dict[str, bool]
+    reasons: List[str]
+    verified_at: datetime
+    policy_version: Optional[str] = None
+
+
+class ProductWithVerificationResponse(ProductResponse):
+    verification: Optional[VerificationResponse] = None
+
+
+class VerificationHistoryResponse(BaseModel):
+    product_id: str
+    verifications: List[VerificationResponse]
+
+
 class VerifyProductResponse(BaseModel):
     product_id: str
     status: str
     message: str
+
+
+class RejectionReasonCount(BaseModel):
+    reason: str
+    count: int
+
+
+class VerificationStatsResponse(BaseModel):
+    total: int
+    passed: int
+    pass_rate: float
+    top_rejection_reasons: List[RejectionReasonCount]
+
+
+class CatalogueStatsResponse(BaseModel):
+    total_products: int
+    by_status: Dict[str, int]
+    by_category: Dict[str, int]
+    by_currency: Dict[str, int]
+    verifications: VerificationStatsResponse
+
+
+class ProductSearchHit(BaseModel):
+    product_id: str
+    name: str
+    category: str
+    status: str
+    score: float
+
+
+class ProductSearchResponse(BaseModel):
+    results: List[ProductSearchHit]
+    truncated: bool = False
+
+
+class StockReservationRequest(BaseModel):
+    quantity: int = Field(..., gt=0)
+
+
+class StockReservationResponse(BaseModel):
+    product_id: str
+    quantity: int
+    message: str
+
+
+class MetricsResponse(BaseModel):
+    counters: Dict[str, float]
+    gauges: Dict[str, float]
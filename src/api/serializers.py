@@ -0,0 +1,128 @@
+import json
+from datetime import datetime
+from typing import Any, Iterable, List, Optional
+
+import orjson
+from fastapi.responses import Response
+
+from src.application import SearchResults
+from src.domain import Product
+
+# Routes return prebuilt JSON bytes straight from domain objects, skipping
+# response model validation and the stdlib encoder. The output is byte for
+# byte what the pydantic response models produced.
+
+
+class JSONBytesResponse(Response):
+    media_type = "application/json"
+
+
+def _orjson_float_matches(value: float) -> bool:
+    # orjson and the stdlib only format floats differently in exponent form
+    # ("1e16" vs "1e+16"), and the stdlib rejects NaN/inf where orjson writes
+    # null. Those values take the stdlib path to keep the output unchanged.
+    return value == 0 or 1e-4 <= abs(value) < 1e16
+
+
+def _isoformat(value: Any) -> str:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"Cannot serialize {type(value).__name__}")
+
+
+def _dumps(content: Any, floats: Iterable[float] = ()) -> bytes:
+    if all(_orjson_float_matches(value) for value in floats):
+        return orjson.dumps(content)
+    return json.dumps(
+        content,
+        ensure_ascii=False,
+        allow_nan=False,
+        separators=(",", ":"),
+        default=_isoformat,
+    ).encode("utf-8")
+
+
+def _product_fields(product: Product) -> dict:
+    return {
+        "product_id": product.product_id,
+        "name": product.name,
+        "price": float(product.price),
+        "currency": product.currency,
+        "status": product.status.value,
+        "created_at": product.created_at,
+        "updated_at": product.updated_at,
+    }
+
+
+def product_json(product: Product) -> bytes:
+    content = _product_fields(product)
+    return _dumps(content, (content["price"],))
+
+
+def _verification_fields(verification: dict) -> dict:
+    fields = {
+        "checks": {key: bool(value) for key, value in verification["checks"].items()},
+        "reasons": list(verification["reasons"]),
+        "verified_at": verification["verified_at"],
+    }
+    if "policy_version" in verification:
+        fields["policy_version"] = verification["policy_version"]
+    return fields
+
+
+def product_with_verification_json(
+    product: Product, verification: Optional[dict]
+) -> bytes:
+    content = _product_fields(product)
+    content["verification"] = None
+    if verification:
+        content["verification"] = _verification_fields(verification)
+    return _dumps(content, (content["price"],))
+
+
+def verification_history_json(product_id: str, verifications: List[dict]) -> bytes:
+    return orjson.dumps(
+        {
+            "product_id": product_id,
+            "verifications": [
+                _verification_fields(verification) for verification in verifications
+            ],
+        }
+    )
+
+
+def verify_result_json(product: Product, message: str) -> bytes:
+    return orjson.dumps(
+        {
+            "product_id": product.product_id,
+            "status": product.status.value,
+            "message": message,
+        }
+    )
+
+
+def stock_reservation_json(product_id: str, quantity: int, message: str) -> bytes:
+    return orjson.dumps(
+        {"product_id": product_id, "quantity": quantity, "message": message}
+    )
+
+
+def catalogue_stats_json(stats: dict) -> bytes:
+    return _dumps(stats, (stats["verifications"]["pass_rate"],))
+
+
+def search_results_json(search: SearchResults) -> bytes:
+    results = [
+        {
+            "product_id": hit.product_id,
+            "name": hit.name,
+            "category": hit.category,
+            "status": hit.status.value,
+            "score": float(hit.score),
+        }
+        for hit in search.hits
+    ]
+    return _dumps(
+        {"results": results, "truncated": search.truncated},
+        (result["score"] for result in results),
+    )
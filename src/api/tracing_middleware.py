@@ -0,0 +1,48 @@
+from src.observability import Tracer
+
+
+class TracingMiddleware:
+    # Outermost middleware: continues the caller's W3C traceparent (or starts
+    # a new trace), records the request as the root server span and returns
+    # the trace context in the response's traceparent header.
+    def __init__(self, app, tracer: Tracer):
+        self.app = app
+        self._tracer = tracer
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        headers = dict(scope["headers"])
+        traceparent = headers.get(b"traceparent")
+        root = self._tracer.start_trace(
+            f"{scope['method']} {scope['path']}",
+            traceparent.decode("latin-1") if traceparent else None,
+            {"http.method": scope["method"], "http.target": scope["path"]},
+        )
+
+        async def send_with_trace(message):
+            if message["type"] == "http.response.start":
+                root.set_attribute("http.status_code", message["status"])
+                message["headers"] = [
+                    *message.get("headers", []),
+                    (b"traceparent", self._tracer.traceparent(root).encode()),
+                ]
+            await send(message)
+
+        error = None
+        try:
+            await self.app(scope, receive, send_with_trace)
+        except Exception as e:
+            error = e
+            raise
+        finally:
+            # Name the span after the matched route rather than the raw path
+            # so traces group by endpoint.
+            endpoint = scope.get("endpoint")
+            if endpoint is not None:
+                root.name = f"{scope['method']} {endpoint.__name__}"
+            if error is None and root.attributes.get("http.status_code", 200) >= 500:
+                error = RuntimeError(f"HTTP {root.attributes['http.status_code']}")
+            self._tracer.finish_trace(root, error)
@@ -1,3 +1,11 @@
 from .product_service import ProductService
+from .catalogue_stats import CatalogueStats
+from .product_search import ProductSearchIndex, SearchHit, SearchResults
 
-__all__ = ["ProductService"]
+__all__ = [
+    "ProductService",
+    "CatalogueStats",
+    "ProductSearchIndex",
+    "SearchHit",
+    "SearchResults",
+]
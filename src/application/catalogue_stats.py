@@ -0,0 +1,143 @@
+import uuid
+from collections import Counter
+from typing import Iterable, List, Optional
+
+from src.domain import (
+    DomainEvent,
+    ProductStatus,
+    ProductCreatedPendingVerification,
+    ProductVerificationCompleted,
+)
+
+CATALOGUE_STATS_CHECKPOINT = "catalogue_stats"
+
+
+class CatalogueStats:
+    def __init__(self, top_reasons_limit: int = 10):
+        self._top_reasons_limit = top_reasons_limit
+        self._by_status: Counter = Counter()
+        self._by_category: Counter = Counter()
+        self._by_currency: Counter = Counter()
+        self._verifications = 0
+        self._verifications_passed = 0
+        self._rejection_reasons: Counter = Counter()
+        self._snapshot: Optional[dict] = None
+        self._changes = 0
+        self._saved_changes = 0
+        self.generation = 0
+        # Identifies this process's checkpoints; last_writer is the writer of
+        # the checkpoint this instance last restored or saved.
+        self.writer = uuid.uuid4().hex
+        self._last_writer: Optional[str] = None
+
+    async def handle(self, event: DomainEvent) -> None:
+        if isinstance(event, ProductCreatedPendingVerification):
+            self.record_product(
+                ProductStatus.PENDING_VERIFICATION, event.category, event.currency
+            )
+        elif isinstance(event, ProductVerificationCompleted):
+            self.record_status_change(event.previous_status, event.status)
+            self.record_verification(
+                event.status == ProductStatus.ACTIVE, event.reasons
+            )
+
+    def record_product(
+        self, status: ProductStatus, category: str, currency: str
+    ) -> None:
+        self._by_status[ProductStatus(status).value] += 1
+        self._by_category[category] += 1
+        self._by_currency[currency] += 1
+        self._changed()
+
+    def record_status_change(
+        self, previous_status: ProductStatus, status: ProductStatus
+    ) -> None:
+        if previous_status == status:
+            return
+        self._by_status[ProductStatus(previous_status).value] -= 1
+        self._by_status[ProductStatus(status).value] += 1
+        self._changed()
+
+    def record_verification(self, passed: bool, reasons: Iterable[str]) -> None:
+        self._verifications += 1
+        if passed:
+            self._verifications_passed += 1
+        self._rejection_reasons.update(reasons)
+        self._changed()
+
+    def snapshot(self) -> dict:
+        # Cached between changes so the stats endpoint is O(1) per request.
+        if self._snapshot is None:
+            total = self._verifications
+            self._snapshot = {
+                "total_products": sum(self._positive(self._by_status).values()),
+                "by_status": self._positive(self._by_status),
+                "by_category": self._positive(self._by_category),
+                "by_currency": self._positive(self._by_currency),
+                "verifications": {
+                    "total": total,
+                    "passed": self._verifications_passed,
+                    "pass_rate": self._verifications_passed / total if total else 0.0,
+                    "top_rejection_reasons": [
+                        {"reason": reason, "count": count}
+                        for reason, count in self._rejection_reasons.most_common(
+                            self._top_reasons_limit
+                        )
+                    ],
+                },
+            }
+        return self._snapshot
+
+    @property
+    def dirty(self) -> bool:
+        return self._changes != self._saved_changes
+
+    @property
+    def changes(self) -> int:
+        return self._changes
+
+    @property
+    def last_writer(self) -> Optional[str]:
+        return self._last_writer
+
+    def mark_saved(self, changes: int) -> None:
+        self._saved_changes = changes
+        self._last_writer = self.writer
+
+    def to_state(self) -> dict:
+        # Counter keys are stored as [key, count] pairs because categories are
+        # free text and may contain characters Mongo rejects in field names.
+        return {
+            "generation": self.generation,
+            "writer": self.writer,
+            "by_status": self._pairs(self._by_status),
+            "by_category": self._pairs(self._by_category),
+            "by_currency": self._pairs(self._by_currency),
+            "verifications": self._verifications,
+            "verifications_passed": self._verifications_passed,
+            "rejection_reasons": self._pairs(self._rejection_reasons),
+        }
+
+    def restore(self, state: dict) -> None:
+        self.generation = state.get("generation", 0)
+        self._last_writer = state.get("writer")
+        self._by_status = Counter(dict(state.get("by_status", [])))
+        self._by_category = Counter(dict(state.get("by_category", [])))
+        self._by_currency = Counter(dict(state.get("by_currency", [])))
+        self._verifications = state.get("verifications", 0)
+        self._verifications_passed = state.get("verifications_passed", 0)
+        self._rejection_reasons = Counter(dict(state.get("rejection_reasons", [])))
+        self._snapshot = None
+        self._saved_changes = self._changes
+
+    def _changed(self) -> None:
+        self._snapshot = None
+        self._changes += 1
+
+    @staticmethod
+    def _positive(counter: Counter) -> dict:
+        return {key: count for key, count in counter.items() if count > 0}
+
+    @staticmethod
+    def _pairs(counter: Counter) -> List[list]:
+        return [[key, count] for key, count in counter.items() if count]
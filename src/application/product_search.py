@@ -0,0 +1,483 @@
+import heapq
+import itertools
+import re
+from bisect import bisect_left
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Set, Tuple, Union
+
+from src.domain import (
+    DomainEvent,
+    ProductStatus,
+    ProductCreatedPendingVerification,
+    ProductVerificationCompleted,
+)
+
+_TOKEN_PATTERN = re.compile(r"\w+", re.UNICODE)
+
+NAME_EXACT_SCORE = 4.0
+NAME_PREFIX_SCORE = 2.0
+CATEGORY_EXACT_SCORE = 2.0
+CATEGORY_PREFIX_SCORE = 1.0
+
+# Candidate sets up to this size are scored one by one; larger ones are ranked
+# tier by tier, walking products in tie-break order so common tokens stay
+# cheap.
+_SCORE_ALL_LIMIT = 5000
+_MAX_TIERED_TOKENS = 4
+# Multi-token tiers whose rarest token matches up to this many products are
+# intersected directly; beyond it products are walked in tie-break order.
+_MATERIALISE_LIMIT = 250_000
+# Searches run on the event loop, so the set probes one query may spend on
+# the tiered ranking are capped; past it the results are flagged truncated.
+_MAX_QUERY_WORK = 500_000
+
+# A token seen in a single product is posted as the bare id instead of a set,
+# which is most of the vocabulary for SKU-like names.
+_Posting = Union[str, Set[str]]
+# A score and the postings of the terms that give it; tiers of a token may
+# overlap, and a product counts at its best tier.
+_Tier = Tuple[float, List[_Posting]]
+
+
+def _size(posting: _Posting) -> int:
+    return 1 if isinstance(posting, str) else len(posting)
+
+
+def _union(postings: List[_Posting]) -> Set[str]:
+    ids: Set[str] = set()
+    for posting in postings:
+        if isinstance(posting, str):
+            ids.add(posting)
+        else:
+            ids.update(posting)
+    return ids
+
+
+def _within(postings: List[_Posting], group: Set[str]) -> Set[str]:
+    # The ids of group in any of postings; set & set iterates the smaller.
+    ids: Set[str] = set()
+    for posting in postings:
+        if isinstance(posting, str):
+            if posting in group:
+                ids.add(posting)
+        else:
+            ids |= posting & group
+    return ids
+
+
+def tokenize(text: str) -> List[str]:
+    return _TOKEN_PATTERN.findall(text.lower()) if text else []
+
+
+@dataclass
+class SearchHit:
+    product_id: str
+    name: str
+    category: str
+    status: ProductStatus
+    score: float
+
+
+@dataclass
+class SearchResults:
+    hits: List[SearchHit]
+    # Set when a query token is a prefix of more than max_prefix_expansions
+    # indexed terms; only the first ones (in sort order) were searched.
+    truncated: bool = False
+
+
+class _IndexedProduct:
+    __slots__ = ("name", "category", "status", "name_tokens", "category_tokens")
+
+    def __init__(self, name: str, category: str, status: ProductStatus):
+        self.name = name
+        self.category = category
+        self.status = status
+        self.name_tokens = tuple(dict.fromkeys(tokenize(name)))
+        self.category_tokens = tuple(dict.fromkeys(tokenize(category)))
+
+
+class ProductSearchIndex:
+    def __init__(self, max_products: int = 1_000_000, max_prefix_expansions: int = 64):
+        self._max_products = max_products
+        self._max_prefix_expansions = max_prefix_expansions
+        # Insertion ordered so the oldest products are evicted first once
+        # max_products is reached, keeping memory bounded.
+        self._products: "OrderedDict[str, _IndexedProduct]" = OrderedDict()
+        self._name_postings: Dict[str, _Posting] = {}
+        self._category_postings: Dict[str, _Posting] = {}
+        self._status_ids: Dict[ProductStatus, Set[str]] = {
+            status: set() for status in ProductStatus
+        }
+        # Products by name length, so large groups of equal score can be
+        # ordered by the tie-break with set intersections.
+        self._ids_by_name_length: Dict[int, Set[str]] = {}
+        # Sorted vocabulary for prefix lookups via bisect. New tokens are
+        # buffered and merged lazily so bulk loading stays O(n log n).
+        self._vocabulary: List[str] = []
+        self._new_tokens: Set[str] = set()
+        self._stale_tokens = 0
+        self.evicted = 0
+
+    def __len__(self) -> int:
+        return len(self._products)
+
+    async def handle(self, event: DomainEvent) -> None:
+        if isinstance(event, ProductCreatedPendingVerification):
+            self.add(
+                event.product_id,
+                event.name,
+                event.category,
+                ProductStatus.PENDING_VERIFICATION,
+            )
+        elif isinstance(event, ProductVerificationCompleted):
+            self.update_status(event.product_id, event.status)
+
+    def add(
+        self,
+        product_id: str,
+        name: str,
+        category: str,
+        status: ProductStatus,
+        replace: bool = True,
+    ) -> None:
+        if product_id in self._products:
+            if not replace:
+                return
+            self.remove(product_id)
+
+        product = _IndexedProduct(name, category, ProductStatus(status))
+        self._products[product_id] = product
+        self._status_ids[product.status].add(product_id)
+        self._ids_by_name_length.setdefault(len(name), set()).add(product_id)
+        self._post(self._name_postings, product.name_tokens, product_id)
+        self._post(self._category_postings, product.category_tokens, product_id)
+
+        while len(self._products) > self._max_products:
+            oldest_id = next(iter(self._products))
+            self.remove(oldest_id)
+            self.evicted += 1
+
+    def update_status(self, product_id: str, status: ProductStatus) -> None:
+        product = self._products.get(product_id)
+        if product is None:
+            return
+        self._status_ids[product.status].discard(product_id)
+        product.status = ProductStatus(status)
+        self._status_ids[product.status].add(product_id)
+
+    def remove(self, product_id: str) -> None:
+        product = self._products.pop(product_id, None)
+        if product is None:
+            return
+        self._status_ids[product.status].discard(product_id)
+        same_length = self._ids_by_name_length[len(product.name)]
+        same_length.discard(product_id)
+        if not same_length:
+            del self._ids_by_name_length[len(product.name)]
+        self._unpost(self._name_postings, product.name_tokens, product_id)
+        self._unpost(self._category_postings, product.category_tokens, product_id)
+
+    def search(
+        self,
+        query: str,
+        status: Optional[ProductStatus] = None,
+        limit: int = 20,
+    ) -> SearchResults:
+        query_tokens = list(dict.fromkeys(tokenize(query)))
+        if not query_tokens or limit <= 0:
+            return SearchResults([])
+
+        self._merge_new_tokens()
+        expansions = [self._expand_prefix(token) for token in query_tokens]
+        truncated = any(
+            len(terms) > self._max_prefix_expansions for terms in expansions
+        )
+        token_tiers = [
+            self._token_tiers(token, terms[: self._max_prefix_expansions])
+            for token, terms in zip(query_tokens, expansions)
+        ]
+        if not all(token_tiers):
+            return SearchResults([], truncated)
+        status_ids = (
+            self._status_ids[ProductStatus(status)] if status is not None else None
+        )
+
+        # Upper bound on each token's matches; the rarest bounds the candidates.
+        sizes = [
+            sum(_size(posting) for _, postings in tiers for posting in postings)
+            for tiers in token_tiers
+        ]
+        if min(sizes) <= _SCORE_ALL_LIMIT or len(token_tiers) > _MAX_TIERED_TOKENS:
+            ranked = self._rank_all(token_tiers, sizes, status_ids, limit)
+        else:
+            ranked, cut_short = self._rank_by_tier(token_tiers, status_ids, limit)
+            truncated = truncated or cut_short
+
+        hits = [
+            SearchHit(
+                product_id=product_id,
+                name=self._products[product_id].name,
+                category=self._products[product_id].category,
+                status=self._products[product_id].status,
+                score=score,
+            )
+            for product_id, score in ranked
+        ]
+        return SearchResults(hits, truncated)
+
+    def _tie_break(self, product_id: str) -> Tuple[int, str]:
+        # Among equal scores, shorter names (closer matches) come first, then
+        # product id, so the order does not depend on the ranking path.
+        return len(self._products[product_id].name), product_id
+
+    def _rank_all(
+        self,
+        token_tiers: List[List[_Tier]],
+        sizes: List[int],
+        status_ids: Optional[Set[str]],
+        limit: int,
+    ) -> List[Tuple[str, float]]:
+        # Every query token must match; intersect starting from the rarest.
+        order = sorted(range(len(token_tiers)), key=sizes.__getitem__)
+        candidates = _union(
+            [posting for _, postings in token_tiers[order[0]] for posting in postings]
+        )
+        for index in order[1:]:
+            if not candidates:
+                return []
+            candidates = _within(
+                [posting for _, postings in token_tiers[index] for posting in postings],
+                candidates,
+            )
+        if status_ids is not None:
+            candidates &= status_ids
+        if not candidates:
+            return []
+
+        tier_ids = [
+            [(score, _within(postings, candidates)) for score, postings in tiers]
+            for tiers in token_tiers
+        ]
+        scored = []
+        for product_id in candidates:
+            score = 0.0
+            for tiers in tier_ids:
+                score += max(
+                    tier_score for tier_score, ids in tiers if product_id in ids
+                )
+            scored.append((product_id, score))
+        return heapq.nsmallest(
+            limit, scored, key=lambda item: (-item[1], *self._tie_break(item[0]))
+        )
+
+    def _rank_by_tier(
+        self,
+        token_tiers: List[List[_Tier]],
+        status_ids: Optional[Set[str]],
+        limit: int,
+    ) -> Tuple[List[Tuple[str, float]], bool]:
+        # Each combination of per-token tiers has a fixed total score, so
+        # walking combinations from the highest total down yields results in
+        # rank order without scoring every candidate. A product is ranked at
+        # the first (best) combination it appears in.
+        by_score: Dict[float, List[List[List[_Posting]]]] = {}
+        for combination in itertools.product(*token_tiers):
+            score = sum(tier_score for tier_score, _ in combination)
+            by_score.setdefault(score, []).append(
+                [postings for _, postings in combination]
+            )
+
+        ranked: List[Tuple[str, float]] = []
+        seen: Set[str] = set()
+        work = 0
+        for score in sorted(by_score, reverse=True):
+            chosen, work = self._first_matching(
+                by_score[score], status_ids, seen, limit - len(ranked), work
+            )
+            seen.update(chosen)
+            ranked.extend((product_id, score) for product_id in chosen)
+            if len(ranked) >= limit:
+                return ranked, False
+            if work > _MAX_QUERY_WORK:
+                return ranked, True
+        return ranked, False
+
+    def _first_matching(
+        self,
+        combinations: List[List[List[_Posting]]],
+        status_ids: Optional[Set[str]],
+        seen: Set[str],
+        needed: int,
+        work: int,
+    ) -> Tuple[List[str], int]:
+        # The first `needed` products (in tie-break order) matching every
+        # token's postings in any of the combinations. When each combination
+        # has a token matching few enough products, the matches are
+        # intersected directly; otherwise products are walked by name
+        # length, shortest first, and the walk stops once enough are found.
+        combinations = [
+            sorted(postings_by_token, key=lambda postings: sum(map(_size, postings)))
+            for postings_by_token in combinations
+        ]
+        if all(
+            self._materialise(postings_by_token) for postings_by_token in combinations
+        ):
+            matches: Set[str] = set()
+            for postings_by_token in combinations:
+                rarest = postings_by_token[0]
+                start = rarest[0] if len(rarest) == 1 else _union(rarest)
+                if isinstance(start, str):
+                    start = {start}
+                work += len(start)
+                matched, work = self._narrow(start, postings_by_token[1:], work)
+                # Postings are never modified here, only combined into new sets.
+                matches = matched if len(combinations) == 1 else matches | matched
+            if status_ids is not None:
+                matches = matches & status_ids
+            if seen:
+                matches = matches - seen
+            return self._first_by_tie_break(matches, needed, work)
+
+        chosen: List[str] = []
+        for length in sorted(self._ids_by_name_length):
+            same_length = self._ids_by_name_length[length]
+            group: Set[str] = set()
+            for postings_by_token in combinations:
+                matched, work = self._narrow(same_length, postings_by_token, work)
+                group |= matched
+            if group and status_ids is not None:
+                group &= status_ids
+            if group and seen:
+                group -= seen
+            if group:
+                chosen.extend(
+                    heapq.nsmallest(needed - len(chosen), group, key=self._tie_break)
+                )
+            if len(chosen) >= needed or work > _MAX_QUERY_WORK:
+                break
+        return chosen, work
+
+    @staticmethod
+    def _materialise(postings_by_token: List[List[_Posting]]) -> bool:
+        # A single large token matches densely, so walking finds its first
+        # products sooner than building the set; with several tokens the
+        # matches may be sparse or empty, which only an intersection finds
+        # cheaply.
+        rarest = sum(map(_size, postings_by_token[0]))
+        if len(postings_by_token) == 1:
+            return rarest <= _SCORE_ALL_LIMIT
+        return rarest <= _MATERIALISE_LIMIT
+
+    def _first_by_tie_break(
+        self, group: Set[str], needed: int, work: int
+    ) -> Tuple[List[str], int]:
+        if len(group) <= _SCORE_ALL_LIMIT:
+            return heapq.nsmallest(needed, group, key=self._tie_break), work
+        chosen: List[str] = []
+        for length in sorted(self._ids_by_name_length):
+            same_length = self._ids_by_name_length[length]
+            work += min(len(group), len(same_length))
+            chosen.extend(heapq.nsmallest(needed - len(chosen), group & same_length))
+            if len(chosen) >= needed or work > _MAX_QUERY_WORK:
+                break
+        return chosen, work
+
+    @staticmethod
+    def _narrow(
+        group: Set[str], postings_by_token: List[List[_Posting]], work: int
+    ) -> Tuple[Set[str], int]:
+        for postings in postings_by_token:
+            if not group:
+                break
+            work += sum(min(_size(posting), len(group)) for posting in postings)
+            group = _within(postings, group)
+        return group, work
+
+    def _token_tiers(self, token: str, terms: List[str]) -> List[_Tier]:
+        name_exact: List[_Posting] = []
+        name_prefix: List[_Posting] = []
+        category_exact: List[_Posting] = []
+        category_prefix: List[_Posting] = []
+        for term in terms:
+            exact = term == token
+            name_ids = self._name_postings.get(term)
+            if name_ids is not None:
+                (name_exact if exact else name_prefix).append(name_ids)
+            category_ids = self._category_postings.get(term)
+            if category_ids is not None:
+                (category_exact if exact else category_prefix).append(category_ids)
+
+        tiers = [
+            (NAME_EXACT_SCORE, name_exact),
+            (
+                max(NAME_PREFIX_SCORE, CATEGORY_EXACT_SCORE),
+                name_prefix + category_exact,
+            ),
+            (CATEGORY_PREFIX_SCORE, category_prefix),
+        ]
+        return [(score, postings) for score, postings in tiers if postings]
+
+    def _expand_prefix(self, prefix: str) -> List[str]:
+        # One term past the cap is returned so callers can tell the
+        # expansion was cut short.
+        start = bisect_left(self._vocabulary, prefix)
+        terms = []
+        for term in self._vocabulary[start : start + self._max_prefix_expansions + 1]:
+            if not term.startswith(prefix):
+                break
+            terms.append(term)
+        return terms
+
+    def _merge_new_tokens(self) -> None:
+        if not self._new_tokens:
+            return
+        if len(self._new_tokens) <= 64:
+            for token in self._new_tokens:
+                position = bisect_left(self._vocabulary, token)
+                if (
+                    position == len(self._vocabulary)
+                    or self._vocabulary[position] != token
+                ):
+                    self._vocabulary.insert(position, token)
+        else:
+            self._vocabulary = sorted({*self._vocabulary, *self._new_tokens})
+        self._new_tokens.clear()
+
+        if self._stale_tokens > len(self._vocabulary) // 10:
+            self._vocabulary = [
+                term
+                for term in self._vocabulary
+                if term in self._name_postings or term in self._category_postings
+            ]
+            self._stale_tokens = 0
+
+    def _post(
+        self, postings: Dict[str, _Posting], tokens: Iterable[str], product_id: str
+    ) -> None:
+        for token in tokens:
+            ids = postings.get(token)
+            if ids is None:
+                postings[token] = product_id
+                self._new_tokens.add(token)
+            elif isinstance(ids, str):
+                postings[token] = {ids, product_id}
+            else:
+                ids.add(product_id)
+
+    def _unpost(
+        self, postings: Dict[str, _Posting], tokens: Iterable[str], product_id: str
+    ) -> None:
+        for token in tokens:
+            ids = postings.get(token)
+            if ids is None:
+                continue
+            if isinstance(ids, str):
+                if ids == product_id:
+                    del postings[token]
+                    self._stale_tokens += 1
+                continue
+            ids.discard(product_id)
+            if len(ids) == 1:
+                postings[token] = next(iter(ids))
@@ -1,15 +1,39 @@
-from typing import List
+import asyncio
+from typing import Any, Awaitable, List, Optional, Tuple
 from datetime import datetime
-from uuid import uuid4
 
 from src.domain import (
     Product,
     ProductStatus,
     ProductCreatedPendingVerification,
     ProductVerificationCompleted,
+    InsufficientStockError,
 )
+from src.domain.asset_checker import AssetChecker
+from src.domain.product_id import new_product_id
 from src.domain.verification_policy import ProductVerificationPolicy
-from src.domain.repositories import ProductRepository, VerificationRepository
+from src.domain.repositories import (
+    ProductRepository,
+    VerificationRepository,
+    StockRepository,
+)
+from src.observability import MetricsRegistry, traced
+
+VERIFICATION_MEMO_HITS = "verification_memo_hits"
+VERIFICATION_MEMO_MISSES = "verification_memo_misses"
+VERIFICATION_LOOKUP_FAILURES = "verification_lookup_failures"
+
+
+async def _run_concurrently(*operations: Awaitable[Any]) -> List[Any]:
+    # TaskGroup cancels the remaining operations as soon as one fails; the
+    # first error is re-raised unwrapped so callers keep handling the same
+    # exception types as with sequential awaits.
+    try:
+        async with asyncio.TaskGroup() as group:
+            tasks = [group.create_task(operation) for operation in operations]
+    except BaseExceptionGroup as errors:
+        raise errors.exceptions[0]
+    return [task.result() for task in tasks]
 
 
 class ProductService:
@@ -18,11 +42,18 @@ class ProductService:
         product_repository: ProductRepository,
         verification_repository: VerificationRepository,
         verification_policy: ProductVerificationPolicy,
+        stock_repository: Optional[StockRepository] = None,
+        metrics: Optional[MetricsRegistry] = None,
+        asset_checker: Optional[AssetChecker] = None,
     ):
         self._product_repository = product_repository
         self._verification_repository = verification_repository
         self._verification_policy = verification_policy
+        self._stock_repository = stock_repository or product_repository
+        self._metrics = metrics or MetricsRegistry()
+        self._asset_checker = asset_checker
 
+    @traced("service")
     async def create_product(
         self,
         name: str,
@@ -32,7 +63,7 @@ class ProductService:
         stock_quantity: int,
         assets: List[str],
     ) -> Product:
-        product_id = str(uuid4())
+        product_id = new_product_id()
 
         product = Product(
             product_id=product_id,
@@ -50,6 +81,7 @@ class ProductService:
             name=product.name,
             price=product.price,
             currency=product.currency,
+            category=product.category,
         )
         product.add_domain_event(event)
 
@@ -57,7 +89,29 @@ class ProductService:
 
         return product
 
+    @traced("service")
     async def verify_product(self, product: Product) -> None:
+        # Same verified fields under the same policy always give the same
+        # outcome, so a retry returns the stored result without touching
+        # either database.
+        policy_version = self._verification_policy.version_for(
+            self._asset_checker is not None
+        )
+        content_hash = product.content_hash()
+        if product.is_verified_for(content_hash, policy_version):
+            self._metrics.increment(VERIFICATION_MEMO_HITS)
+            return
+        self._metrics.increment(VERIFICATION_MEMO_MISSES)
+
+        asset_reachability = None
+        memoizable = True
+        if self._asset_checker is not None and product.assets:
+            asset_reachability = await self._asset_checker.check(product.assets)
+            # An outcome that rests on an unreachable or unchecked asset may
+            # change once the asset is back, so it is not memoized: the next
+            # verify checks again (the checker's cache keeps that cheap).
+            memoizable = all(asset_reachability.values())
+
         verification_result = self._verification_policy.evaluate(
             name=product.name,
             category=product.category,
@@ -65,40 +119,91 @@ class ProductService:
             price=product.price,
             stock_quantity=product.stock_quantity,
             assets=product.assets,
+            asset_reachability=asset_reachability,
         )
 
-        checks = {
-            "name_present": bool(product.name and product.name.strip()),
-            "category_present": bool(product.category and product.category.strip()),
-            "currency_present": bool(product.currency and product.currency.strip()),
-            "price_valid": product.price > 0,
-            "stock_quantity_valid": product.stock_quantity >= 0,
-            "assets_present": len(product.assets) > 0,
-        }
-
-        if verification_result.passed:
-            product.transition_to_active()
+        previous_status = product.status
+        if previous_status != ProductStatus.PENDING_VERIFICATION:
+            product.reevaluate(verification_result.passed, policy_version)
+        elif verification_result.passed:
+            product.transition_to_active(policy_version)
         else:
-            product.transition_to_rejected()
+            product.transition_to_rejected(policy_version)
+        product.verification_hash = content_hash if memoizable else None
 
-        await self._verification_repository.save_verification(
-            product_id=product.product_id,
-            checks=checks,
-            reasons=verification_result.reasons,
-            verified_at=datetime.utcnow(),
+        # The Mongo audit record and the MySQL row are independent, so their
+        # latencies overlap. A failure in either propagates before commit.
+        await _run_concurrently(
+            self._verification_repository.save_verification(
+                product_id=product.product_id,
+                checks=verification_result.checks,
+                reasons=verification_result.reasons,
+                verified_at=datetime.utcnow(),
+                policy_version=policy_version,
+            ),
+            self._product_repository.update(product),
         )
 
-        await self._product_repository.update(product)
-
         event = ProductVerificationCompleted(
             product_id=product.product_id,
             status=product.status,
             reasons=verification_result.reasons,
+            previous_status=previous_status,
         )
         product.add_domain_event(event)
 
+    @traced("service")
     async def get_product(self, product_id: str) -> Product:
         product = await self._product_repository.find_by_id(product_id)
         if product is None:
             raise ValueError(f"Product {product_id} not found")
         return product
+
+    @traced("service")
+    async def get_product_with_verification(
+        self, product_id: str
+    ) -> Tuple[Product, Optional[dict]]:
+        product, verification = await _run_concurrently(
+            self.get_product(product_id),
+            self._find_verification(product_id),
+        )
+        return product, verification
+
+    async def _find_verification(self, product_id: str) -> Optional[dict]:
+        # The record is an optional part of the response and lives in another
+        # store: when Mongo is slow or down the product is still returned,
+        # with no verification, instead of failing the whole read.
+        try:
+            return await self._verification_repository.find_by_product_id(product_id)
+        except Exception as e:
+            self._metrics.increment(VERIFICATION_LOOKUP_FAILURES)
+            print(f"[VERIFICATION LOOKUP FAILED] {product_id}: {e!r}")
+            return None
+
+    @traced("service")
+    async def get_product_version(self, product_id: str) -> int:
+        version = await self._product_repository.get_version(product_id)
+        if version is None:
+            raise ValueError(f"Product {product_id} not found")
+        return version
+
+    @traced("service")
+    async def reserve_stock(self, product_id: str, quantity: int) -> None:
+        if await self._stock_repository.reserve_stock(product_id, quantity):
+            return
+        if await self._product_repository.get_version(product_id) is None:
+            raise ValueError(f"Product {product_id} not found")
+        raise InsufficientStockError(
+            f"Insufficient stock to reserve {quantity} of product {product_id}"
+        )
+
+    @traced("service")
+    async def release_stock(self, product_id: str, quantity: int) -> None:
+        if await self._stock_repository.release_stock(product_id, quantity):
+            return
+        if await self._product_repository.get_version(product_id) is None:
+            raise ValueError(f"Product {product_id} not found")
+        raise InsufficientStockError(
+            f"Cannot release {quantity} of product {product_id}: "
+            "more than is currently reserved"
+        )
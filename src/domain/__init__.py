@@ -4,8 +4,10 @@ from .product import (
     DomainEvent,
     ProductCreatedPendingVerification,
     ProductVerificationCompleted,
+    InsufficientStockError,
 )
 from .verification_policy import ProductVerificationPolicy, VerificationResult
+from .asset_checker import AssetChecker
 
 __all__ = [
     "Product",
@@ -13,6 +15,8 @@ __all__ = [
     "DomainEvent",
     "ProductCreatedPendingVerification",
     "ProductVerificationCompleted",
+    "InsufficientStockError",
     "ProductVerificationPolicy",
     "VerificationResult",
+    "AssetChecker",
 ]
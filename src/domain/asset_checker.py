@@ -0,0 +1,11 @@
+from abc import ABC, abstractmethod
+from typing import Dict, List, Optional
+
+
+class AssetChecker(ABC):
+    @abstractmethod
+    async def check(self, urls: List[str]) -> Dict[str, Optional[bool]]:
+        # Maps each checkable (http(s)) URL to whether it is reachable, or to
+        # None when its check did not finish before the deadline. URLs that
+        # are not checked at all are left out.
+        pass
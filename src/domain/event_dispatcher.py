@@ -1,9 +1,15 @@
 from abc import ABC, abstractmethod
-from typing import List
+from typing import Awaitable, Callable, List
 from src.domain import DomainEvent
 
+EventHandler = Callable[[DomainEvent], Awaitable[None]]
+
 
 class EventDispatcher(ABC):
+    @abstractmethod
+    def subscribe(self, handler: EventHandler) -> None:
+        pass
+
     @abstractmethod
     async def dispatch(self, event: DomainEvent) -> None:
         pass
@@ -13,13 +19,28 @@ class EventDispatcher(ABC):
         pass
 
 
+async def notify_handlers(handlers: List[EventHandler], event: DomainEvent) -> None:
+    # Events are dispatched after commit, so a failing subscriber must not
+    # turn an already committed request into an error.
+    for handler in handlers:
+        try:
+            await handler(event)
+        except Exception as e:
+            print(f"[EVENT HANDLER FAILED] {event.__class__.__name__}: {e!r}")
+
+
 class InMemoryEventDispatcher(EventDispatcher):
     def __init__(self):
         self._events: List[DomainEvent] = []
+        self._handlers: List[EventHandler] = []
+
+    def subscribe(self, handler: EventHandler) -> None:
+        self._handlers.append(handler)
 
     async def dispatch(self, event: DomainEvent) -> None:
         self._events.append(event)
         print(f"[EVENT DISPATCHED] {event.__class__.__name__}: {event.__dict__}")
+        await notify_handlers(self._handlers, event)
 
     async def dispatch_all(self, events: List[DomainEvent]) -> None:
         for event in events:
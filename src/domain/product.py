@@ -1,3 +1,5 @@
+import hashlib
+import json
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
@@ -23,6 +25,7 @@ class ProductCreatedPendingVerification(DomainEvent):
     name: str = ""
     price: float = 0.0
     currency: str = ""
+    category: str = ""
 
 
 @dataclass
@@ -30,6 +33,11 @@ class ProductVerificationCompleted(DomainEvent):
     product_id: str = ""
     status: ProductStatus = ProductStatus.PENDING_VERIFICATION
     reasons: List[str] = field(default_factory=list)
+    previous_status: ProductStatus = ProductStatus.PENDING_VERIFICATION
+
+
+class InsufficientStockError(Exception):
+    pass
 
 
 class Product:
@@ -45,6 +53,9 @@ class Product:
         status: ProductStatus = ProductStatus.PENDING_VERIFICATION,
         created_at: Optional[datetime] = None,
         updated_at: Optional[datetime] = None,
+        version: int = 1,
+        verification_policy_version: Optional[str] = None,
+        verification_hash: Optional[str] = None,
     ):
         self.product_id = product_id
         self.name = name
@@ -56,24 +67,63 @@ class Product:
         self.status = status
         self.created_at = created_at or datetime.utcnow()
         self.updated_at = updated_at or datetime.utcnow()
+        self.version = version
+        self.verification_policy_version = verification_policy_version
+        self.verification_hash = verification_hash
         self._domain_events: List[DomainEvent] = []
 
-    def transition_to_active(self) -> None:
+    def transition_to_active(self, policy_version: Optional[str] = None) -> None:
         if self.status != ProductStatus.PENDING_VERIFICATION:
             raise ValueError(
                 f"Cannot transition from {self.status} to active"
             )
         self.status = ProductStatus.ACTIVE
+        self.verification_policy_version = policy_version
         self.updated_at = datetime.utcnow()
 
-    def transition_to_rejected(self) -> None:
+    def transition_to_rejected(self, policy_version: Optional[str] = None) -> None:
         if self.status != ProductStatus.PENDING_VERIFICATION:
             raise ValueError(
                 f"Cannot transition from {self.status} to rejected"
             )
         self.status = ProductStatus.REJECTED
+        self.verification_policy_version = policy_version
+        self.updated_at = datetime.utcnow()
+
+    def reevaluate(self, passed: bool, policy_version: str) -> None:
+        # Explicit transition for already verified products, used when the
+        # verification policy changes: active <-> rejected under a new version.
+        if self.status == ProductStatus.PENDING_VERIFICATION:
+            raise ValueError(
+                f"Cannot re-evaluate a product in {self.status}; verify it first"
+            )
+        self.status = ProductStatus.ACTIVE if passed else ProductStatus.REJECTED
+        self.verification_policy_version = policy_version
         self.updated_at = datetime.utcnow()
 
+    def is_verified_for(self, content_hash: str, policy_version: str) -> bool:
+        return (
+            self.status != ProductStatus.PENDING_VERIFICATION
+            and self.verification_hash == content_hash
+            and self.verification_policy_version == policy_version
+        )
+
+    def content_hash(self) -> str:
+        # Hash of exactly the fields the verification policy looks at.
+        payload = json.dumps(
+            [
+                self.name,
+                self.category,
+                self.currency,
+                self.price,
+                self.stock_quantity,
+                self.assets,
+            ],
+            separators=(",", ":"),
+            ensure_ascii=False,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
     def add_domain_event(self, event: DomainEvent) -> None:
         self._domain_events.append(event)
 
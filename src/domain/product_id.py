@@ -0,0 +1,64 @@
+import os
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Optional
+from uuid import UUID
+
+_lock = threading.Lock()
+_last_ms = 0
+_counter = 0
+
+
+def uuid7() -> UUID:
+    # RFC 9562 UUIDv7: 48-bit unix ms timestamp, 12-bit counter in rand_a so
+    # ids generated within the same millisecond stay strictly increasing.
+    global _last_ms, _counter
+
+    with _lock:
+        now_ms = time.time_ns() // 1_000_000
+        if now_ms > _last_ms:
+            _last_ms = now_ms
+            _counter = int.from_bytes(os.urandom(2), "big") & 0x7FF
+        else:
+            _counter += 1
+            if _counter > 0xFFF:
+                _last_ms += 1
+                _counter = 0
+        timestamp_ms, counter = _last_ms, _counter
+
+    rand_b = int.from_bytes(os.urandom(8), "big") & 0x3FFF_FFFF_FFFF_FFFF
+    value = (timestamp_ms << 80) | (0x7 << 76) | (counter << 64) | (0b10 << 62) | rand_b
+    return UUID(int=value)
+
+
+def new_product_id() -> str:
+    return str(uuid7())
+
+
+def product_id_created_at(product_id: str) -> Optional[datetime]:
+    # Naive UTC creation time encoded in a UUIDv7 id; None for other ids
+    # (such as UUIDv4 ids created before the switch to UUIDv7).
+    try:
+        value = UUID(product_id)
+    except (ValueError, TypeError, AttributeError):
+        return None
+    if value.version != 7:
+        return None
+    return datetime(1970, 1, 1) + timedelta(milliseconds=value.int >> 80)
+
+
+def is_valid_product_id(product_id: str) -> bool:
+    try:
+        UUID(product_id)
+    except (ValueError, TypeError, AttributeError):
+        return False
+    return True
+
+
+def product_id_to_bytes(product_id: str) -> bytes:
+    return UUID(product_id).bytes
+
+
+def product_id_from_bytes(value: bytes) -> str:
+    return str(UUID(bytes=value))
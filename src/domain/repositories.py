@@ -1,11 +1,21 @@
 from abc import ABC, abstractmethod
-from typing import Optional, List
+from typing import Optional, List, AsyncIterator
 from datetime import datetime
 
 from src.domain import Product
 
 
-class ProductRepository(ABC):
+class StockRepository(ABC):
+    @abstractmethod
+    async def reserve_stock(self, product_id: str, quantity: int) -> bool:
+        pass
+
+    @abstractmethod
+    async def release_stock(self, product_id: str, quantity: int) -> bool:
+        pass
+
+
+class ProductRepository(StockRepository):
     @abstractmethod
     async def save(self, product: Product) -> None:
         pass
@@ -14,10 +24,26 @@ class ProductRepository(ABC):
     async def find_by_id(self, product_id: str) -> Optional[Product]:
         pass
 
+    @abstractmethod
+    async def get_version(self, product_id: str) -> Optional[int]:
+        pass
+
     @abstractmethod
     async def update(self, product: Product) -> None:
         pass
 
+    @abstractmethod
+    async def list_page(self, after_id: Optional[str], limit: int) -> List[Product]:
+        pass
+
+    @abstractmethod
+    async def bulk_update_verification(self, products: List[Product]) -> None:
+        pass
+
+
+class VerificationStoreUnavailableError(Exception):
+    pass
+
 
 class VerificationRepository(ABC):
     @abstractmethod
@@ -27,9 +53,48 @@ class VerificationRepository(ABC):
         checks: dict,
         reasons: List[str],
         verified_at: datetime,
+        policy_version: Optional[str] = None,
     ) -> None:
         pass
 
+    @abstractmethod
+    async def save_verifications(self, records: List[dict]) -> None:
+        pass
+
     @abstractmethod
     async def find_by_product_id(self, product_id: str) -> Optional[dict]:
         pass
+
+    @abstractmethod
+    def iter_verifications(self, batch_size: int) -> AsyncIterator[dict]:
+        pass
+
+    @abstractmethod
+    async def find_history(
+        self,
+        product_id: str,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        limit: Optional[int] = None,
+    ) -> List[dict]:
+        pass
+
+    @abstractmethod
+    def iter_verifications_before(
+        self, cutoff: datetime, batch_size: int
+    ) -> AsyncIterator[dict]:
+        pass
+
+    @abstractmethod
+    async def delete_verifications(self, record_ids: List) -> int:
+        pass
+
+
+class CheckpointRepository(ABC):
+    @abstractmethod
+    async def load(self, name: str) -> Optional[dict]:
+        pass
+
+    @abstractmethod
+    async def save(self, name: str, state: dict) -> None:
+        pass
@@ -1,14 +1,25 @@
-from dataclasses import dataclass
-from typing import List
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
 
 
 @dataclass
 class VerificationResult:
     passed: bool
     reasons: List[str]
+    checks: Dict[str, bool] = field(default_factory=dict)
 
 
 class ProductVerificationPolicy:
+    # Bump whenever the rules below change so already verified products can
+    # be re-evaluated by the catalogue sweep.
+    version = "1"
+
+    def version_for(self, asset_check: bool) -> str:
+        # Outcomes that include asset reachability are recorded under their
+        # own version, so enabling the check re-verifies products memoized
+        # without it (and the sweep, which cannot check assets, skips them).
+        return f"{self.version}+assets" if asset_check else self.version
+
     def evaluate(
         self,
         name: str,
@@ -17,26 +28,51 @@ class ProductVerificationPolicy:
         price: float,
         stock_quantity: int,
         assets: List[str],
+        asset_reachability: Optional[Dict[str, Optional[bool]]] = None,
     ) -> VerificationResult:
+        checks = {
+            "name_present": bool(name and name.strip()),
+            "category_present": bool(category and category.strip()),
+            "currency_present": bool(currency and currency.strip()),
+            "price_valid": price > 0,
+            "stock_quantity_valid": stock_quantity >= 0,
+            "assets_present": bool(assets),
+        }
+
         reasons = []
 
-        if not name or not name.strip():
+        if not checks["name_present"]:
             reasons.append("name is missing or empty")
 
-        if not category or not category.strip():
+        if not checks["category_present"]:
             reasons.append("category is missing or empty")
 
-        if not currency or not currency.strip():
+        if not checks["currency_present"]:
             reasons.append("currency is missing or empty")
 
-        if price <= 0:
+        if not checks["price_valid"]:
             reasons.append("price must be greater than 0")
 
-        if stock_quantity < 0:
+        if not checks["stock_quantity_valid"]:
             reasons.append("stock_quantity must be >= 0")
 
-        if not assets or len(assets) == 0:
+        if not checks["assets_present"]:
             reasons.append("at least 1 asset is required")
 
+        # Optional and only for assets that were actually checked, so the
+        # outcome without an asset checker is unchanged.
+        if asset_reachability:
+            reachable = []
+            for index, url in enumerate(assets):
+                result = asset_reachability.get(url)
+                if result is None:
+                    continue
+                checks[f"asset_{index}_reachable"] = result
+                reachable.append(result)
+                if not result:
+                    reasons.append(f"asset {url} is unreachable")
+            if reachable:
+                checks["assets_reachable"] = all(reachable)
+
         passed = len(reasons) == 0
-        return VerificationResult(passed=passed, reasons=reasons)
+        return VerificationResult(passed=passed, reasons=reasons, checks=checks)
@@ -1,13 +1,36 @@
 from .mysql_models import Base, ProductModel
 from .mysql_repository import MySQLProductRepository
-from .mongo_repository import MongoVerificationRepository
+from .mongo_repository import MongoVerificationRepository, MongoCheckpointRepository
 from .unit_of_work import UnitOfWork, SQLAlchemyUnitOfWork
+from .stock_aggregator import StockReservationAggregator
+from .circuit_breaker import CircuitBreaker
+from .verification_spool import VerificationSpool
+from .resilient_verification_repository import ResilientVerificationRepository
+from .memory import InMemoryStore, InMemoryUnitOfWork
+from .verification_archive import VerificationArchive
+from .archived_verification_repository import ArchivedVerificationRepository
+from .asset_checker import HttpAssetChecker
+from .event_log import EventLog
+from .event_log_dispatcher import EventLogDispatcher, event_compaction_key
 
 __all__ = [
     "Base",
     "ProductModel",
     "MySQLProductRepository",
     "MongoVerificationRepository",
+    "MongoCheckpointRepository",
     "UnitOfWork",
     "SQLAlchemyUnitOfWork",
+    "StockReservationAggregator",
+    "CircuitBreaker",
+    "VerificationSpool",
+    "ResilientVerificationRepository",
+    "InMemoryStore",
+    "InMemoryUnitOfWork",
+    "VerificationArchive",
+    "ArchivedVerificationRepository",
+    "HttpAssetChecker",
+    "EventLog",
+    "EventLogDispatcher",
+    "event_compaction_key",
 ]
@@ -0,0 +1,112 @@
+from datetime import datetime, timedelta
+from typing import AsyncIterator, List, Optional
+
+from src.domain.product_id import product_id_created_at
+from src.domain.repositories import VerificationRepository
+from src.infrastructure.verification_archive import VerificationArchive
+
+# Allows for clock skew between the host that created a product and the
+# one that verified it.
+_CREATION_TIME_SLACK = timedelta(minutes=5)
+
+
+def _archive_since(product_id: str, since: Optional[datetime]) -> Optional[datetime]:
+    # A product cannot be verified before it was created, so the archive
+    # partitions older than its UUIDv7 creation time are never read.
+    created_at = product_id_created_at(product_id)
+    if created_at is None:
+        return since
+    created_at -= _CREATION_TIME_SLACK
+    return created_at if since is None else max(since, created_at)
+
+
+class ArchivedVerificationRepository(VerificationRepository):
+    # Reads span both tiers: recent records from Mongo, older ones from the
+    # archive files the archival job moved them to. Writes only go to Mongo.
+    def __init__(
+        self, repository: VerificationRepository, archive: VerificationArchive
+    ):
+        self._repository = repository
+        self._archive = archive
+
+    async def save_verification(
+        self,
+        product_id: str,
+        checks: dict,
+        reasons: List[str],
+        verified_at: datetime,
+        policy_version: Optional[str] = None,
+    ) -> None:
+        await self._repository.save_verification(
+            product_id, checks, reasons, verified_at, policy_version
+        )
+
+    async def save_verifications(self, records: List[dict]) -> None:
+        await self._repository.save_verifications(records)
+
+    async def find_by_product_id(self, product_id: str) -> Optional[dict]:
+        document = await self._repository.find_by_product_id(product_id)
+        if document is not None:
+            return document
+        archived = await self._archive.find_history(
+            product_id, since=_archive_since(product_id, None)
+        )
+        return archived[0] if archived else None
+
+    async def iter_verifications(self, batch_size: int) -> AsyncIterator[dict]:
+        # Mongo records older than the newest archived one are normally gone;
+        # any left over were either archived by a run that crashed before
+        # deleting them (skipped here) or never archived (yielded once).
+        boundary = await self._archive.newest_verified_at()
+        leftovers = {}
+        if boundary is not None:
+            boundary += timedelta(microseconds=1)
+            async for document in self._repository.iter_verifications_before(
+                boundary, batch_size
+            ):
+                leftovers[str(document.pop("_id"))] = document
+
+        archived_ids = set()
+        async for document in self._archive.iter_records(with_record_ids=True):
+            record_id = document.pop("_record_id")
+            if record_id in leftovers:
+                archived_ids.add(record_id)
+            yield document
+        for record_id, document in leftovers.items():
+            if record_id not in archived_ids:
+                yield document
+        async for document in self._repository.iter_verifications(batch_size):
+            if boundary is None or document["verified_at"] >= boundary:
+                yield document
+
+    async def find_history(
+        self,
+        product_id: str,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        limit: Optional[int] = None,
+    ) -> List[dict]:
+        recent = await self._repository.find_history(product_id, since, until, limit)
+        if limit is not None and len(recent) >= limit:
+            return recent
+        # Only read the archive below the oldest record still in Mongo, so
+        # records archived but not yet deleted are not returned twice.
+        if recent:
+            oldest = recent[-1]["verified_at"]
+            until = oldest if until is None else min(until, oldest)
+        archived = await self._archive.find_history(
+            product_id, _archive_since(product_id, since), until
+        )
+        history = recent + archived
+        return history[:limit] if limit is not None else history
+
+    async def iter_verifications_before(
+        self, cutoff: datetime, batch_size: int
+    ) -> AsyncIterator[dict]:
+        async for document in self._repository.iter_verifications_before(
+            cutoff, batch_size
+        ):
+            yield document
+
+    async def delete_verifications(self, record_ids: List) -> int:
+        return await self._repository.delete_verifications(record_ids)
@@ -0,0 +1,179 @@
+import asyncio
+import contextvars
+import ipaddress
+import socket
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+import httpx
+
+from src.domain.asset_checker import AssetChecker
+from src.observability import MetricsRegistry, tracer
+from src.observability.tracing import SPAN_KIND_CLIENT
+
+CHECKED_SCHEMES = ("http", "https")
+MAX_REDIRECTS = 5
+
+
+def _is_public(address: str) -> bool:
+    ip = ipaddress.ip_address(address.split("%", 1)[0])
+    return ip.is_global and not ip.is_multicast
+
+
+class HttpAssetChecker(AssetChecker):
+    # Sends HEAD requests through one shared, pooled client, with at most
+    # per_host_limit requests in flight per host. Results are cached for
+    # cache_ttl (failures only for negative_cache_ttl), and concurrent checks
+    # of the same URL share one request, so an asset used by many products
+    # is fetched once. check() returns at the deadline; URLs still in flight
+    # are reported as unchecked and their results are cached for next time.
+    # URLs are user supplied, so every hop (redirects are followed by hand)
+    # must resolve to public addresses only; loopback, private, link-local
+    # and other special ranges count as unreachable without a request.
+    def __init__(
+        self,
+        client: httpx.AsyncClient,
+        per_host_limit: int = 4,
+        request_timeout: float = 2.0,
+        deadline: float = 3.0,
+        cache_ttl: float = 3600.0,
+        negative_cache_ttl: float = 60.0,
+        max_cache_entries: int = 100_000,
+        metrics: Optional[MetricsRegistry] = None,
+        allow_private_addresses: bool = False,
+    ):
+        self._client = client
+        self._per_host_limit = per_host_limit
+        self._request_timeout = request_timeout
+        self._deadline = deadline
+        self._cache_ttl = cache_ttl
+        self._negative_cache_ttl = negative_cache_ttl
+        self._max_cache_entries = max_cache_entries
+        self._metrics = metrics or MetricsRegistry()
+        self._allow_private_addresses = allow_private_addresses
+        self._cache: "OrderedDict[str, Tuple[float, bool]]" = OrderedDict()
+        self._in_flight: Dict[str, asyncio.Task] = {}
+        # Per host: its semaphore and how many checks are using it. Entries
+        # are dropped when unused, so the map only holds hosts in flight.
+        self._host_limits: Dict[str, List] = {}
+
+    async def check(self, urls: List[str]) -> Dict[str, Optional[bool]]:
+        results: Dict[str, Optional[bool]] = {}
+        pending: Dict[str, asyncio.Task] = {}
+        now = time.monotonic()
+        for url in dict.fromkeys(urls):
+            if urlsplit(url).scheme.lower() not in CHECKED_SCHEMES:
+                continue
+            cached = self._cached(url, now)
+            if cached is not None:
+                self._metrics.increment("asset_check_cache_hits")
+                results[url] = cached
+                continue
+            task = self._in_flight.get(url)
+            if task is None:
+                # Shared by every check of this URL and may outlive the
+                # request that started it, so it gets no trace of its own.
+                task = asyncio.create_task(
+                    self._fetch(url), context=contextvars.Context()
+                )
+                self._in_flight[url] = task
+                task.add_done_callback(lambda _, url=url: self._in_flight.pop(url))
+            pending[url] = task
+
+        if pending:
+            done, _ = await asyncio.wait(pending.values(), timeout=self._deadline)
+            for url, task in pending.items():
+                results[url] = task.result() if task in done else None
+                if task not in done:
+                    self._metrics.increment("asset_check_deadline_exceeded")
+        return results
+
+    async def _fetch(self, url: str) -> bool:
+        host = urlsplit(url).netloc.lower()
+        async with self._host_slot(host):
+            self._metrics.increment("asset_check_requests")
+            with tracer.span(
+                "http HEAD",
+                {"http.method": "HEAD", "http.url": url},
+                SPAN_KIND_CLIENT,
+            ):
+                reachable = await self._reachable(url)
+
+        if not reachable:
+            self._metrics.increment("asset_check_failures")
+        ttl = self._cache_ttl if reachable else self._negative_cache_ttl
+        self._cache[url] = (time.monotonic() + ttl, reachable)
+        self._cache.move_to_end(url)
+        while len(self._cache) > self._max_cache_entries:
+            self._cache.popitem(last=False)
+        return reachable
+
+    @asynccontextmanager
+    async def _host_slot(self, host: str) -> AsyncIterator[None]:
+        entry = self._host_limits.get(host)
+        if entry is None:
+            entry = self._host_limits[host] = [
+                asyncio.Semaphore(self._per_host_limit),
+                0,
+            ]
+        entry[1] += 1
+        try:
+            async with entry[0]:
+                yield
+        finally:
+            entry[1] -= 1
+            if entry[1] == 0:
+                del self._host_limits[host]
+
+    async def _reachable(self, url: str) -> bool:
+        try:
+            for _ in range(MAX_REDIRECTS + 1):
+                if not await self._allowed(url):
+                    self._metrics.increment("asset_check_blocked")
+                    return False
+                response = await self._client.head(url, timeout=self._request_timeout)
+                if response.status_code in (405, 501):
+                    # Some servers do not implement HEAD; fetch headers only.
+                    async with self._client.stream(
+                        "GET", url, timeout=self._request_timeout
+                    ) as response:
+                        pass
+                if not response.is_redirect:
+                    return response.status_code < 400
+                url = str(response.url.join(response.headers["location"]))
+        except (httpx.HTTPError, httpx.InvalidURL):
+            return False
+        return False
+
+    async def _allowed(self, url: str) -> bool:
+        # httpx resolves the host again when it connects, so an answer that
+        # changes between the two lookups (DNS rebinding) is not caught here;
+        # route checks through an egress proxy where that matters.
+        parts = urlsplit(url)
+        if parts.scheme.lower() not in CHECKED_SCHEMES or not parts.hostname:
+            return False
+        if self._allow_private_addresses:
+            return True
+        try:
+            port = parts.port or (443 if parts.scheme.lower() == "https" else 80)
+            addresses = await asyncio.get_running_loop().getaddrinfo(
+                parts.hostname, port, type=socket.SOCK_STREAM
+            )
+        except (OSError, UnicodeError, ValueError):
+            return False
+        return bool(addresses) and all(
+            _is_public(address[4][0]) for address in addresses
+        )
+
+    def _cached(self, url: str, now: float) -> Optional[bool]:
+        entry = self._cache.get(url)
+        if entry is None:
+            return None
+        expires_at, reachable = entry
+        if expires_at <= now:
+            del self._cache[url]
+            return None
+        return reachable
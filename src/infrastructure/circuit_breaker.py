@@ -0,0 +1,54 @@
+import time
+
+
+class CircuitBreaker:
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 10.0):
+        self._failure_threshold = failure_threshold
+        self._reset_timeout = reset_timeout
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_started = None
+
+    @property
+    def state(self) -> str:
+        if (
+            self._state == self.OPEN
+            and time.monotonic() - self._opened_at >= self._reset_timeout
+        ):
+            return self.HALF_OPEN
+        return self._state
+
+    def allow(self) -> bool:
+        state = self.state
+        if state == self.CLOSED:
+            return True
+        if state == self.OPEN:
+            return False
+
+        # Half open: let a single probe through. A probe that never reports
+        # back (e.g. cancelled) stops blocking after another reset_timeout.
+        now = time.monotonic()
+        if (
+            self._probe_started is not None
+            and now - self._probe_started < self._reset_timeout
+        ):
+            return False
+        self._probe_started = now
+        return True
+
+    def record_success(self) -> None:
+        self._state = self.CLOSED
+        self._failures = 0
+        self._probe_started = None
+
+    def record_failure(self) -> None:
+        self._failures += 1
+        if self.state == self.HALF_OPEN or self._failures >= self._failure_threshold:
+            self._state = self.OPEN
+            self._opened_at = time.monotonic()
+        self._probe_started = None
@@ -0,0 +1,448 @@
+import asyncio
+import contextvars
+import mmap
+import os
+import struct
+import threading
+import time
+import zlib
+from array import array
+from bisect import bisect_right
+from typing import Callable, Dict, Hashable, List, Optional, Tuple
+
+# Record: payload length, crc32 of the payload, offset, then the payload.
+_RECORD = struct.Struct("<IIQ")
+# Sparse index entry: offset, file position of that offset's record.
+_INDEX_ENTRY = struct.Struct("<QQ")
+LOG_SUFFIX = ".log"
+INDEX_SUFFIX = ".index"
+CLEANER_OFFSET_FILE = "cleaner-offset"
+
+
+class CorruptEventLogError(Exception):
+    pass
+
+
+class _Segment:
+    def __init__(self, directory: str, base_offset: int):
+        self.base_offset = base_offset
+        self.log_path = os.path.join(directory, f"{base_offset:020d}{LOG_SUFFIX}")
+        self.index_path = os.path.join(directory, f"{base_offset:020d}{INDEX_SUFFIX}")
+        self.size = 0
+        self.next_offset = base_offset
+        self.index_offsets = array("Q")
+        self.index_positions = array("Q")
+        self._last_indexed_position = -1
+        self._file = None
+        self._index_file = None
+        self._map: Optional[mmap.mmap] = None
+
+    def recover(self, index_interval_bytes: int) -> None:
+        # Keeps the index entries that still point at a record with the
+        # right offset, then scans forward from the last one, validating
+        # every record and truncating a torn tail left by a crash.
+        file_size = (
+            os.path.getsize(self.log_path) if os.path.exists(self.log_path) else 0
+        )
+        entries = self._read_index()
+        position = 0
+        with open(self.log_path, "ab+") as f:
+            data = (
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if file_size else b""
+            )
+            try:
+                for offset, entry_position in entries:
+                    if entry_position + _RECORD.size > file_size:
+                        break
+                    if _RECORD.unpack_from(data, entry_position)[2] != offset:
+                        break
+                    self._add_index_entry(offset, entry_position)
+                if self.index_positions:
+                    position = self.index_positions[-1]
+                    self.next_offset = self.index_offsets[-1]
+                since_index = 0
+                while position + _RECORD.size <= file_size:
+                    length, crc, offset = _RECORD.unpack_from(data, position)
+                    end = position + _RECORD.size + length
+                    if (
+                        end > file_size
+                        or zlib.crc32(data[position + _RECORD.size : end]) != crc
+                    ):
+                        break
+                    if position > self._last_indexed_position and (
+                        not self.index_positions or since_index >= index_interval_bytes
+                    ):
+                        self._add_index_entry(offset, position)
+                        since_index = 0
+                    since_index += end - position
+                    self.next_offset = offset + 1
+                    position = end
+            finally:
+                if file_size:
+                    data.close()
+            if position < file_size:
+                f.truncate(position)
+                f.flush()
+                os.fsync(f.fileno())
+        self.size = position
+        self._rewrite_index()
+
+    def open_for_append(self) -> None:
+        self._file = open(self.log_path, "ab")
+        self._index_file = open(self.index_path, "ab")
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._index_file.flush()
+            os.fsync(self._index_file.fileno())
+            self._index_file.close()
+            self._file = self._index_file = None
+        self._map = None
+
+    def append(
+        self, records: List[Tuple[int, bytes]], index_interval_bytes: int
+    ) -> None:
+        chunks = []
+        entries = []
+        position = self.size
+        since_index = position - max(self._last_indexed_position, 0)
+        for offset, payload in records:
+            if not self.index_positions or since_index >= index_interval_bytes:
+                entries.append((offset, position))
+                since_index = 0
+            record = _RECORD.pack(len(payload), zlib.crc32(payload), offset) + payload
+            chunks.append(record)
+            position += len(record)
+            since_index += len(record)
+
+        try:
+            self._file.write(b"".join(chunks))
+            self._file.flush()
+            os.fsync(self._file.fileno())
+        except Exception:
+            # Drop whatever part of the batch reached the file, so the next
+            # append starts at a record boundary again.
+            self._file.truncate(self.size)
+            raise
+        # The index is only a hint and is validated on recovery, so it is
+        # not fsynced per batch.
+        for offset, entry_position in entries:
+            self._index_file.write(_INDEX_ENTRY.pack(offset, entry_position))
+            self._add_index_entry(offset, entry_position)
+        self._index_file.flush()
+        self.next_offset = records[-1][0] + 1
+        self.size = position
+
+    def read(self, offset: int, max_records: int, size: int) -> List[Tuple[int, bytes]]:
+        if size == 0:
+            return []
+        data = self._map
+        if data is None or len(data) < size:
+            with open(self.log_path, "rb") as f:
+                data = self._map = mmap.mmap(f.fileno(), size, access=mmap.ACCESS_READ)
+        # The writer thread may be adding index entries past size meanwhile.
+        slot = min(bisect_right(self.index_offsets, offset), len(self.index_positions))
+        slot -= 1
+        while slot >= 0 and self.index_positions[slot] >= size:
+            slot -= 1
+        position = self.index_positions[slot] if slot >= 0 else 0
+
+        records = []
+        while position < size and len(records) < max_records:
+            length, crc, record_offset = _RECORD.unpack_from(data, position)
+            start = position + _RECORD.size
+            position = start + length
+            if record_offset < offset:
+                continue
+            payload = data[start:position]
+            if zlib.crc32(payload) != crc:
+                raise CorruptEventLogError(
+                    f"{self.log_path}: bad checksum at offset {record_offset}"
+                )
+            records.append((record_offset, payload))
+        return records
+
+    def scan(self) -> List[Tuple[int, bytes]]:
+        size = self.size
+        return self.read(self.base_offset, self.next_offset, size)
+
+    def _add_index_entry(self, offset: int, position: int) -> None:
+        self.index_offsets.append(offset)
+        self.index_positions.append(position)
+        self._last_indexed_position = position
+
+    def _read_index(self) -> List[Tuple[int, int]]:
+        if not os.path.exists(self.index_path):
+            return []
+        with open(self.index_path, "rb") as f:
+            data = f.read()
+        usable = len(data) - len(data) % _INDEX_ENTRY.size
+        return list(_INDEX_ENTRY.iter_unpack(data[:usable]))
+
+    def _rewrite_index(self) -> None:
+        tmp_path = f"{self.index_path}.tmp"
+        with open(tmp_path, "wb") as f:
+            for offset, position in zip(self.index_offsets, self.index_positions):
+                f.write(_INDEX_ENTRY.pack(offset, position))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.index_path)
+
+
+class EventLog:
+    # Append-only log of opaque records in size-rotated segment files named
+    # after their first offset, each with a sparse (offset, position) index
+    # entry every index_interval_bytes. Appends are group committed: every
+    # record appended within flush_interval is written and fsynced once, and
+    # append() returns the offsets once they are durable. Readers only ever
+    # see fsynced records and read segments through a memory map, starting
+    # from the nearest index entry. Closed segments are removed by retention
+    # (total size, age) and can be compacted to the latest record per key.
+    def __init__(
+        self,
+        directory: str,
+        segment_bytes: int = 64 * 1024 * 1024,
+        index_interval_bytes: int = 4096,
+        flush_interval: float = 0.002,
+        retention_bytes: Optional[int] = None,
+        retention_seconds: Optional[float] = None,
+        compaction_min_dirty_ratio: float = 0.5,
+    ):
+        self._directory = directory
+        self._segment_bytes = segment_bytes
+        self._index_interval_bytes = index_interval_bytes
+        self._flush_interval = flush_interval
+        self._retention_bytes = retention_bytes
+        self._retention_seconds = retention_seconds
+        self._compaction_min_dirty_ratio = compaction_min_dirty_ratio
+        self._buffer: List[Tuple[List[bytes], asyncio.Future]] = []
+        self._flush_task: Optional[asyncio.Task] = None
+        self._lock = threading.Lock()
+        self._maintenance_lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+        self._segments = self._recover()
+        self._segments[-1].open_for_append()
+        self._cleaner_offset_path = os.path.join(directory, CLEANER_OFFSET_FILE)
+        self._cleaner_offset = self._read_cleaner_offset()
+
+    @property
+    def start_offset(self) -> int:
+        return self._segments[0].base_offset
+
+    @property
+    def end_offset(self) -> int:
+        # Offset the next record will get; everything below it is durable.
+        return self._segments[-1].next_offset
+
+    @property
+    def segment_count(self) -> int:
+        return len(self._segments)
+
+    @property
+    def size_bytes(self) -> int:
+        return sum(segment.size for segment in self._segments)
+
+    async def append(self, payloads: List[bytes]) -> List[int]:
+        if not payloads:
+            return []
+        future = asyncio.get_running_loop().create_future()
+        self._buffer.append((payloads, future))
+        if self._flush_task is None or self._flush_task.done():
+            # Not part of the request that happened to start it, so no
+            # request context (or trace) is inherited.
+            self._flush_task = asyncio.create_task(
+                self._flush(), context=contextvars.Context()
+            )
+        return await future
+
+    def read(self, offset: int, max_records: int = 1000) -> List[Tuple[int, bytes]]:
+        # Records from offset onwards (offsets below start_offset begin at
+        # the oldest retained record). Compaction can leave gaps in offsets.
+        with self._lock:
+            segments = list(self._segments)
+        slot = max(0, bisect_right([s.base_offset for s in segments], offset) - 1)
+        records: List[Tuple[int, bytes]] = []
+        for segment in segments[slot:]:
+            size = segment.size
+            records.extend(segment.read(offset, max_records - len(records), size))
+            if len(records) >= max_records:
+                break
+        return records
+
+    async def close(self) -> None:
+        if self._flush_task is not None:
+            await self._flush_task
+        with self._lock:
+            for segment in self._segments:
+                segment.close()
+
+    def apply_retention(self, now: Optional[float] = None) -> int:
+        now = time.time() if now is None else now
+        removed = []
+        with self._maintenance_lock:
+            with self._lock:
+                total = sum(segment.size for segment in self._segments)
+                while len(self._segments) > 1:
+                    oldest = self._segments[0]
+                    too_big = (
+                        self._retention_bytes is not None
+                        and total > self._retention_bytes
+                    )
+                    too_old = (
+                        self._retention_seconds is not None
+                        and os.path.getmtime(oldest.log_path)
+                        < now - self._retention_seconds
+                    )
+                    if not (too_big or too_old):
+                        break
+                    removed.append(self._segments.pop(0))
+                    total -= oldest.size
+            for segment in removed:
+                segment.close()
+                os.remove(segment.log_path)
+                os.remove(segment.index_path)
+        return len(removed)
+
+    def compact(self, key: Callable[[bytes], Optional[Hashable]]) -> int:
+        # Removes records superseded by a newer record with the same key
+        # (records whose key is None are always kept). Offsets are preserved,
+        # so consumer positions stay valid. Like Kafka's log cleaner, only
+        # the closed segments written since the last run ("dirty") are
+        # scanned for keys, and nothing is done until they make up
+        # compaction_min_dirty_ratio of the closed bytes, so each run's cost
+        # is proportional to what was appended since the previous one.
+        with self._maintenance_lock:
+            with self._lock:
+                closed = self._segments[:-1]
+            dirty = [s for s in closed if s.base_offset >= self._cleaner_offset]
+            closed_bytes = sum(segment.size for segment in closed)
+            dirty_bytes = sum(segment.size for segment in dirty)
+            if not dirty_bytes or (
+                dirty_bytes < closed_bytes * self._compaction_min_dirty_ratio
+            ):
+                return 0
+
+            latest: Dict[Hashable, int] = {}
+            for segment in dirty:
+                for offset, payload in segment.scan():
+                    record_key = key(payload)
+                    if record_key is not None:
+                        latest[record_key] = offset
+
+            removed = 0
+            for segment in closed:
+                records = segment.scan()
+                kept = [
+                    (offset, payload)
+                    for offset, payload in records
+                    if (record_key := key(payload)) is None
+                    or latest.get(record_key, offset) <= offset
+                ]
+                if len(kept) == len(records):
+                    continue
+                removed += len(records) - len(kept)
+                if not kept:
+                    with self._lock:
+                        self._segments.remove(segment)
+                    os.remove(segment.index_path)
+                    os.remove(segment.log_path)
+                    continue
+                compacted = self._rewrite_segment(segment, kept)
+                with self._lock:
+                    self._segments[self._segments.index(segment)] = compacted
+
+            self._write_cleaner_offset(closed[-1].next_offset)
+            return removed
+
+    def _rewrite_segment(
+        self, segment: _Segment, records: List[Tuple[int, bytes]]
+    ) -> _Segment:
+        # Written beside the original and swapped in with os.replace. The
+        # index is removed first, so a crash part way only costs a rescan.
+        # The original mtime is kept because retention judges age by it.
+        original = os.stat(segment.log_path)
+        compacted = _Segment(self._directory, segment.base_offset)
+        tmp_path = f"{segment.log_path}.compacting"
+        with open(tmp_path, "wb") as f:
+            for offset, payload in records:
+                f.write(_RECORD.pack(len(payload), zlib.crc32(payload), offset))
+                f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.utime(tmp_path, ns=(original.st_atime_ns, original.st_mtime_ns))
+        os.remove(segment.index_path)
+        os.replace(tmp_path, segment.log_path)
+        compacted.recover(self._index_interval_bytes)
+        return compacted
+
+    def _read_cleaner_offset(self) -> int:
+        try:
+            with open(self._cleaner_offset_path) as f:
+                return int(f.read().strip() or 0)
+        except (FileNotFoundError, ValueError):
+            return 0
+
+    def _write_cleaner_offset(self, offset: int) -> None:
+        tmp_path = f"{self._cleaner_offset_path}.tmp"
+        with open(tmp_path, "w") as f:
+            f.write(str(offset))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self._cleaner_offset_path)
+        self._cleaner_offset = offset
+
+    def _recover(self) -> List[_Segment]:
+        base_offsets = sorted(
+            int(name[: -len(LOG_SUFFIX)])
+            for name in os.listdir(self._directory)
+            if name.endswith(LOG_SUFFIX)
+        )
+        segments = []
+        for base_offset in base_offsets or [0]:
+            segment = _Segment(self._directory, base_offset)
+            segment.recover(self._index_interval_bytes)
+            segments.append(segment)
+        return segments
+
+    async def _flush(self) -> None:
+        while self._buffer:
+            await asyncio.sleep(self._flush_interval)
+            batch, self._buffer = self._buffer, []
+            offset = self.end_offset
+            records = []
+            results = []
+            for payloads, _ in batch:
+                results.append(list(range(offset, offset + len(payloads))))
+                records.extend(zip(results[-1], payloads))
+                offset += len(payloads)
+            try:
+                await asyncio.to_thread(self._write, records)
+            except Exception as e:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+
+            for (_, future), offsets in zip(batch, results):
+                if not future.done():
+                    future.set_result(offsets)
+
+    def _write(self, records: List[Tuple[int, bytes]]) -> None:
+        start = 0
+        while start < len(records):
+            active = self._segments[-1]
+            if active.size >= self._segment_bytes:
+                active.close()
+                active = _Segment(self._directory, active.next_offset)
+                active.open_for_append()
+                with self._lock:
+                    self._segments.append(active)
+            # Fill the active segment up to segment_bytes, then rotate.
+            room = self._segment_bytes - active.size
+            end = start
+            while end < len(records) and (end == start or room > 0):
+                room -= _RECORD.size + len(records[end][1])
+                end += 1
+            active.append(records[start:end], self._index_interval_bytes)
+            start = end
@@ -0,0 +1,143 @@
+import asyncio
+import dataclasses
+import typing
+from datetime import datetime
+from enum import Enum
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Hashable,
+    List,
+    Optional,
+    Tuple,
+    Type,
+)
+
+import orjson
+
+from src.domain import DomainEvent
+from src.domain.event_dispatcher import EventDispatcher, EventHandler, notify_handlers
+from src.infrastructure.event_log import EventLog
+from src.observability import MetricsRegistry
+
+_Decoder = Tuple[Type[DomainEvent], Dict[str, Optional[Callable[[Any], Any]]]]
+_DECODERS: Dict[str, _Decoder] = {}
+
+
+def _converter(hint) -> Optional[Callable[[Any], Any]]:
+    if hint is datetime:
+        return datetime.fromisoformat
+    if isinstance(hint, type) and issubclass(hint, Enum):
+        return hint
+    return None
+
+
+def _decoder(name: str) -> Optional[_Decoder]:
+    # Per event type: the class and a converter for each field that JSON
+    # does not round-trip (datetimes, enums). Built once per type.
+    if name not in _DECODERS:
+        pending = [DomainEvent]
+        while pending:
+            cls = pending.pop()
+            pending.extend(cls.__subclasses__())
+            if cls.__name__ in _DECODERS:
+                continue
+            hints = typing.get_type_hints(cls)
+            converters = {
+                field.name: _converter(hints.get(field.name))
+                for field in dataclasses.fields(cls)
+            }
+            _DECODERS[cls.__name__] = (cls, converters)
+    return _DECODERS.get(name)
+
+
+def encode_event(event: DomainEvent) -> bytes:
+    return orjson.dumps({"type": type(event).__name__, "data": event.__dict__})
+
+
+def decode_event(payload: bytes) -> Optional[DomainEvent]:
+    # Event types this process does not know (written by a newer version)
+    # decode to None and are skipped by readers.
+    document = orjson.loads(payload)
+    decoder = _decoder(document["type"])
+    if decoder is None:
+        return None
+    cls, converters = decoder
+    values = {}
+    for name, value in document["data"].items():
+        if name not in converters:
+            continue
+        converter = converters[name]
+        values[name] = converter(value) if converter is not None else value
+    return cls(**values)
+
+
+def event_compaction_key(payload: bytes) -> Optional[Hashable]:
+    # Compaction keeps the latest event of each type per product, which is
+    # enough to rebuild per-product state (search index, caches) but not
+    # counters such as the catalogue stats.
+    document = orjson.loads(payload)
+    product_id = document["data"].get("product_id")
+    return (document["type"], product_id) if product_id else None
+
+
+class EventLogDispatcher(EventDispatcher):
+    # Appends every event to the durable event log before notifying the
+    # in-process handlers, so projections can be rebuilt and downstream
+    # consumers can catch up by reading the log from any offset.
+    def __init__(self, log: EventLog, metrics: Optional[MetricsRegistry] = None):
+        self._log = log
+        self._metrics = metrics or MetricsRegistry()
+        self._handlers: List[EventHandler] = []
+
+    @property
+    def log(self) -> EventLog:
+        return self._log
+
+    def subscribe(self, handler: EventHandler) -> None:
+        self._handlers.append(handler)
+
+    async def dispatch(self, event: DomainEvent) -> None:
+        await self.dispatch_all([event])
+
+    async def dispatch_all(self, events: List[DomainEvent]) -> None:
+        if not events:
+            return
+        # Events are dispatched after commit; a failed append is reported
+        # but must not turn the committed request into an error. Those
+        # events (and any lost to a crash between commit and append) are
+        # missing from the log, so replay does not see them; the
+        # event_log_append_failures counter is what reveals the gap.
+        try:
+            await self._log.append([encode_event(event) for event in events])
+        except Exception as e:
+            self._metrics.increment("event_log_append_failures", len(events))
+            print(f"[EVENT LOG APPEND FAILED] {len(events)} events: {e!r}")
+        for event in events:
+            await notify_handlers(self._handlers, event)
+
+    async def read_from(
+        self, offset: int = 0, batch_size: int = 1000
+    ) -> AsyncIterator[Tuple[int, DomainEvent]]:
+        # Everything durable from offset up to the current end of the log.
+        while True:
+            records = await asyncio.to_thread(self._log.read, offset, batch_size)
+            if not records:
+                return
+            for record_offset, payload in records:
+                event = decode_event(payload)
+                if event is not None:
+                    yield record_offset, event
+            offset = records[-1][0] + 1
+
+    async def replay(
+        self, handler: EventHandler, offset: int = 0, batch_size: int = 1000
+    ) -> int:
+        # Feeds the log from offset into handler and returns the offset to
+        # resume from.
+        async for record_offset, event in self.read_from(offset, batch_size):
+            await handler(event)
+            offset = record_offset + 1
+        return offset
@@ -0,0 +1,260 @@
+import copy
+import uuid
+from bisect import bisect_right
+from datetime import datetime
+from typing import AsyncIterator, Dict, List, Optional
+
+from src.domain import Product
+from src.domain.repositories import (
+    ProductRepository,
+    VerificationRepository,
+    CheckpointRepository,
+)
+from src.infrastructure.unit_of_work import UnitOfWork
+
+
+class InMemoryStore:
+    # Process-local stand-in for MySQL and Mongo, used for local runs and
+    # load tests without the docker-compose stack. Nothing is persisted.
+    def __init__(self):
+        self.products: Dict[str, Product] = {}
+        self.product_ids: List[str] = []
+        self.reserved: Dict[str, int] = {}
+        self.verifications: List[dict] = []
+        self.latest_verifications: Dict[str, dict] = {}
+        self.checkpoints: Dict[str, dict] = {}
+
+
+def _copy(product: Product) -> Product:
+    return Product(
+        product_id=product.product_id,
+        name=product.name,
+        price=product.price,
+        currency=product.currency,
+        category=product.category,
+        stock_quantity=product.stock_quantity,
+        assets=list(product.assets),
+        status=product.status,
+        created_at=product.created_at,
+        updated_at=product.updated_at,
+        version=product.version,
+        verification_policy_version=product.verification_policy_version,
+        verification_hash=product.verification_hash,
+    )
+
+
+class InMemoryProductRepository(ProductRepository):
+    # Writes are staged per unit of work and applied on commit, like the
+    # MySQL session. Stock adjustments apply immediately, matching the single
+    # conditional UPDATE they stand in for.
+    def __init__(self, store: InMemoryStore, staged: Dict[str, Product]):
+        self._store = store
+        self._staged = staged
+
+    async def save(self, product: Product) -> None:
+        self._staged[product.product_id] = _copy(product)
+
+    async def find_by_id(self, product_id: str) -> Optional[Product]:
+        product = self._current(product_id)
+        return _copy(product) if product is not None else None
+
+    async def get_version(self, product_id: str) -> Optional[int]:
+        product = self._current(product_id)
+        return product.version if product is not None else None
+
+    async def update(self, product: Product) -> None:
+        current = self._current(product.product_id)
+        if current is None:
+            return
+        product.version = current.version + 1
+        self._staged[product.product_id] = _copy(product)
+
+    async def reserve_stock(self, product_id: str, quantity: int) -> bool:
+        product = self._current(product_id)
+        if product is None or product.stock_quantity < quantity:
+            return False
+        self._adjust_stock(product_id, -quantity)
+        return True
+
+    async def release_stock(self, product_id: str, quantity: int) -> bool:
+        product = self._current(product_id)
+        if product is None or self._store.reserved.get(product_id, 0) < quantity:
+            return False
+        self._adjust_stock(product_id, quantity)
+        return True
+
+    async def list_page(self, after_id: Optional[str], limit: int) -> List[Product]:
+        product_ids = self._store.product_ids
+        start = 0 if after_id is None else bisect_right(product_ids, after_id)
+        return [
+            _copy(self._store.products[product_id])
+            for product_id in product_ids[start : start + limit]
+        ]
+
+    async def bulk_update_verification(self, products: List[Product]) -> None:
+        for product in products:
+            await self.update(product)
+
+    def _current(self, product_id: str) -> Optional[Product]:
+        product = self._staged.get(product_id)
+        return product if product is not None else self._store.products.get(product_id)
+
+    def _adjust_stock(self, product_id: str, delta: int) -> None:
+        reserved = self._store.reserved
+        reserved[product_id] = reserved.get(product_id, 0) - delta
+        now = datetime.utcnow()
+        for product in (
+            self._store.products.get(product_id),
+            self._staged.get(product_id),
+        ):
+            if product is not None:
+                product.stock_quantity += delta
+                product.version += 1
+                product.updated_at = now
+
+
+class InMemoryVerificationRepository(VerificationRepository):
+    # Like Mongo, verification records are not part of the MySQL transaction
+    # and are visible as soon as they are written.
+    def __init__(self, store: InMemoryStore):
+        self._store = store
+
+    async def save_verification(
+        self,
+        product_id: str,
+        checks: dict,
+        reasons: List[str],
+        verified_at: datetime,
+        policy_version: Optional[str] = None,
+    ) -> None:
+        document = {
+            "product_id": product_id,
+            "checks": checks,
+            "reasons": reasons,
+            "verified_at": verified_at,
+        }
+        if policy_version is not None:
+            document["policy_version"] = policy_version
+        await self.save_verifications([document])
+
+    async def save_verifications(self, records: List[dict]) -> None:
+        latest = self._store.latest_verifications
+        for record in records:
+            record = dict(record)
+            record.setdefault("_id", uuid.uuid4().hex)
+            self._store.verifications.append(record)
+            previous = latest.get(record["product_id"])
+            if previous is None or record["verified_at"] >= previous["verified_at"]:
+                latest[record["product_id"]] = record
+
+    async def find_by_product_id(self, product_id: str) -> Optional[dict]:
+        document = self._store.latest_verifications.get(product_id)
+        if document is None:
+            return None
+        document = dict(document)
+        document.pop("_id", None)
+        return document
+
+    async def iter_verifications(self, batch_size: int) -> AsyncIterator[dict]:
+        for document in list(self._store.verifications):
+            document = dict(document)
+            document.pop("_id", None)
+            yield document
+
+    async def find_history(
+        self,
+        product_id: str,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        limit: Optional[int] = None,
+    ) -> List[dict]:
+        history = [
+            dict(document)
+            for document in self._store.verifications
+            if document["product_id"] == product_id
+            and (since is None or document["verified_at"] >= since)
+            and (until is None or document["verified_at"] < until)
+        ]
+        for document in history:
+            document.pop("_id", None)
+        history.sort(key=lambda document: document["verified_at"], reverse=True)
+        return history[:limit] if limit is not None else history
+
+    async def iter_verifications_before(
+        self, cutoff: datetime, batch_size: int
+    ) -> AsyncIterator[dict]:
+        for document in list(self._store.verifications):
+            if document["verified_at"] < cutoff:
+                yield dict(document)
+
+    async def delete_verifications(self, record_ids: List) -> int:
+        record_ids = set(record_ids)
+        kept = [
+            document
+            for document in self._store.verifications
+            if document["_id"] not in record_ids
+        ]
+        deleted = len(self._store.verifications) - len(kept)
+        self._store.verifications = kept
+        latest = {}
+        for document in kept:
+            previous = latest.get(document["product_id"])
+            if previous is None or document["verified_at"] >= previous["verified_at"]:
+                latest[document["product_id"]] = document
+        self._store.latest_verifications = latest
+        return deleted
+
+
+class InMemoryCheckpointRepository(CheckpointRepository):
+    def __init__(self, store: InMemoryStore):
+        self._store = store
+
+    async def load(self, name: str) -> Optional[dict]:
+        return copy.deepcopy(self._store.checkpoints.get(name))
+
+    async def save(self, name: str, state: dict) -> None:
+        self._store.checkpoints[name] = copy.deepcopy(state)
+
+
+class InMemoryUnitOfWork(UnitOfWork):
+    def __init__(self, store: InMemoryStore):
+        self._store = store
+        self._staged: Dict[str, Product] = {}
+
+    async def __aenter__(self):
+        self._staged = {}
+        self.products = InMemoryProductRepository(self._store, self._staged)
+        self.verifications = InMemoryVerificationRepository(self._store)
+        self.checkpoints = InMemoryCheckpointRepository(self._store)
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.rollback()
+
+    async def commit(self):
+        store = self._store
+        new_ids = sorted(
+            product_id
+            for product_id in self._staged
+            if product_id not in store.products
+        )
+        for product_id, product in self._staged.items():
+            stored = store.products.get(product_id)
+            if stored is not None:
+                # Like the targeted UPDATE in MySQL, staged updates never
+                # carry stock: it only changes through reserve/release, which
+                # may have committed since this unit of work read the row.
+                product.stock_quantity = stored.stock_quantity
+                product.version = stored.version + 1
+        store.products.update(self._staged)
+        self._staged.clear()
+        if not new_ids:
+            return
+        # Ids are time ordered, so new products almost always append.
+        if not store.product_ids or new_ids[0] > store.product_ids[-1]:
+            store.product_ids.extend(new_ids)
+        else:
+            store.product_ids = sorted({*store.product_ids, *new_ids})
+
+    async def rollback(self):
+        self._staged.clear()
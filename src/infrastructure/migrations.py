@@ -0,0 +1,132 @@
+from typing import List
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.schema import CreateColumn
+
+from src.infrastructure.mysql_models import ProductModel
+
+
+async def _product_id_column_type(engine: AsyncEngine) -> str:
+    async with engine.connect() as conn:
+        result = await conn.execute(
+            text(
+                "SELECT DATA_TYPE FROM information_schema.COLUMNS "
+                "WHERE TABLE_SCHEMA = DATABASE() "
+                "AND TABLE_NAME = 'products' AND COLUMN_NAME = :column"
+            ),
+            {"column": "id"},
+        )
+        return (result.scalar_one_or_none() or "").lower()
+
+
+async def _has_column(engine: AsyncEngine, column: str) -> bool:
+    async with engine.connect() as conn:
+        result = await conn.execute(
+            text(
+                "SELECT COUNT(*) FROM information_schema.COLUMNS "
+                "WHERE TABLE_SCHEMA = DATABASE() "
+                "AND TABLE_NAME = 'products' AND COLUMN_NAME = :column"
+            ),
+            {"column": column},
+        )
+        return result.scalar_one() > 0
+
+
+async def migrate_product_ids_to_binary(
+    engine: AsyncEngine, chunk_size: int = 10_000
+) -> int:
+    # Converts products.id from CHAR/VARCHAR(36) to BINARY(16) in place. The
+    # canonical string of every existing id is preserved, so Mongo
+    # verifications.product_id references stay valid. Safe to re-run after a
+    # crash: the backfill is idempotent and the final ALTER is atomic.
+    column_type = await _product_id_column_type(engine)
+    if column_type in ("", "binary"):
+        return 0
+
+    if not await _has_column(engine, "id_bin"):
+        async with engine.begin() as conn:
+            await conn.execute(
+                text("ALTER TABLE products ADD COLUMN id_bin BINARY(16) NULL")
+            )
+
+    # Keyset-paginated backfill over the existing primary key, one short
+    # transaction per chunk, so the table is never scanned more than once.
+    backfilled = 0
+    last_id = ""
+    while True:
+        async with engine.begin() as conn:
+            result = await conn.execute(
+                text(
+                    "SELECT id FROM products WHERE id > :last_id "
+                    "ORDER BY id LIMIT 1 OFFSET :offset"
+                ),
+                {"last_id": last_id, "offset": chunk_size - 1},
+            )
+            upper_id = result.scalar_one_or_none()
+
+            if upper_id is None:
+                result = await conn.execute(
+                    text(
+                        "UPDATE products SET id_bin = UUID_TO_BIN(id) "
+                        "WHERE id > :last_id"
+                    ),
+                    {"last_id": last_id},
+                )
+                backfilled += result.rowcount
+                break
+
+            result = await conn.execute(
+                text(
+                    "UPDATE products SET id_bin = UUID_TO_BIN(id) "
+                    "WHERE id > :last_id AND id <= :upper_id"
+                ),
+                {"last_id": last_id, "upper_id": upper_id},
+            )
+            backfilled += result.rowcount
+            last_id = upper_id
+
+    # Rows inserted while the backfill ran still have a NULL id_bin. Writers
+    # are blocked by the table lock from the catch-up below until the ALTER
+    # has swapped the columns, so none can slip in between the two; the
+    # ALTER rebuilds the table, so writes stall for its duration.
+    async with engine.connect() as conn:
+        await conn.execute(text("LOCK TABLES products WRITE"))
+        try:
+            result = await conn.execute(
+                text(
+                    "UPDATE products SET id_bin = UUID_TO_BIN(id) "
+                    "WHERE id_bin IS NULL"
+                )
+            )
+            backfilled += result.rowcount
+            await conn.execute(
+                text(
+                    "ALTER TABLE products "
+                    "DROP PRIMARY KEY, "
+                    "DROP COLUMN id, "
+                    "CHANGE COLUMN id_bin id BINARY(16) NOT NULL FIRST, "
+                    "ADD PRIMARY KEY (id)"
+                )
+            )
+        finally:
+            await conn.execute(text("UNLOCK TABLES"))
+
+    return backfilled
+
+
+async def add_missing_product_columns(engine: AsyncEngine) -> List[str]:
+    # create_all() never alters existing tables, so columns added to
+    # ProductModel after a database was created are added here.
+    table = ProductModel.__table__
+    added = []
+    for column in table.columns:
+        if await _has_column(engine, column.name):
+            continue
+        async with engine.begin() as conn:
+            column_ddl = CreateColumn(column).compile(dialect=conn.dialect)
+            await conn.execute(
+                text(f"ALTER TABLE {table.name} ADD COLUMN {column_ddl}")
+            )
+        added.append(column.name)
+    return added
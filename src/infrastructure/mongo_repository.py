@@ -1,21 +1,48 @@
-from typing import Optional, List
+import asyncio
+from typing import Optional, List, AsyncIterator
 from datetime import datetime
 from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import ASCENDING, DESCENDING
+from pymongo.errors import BulkWriteError
 
-from src.domain.repositories import VerificationRepository
+from src.domain.repositories import VerificationRepository, CheckpointRepository
+from src.observability import traced, tracer
+from src.observability.tracing import SPAN_KIND_CLIENT
+
+DUPLICATE_KEY_ERROR = 11000
+
+
+def _mongo_span(collection: str, operation: str):
+    return tracer.span(
+        f"mongodb {operation}",
+        {
+            "db.system": "mongodb",
+            "db.operation": operation,
+            "db.mongodb.collection": collection,
+        },
+        SPAN_KIND_CLIENT,
+    )
 
 
 class MongoVerificationRepository(VerificationRepository):
-    def __init__(self, client: AsyncIOMotorClient, database: str):
+    def __init__(
+        self,
+        client: AsyncIOMotorClient,
+        database: str,
+        operation_timeout: Optional[float] = None,
+    ):
         self._db = client[database]
         self._collection = self._db["verifications"]
+        self._operation_timeout = operation_timeout
 
+    @traced("repository")
     async def save_verification(
         self,
         product_id: str,
         checks: dict,
         reasons: List[str],
         verified_at: datetime,
+        policy_version: Optional[str] = None,
     ) -> None:
         document = {
             "product_id": product_id,
@@ -23,10 +50,110 @@ class MongoVerificationRepository(VerificationRepository):
             "reasons": reasons,
             "verified_at": verified_at,
         }
-        await self._collection.insert_one(document)
+        if policy_version is not None:
+            document["policy_version"] = policy_version
+        await self._with_deadline("insert_one", self._collection.insert_one(document))
 
+    @traced("repository")
+    async def save_verifications(self, records: List[dict]) -> None:
+        if not records:
+            return
+        try:
+            await self._with_deadline(
+                "insert_many", self._collection.insert_many(records, ordered=False)
+            )
+        except BulkWriteError as e:
+            # Records that carry their own _id may be inserted again when a
+            # batch is retried; those duplicates are already stored.
+            errors = e.details.get("writeErrors", [])
+            if any(error.get("code") != DUPLICATE_KEY_ERROR for error in errors):
+                raise
+
+    @traced("repository")
     async def find_by_product_id(self, product_id: str) -> Optional[dict]:
-        document = await self._collection.find_one({"product_id": product_id})
+        document = await self._with_deadline(
+            "find_one",
+            self._collection.find_one(
+                {"product_id": product_id}, sort=[("verified_at", -1)]
+            ),
+        )
         if document:
             document.pop("_id", None)
         return document
+
+    async def iter_verifications(self, batch_size: int) -> AsyncIterator[dict]:
+        cursor = self._collection.find({}, {"_id": 0}).batch_size(batch_size)
+        async for document in cursor:
+            yield document
+
+    @traced("repository")
+    async def find_history(
+        self,
+        product_id: str,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        limit: Optional[int] = None,
+    ) -> List[dict]:
+        query = {"product_id": product_id}
+        verified_at = {}
+        if since is not None:
+            verified_at["$gte"] = since
+        if until is not None:
+            verified_at["$lt"] = until
+        if verified_at:
+            query["verified_at"] = verified_at
+        cursor = self._collection.find(query, {"_id": 0}).sort("verified_at", -1)
+        if limit is not None:
+            cursor = cursor.limit(limit)
+        return await self._with_deadline("find", cursor.to_list(length=None))
+
+    async def iter_verifications_before(
+        self, cutoff: datetime, batch_size: int
+    ) -> AsyncIterator[dict]:
+        cursor = self._collection.find({"verified_at": {"$lt": cutoff}}).batch_size(
+            batch_size
+        )
+        async for document in cursor:
+            yield document
+
+    async def delete_verifications(self, record_ids: List) -> int:
+        if not record_ids:
+            return 0
+        result = await self._with_deadline(
+            "delete_many", self._collection.delete_many({"_id": {"$in": record_ids}})
+        )
+        return result.deleted_count
+
+    async def ensure_indexes(self) -> None:
+        # Latest/history lookups by product, and the archival range scan.
+        await self._collection.create_index(
+            [("product_id", ASCENDING), ("verified_at", DESCENDING)]
+        )
+        await self._collection.create_index([("verified_at", ASCENDING)])
+
+    async def _with_deadline(self, name: str, operation):
+        with _mongo_span(self._collection.name, name):
+            if self._operation_timeout is None:
+                return await operation
+            return await asyncio.wait_for(operation, self._operation_timeout)
+
+
+class MongoCheckpointRepository(CheckpointRepository):
+    def __init__(self, client: AsyncIOMotorClient, database: str):
+        self._db = client[database]
+        self._collection = self._db["checkpoints"]
+
+    async def load(self, name: str) -> Optional[dict]:
+        with _mongo_span(self._collection.name, "find_one"):
+            document = await self._collection.find_one({"_id": name})
+        if document is None:
+            return None
+        return document["state"]
+
+    async def save(self, name: str, state: dict) -> None:
+        with _mongo_span(self._collection.name, "replace_one"):
+            await self._collection.replace_one(
+                {"_id": name},
+                {"_id": name, "state": state, "saved_at": datetime.utcnow()},
+                upsert=True,
+            )
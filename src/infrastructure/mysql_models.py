@@ -1,8 +1,11 @@
 from sqlalchemy import Column, String, Float, Integer, DateTime, Enum as SQLEnum, JSON
 from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.types import BINARY, TypeDecorator
 from datetime import datetime
 import enum
 
+from src.domain.product_id import product_id_to_bytes, product_id_from_bytes
+
 Base = declarative_base()
 
 
@@ -12,15 +15,34 @@ class ProductStatusEnum(str, enum.Enum):
     REJECTED = "rejected"
 
 
+class BinaryUUID(TypeDecorator):
+    # Canonical UUID strings stored as BINARY(16) without byte swapping, so the
+    # layout matches MySQL's UUID_TO_BIN(id) / BIN_TO_UUID(id).
+    impl = BINARY(16)
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        return product_id_to_bytes(value)
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        return product_id_from_bytes(value)
+
+
 class ProductModel(Base):
     __tablename__ = "products"
 
-    id = Column(String(36), primary_key=True)
+    id = Column(BinaryUUID, primary_key=True)
     name = Column(String(255), nullable=False)
     price = Column(Float, nullable=False)
     currency = Column(String(10), nullable=False)
     category = Column(String(255), nullable=False)
     stock_quantity = Column(Integer, nullable=False)
+    # Units currently held by reservations; releases cannot exceed it.
+    reserved_quantity = Column(Integer, nullable=False, default=0, server_default="0")
     assets = Column(JSON, nullable=False)
     status = Column(
         SQLEnum(ProductStatusEnum),
@@ -31,3 +53,8 @@ class ProductModel(Base):
     updated_at = Column(
         DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow
     )
+    version = Column(Integer, nullable=False, default=1, server_default="1")
+    verification_policy_version = Column(String(32), nullable=True)
+    verification_hash = Column(String(64), nullable=True)
+
+    __mapper_args__ = {"version_id_col": version}
@@ -1,16 +1,20 @@
-from typing import Optional
+from typing import Optional, List
+from datetime import datetime
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, update, bindparam
 
 from src.domain import Product, ProductStatus
+from src.domain.product_id import is_valid_product_id
 from src.domain.repositories import ProductRepository
-from src.infrastructure.mysql_models import ProductModel
+from src.infrastructure.mysql_models import ProductModel, ProductStatusEnum
+from src.observability import traced
 
 
 class MySQLProductRepository(ProductRepository):
     def __init__(self, session: AsyncSession):
         self._session = session
 
+    @traced("repository")
     async def save(self, product: Product) -> None:
         model = ProductModel(
             id=product.product_id,
@@ -23,11 +27,17 @@ class MySQLProductRepository(ProductRepository):
             status=product.status.value,
             created_at=product.created_at,
             updated_at=product.updated_at,
+            verification_policy_version=product.verification_policy_version,
+            verification_hash=product.verification_hash,
         )
         self._session.add(model)
         await self._session.flush()
 
+    @traced("repository")
     async def find_by_id(self, product_id: str) -> Optional[Product]:
+        if not is_valid_product_id(product_id):
+            return None
+
         result = await self._session.execute(
             select(ProductModel).where(ProductModel.id == product_id)
         )
@@ -36,6 +46,121 @@ class MySQLProductRepository(ProductRepository):
         if model is None:
             return None
 
+        return self._to_domain(model)
+
+    @traced("repository")
+    async def get_version(self, product_id: str) -> Optional[int]:
+        if not is_valid_product_id(product_id):
+            return None
+
+        result = await self._session.execute(
+            select(ProductModel.version).where(ProductModel.id == product_id)
+        )
+        return result.scalar_one_or_none()
+
+    @traced("repository")
+    async def update(self, product: Product) -> None:
+        # A targeted UPDATE rather than a flush of the loaded row: stock is
+        # only ever changed by the conditional reserve/release statements, so
+        # a reservation committed since find_by_id neither conflicts with
+        # this write nor is overwritten by the stock value read earlier.
+        table = ProductModel.__table__
+        result = await self._session.execute(
+            update(table)
+            .where(table.c.id == product.product_id)
+            .values(
+                name=product.name,
+                price=product.price,
+                currency=product.currency,
+                category=product.category,
+                assets=product.assets,
+                status=ProductStatusEnum(product.status.value),
+                updated_at=product.updated_at,
+                verification_policy_version=product.verification_policy_version,
+                verification_hash=product.verification_hash,
+                version=table.c.version + 1,
+            )
+        )
+        if result.rowcount == 1:
+            product.version = await self.get_version(product.product_id)
+
+    @traced("repository")
+    async def reserve_stock(self, product_id: str, quantity: int) -> bool:
+        # Single conditional UPDATE: the row lock is held only for the
+        # statement itself and concurrent reservations can never oversell.
+        return await self._adjust_stock(
+            product_id,
+            -quantity,
+            ProductModel.stock_quantity >= quantity,
+        )
+
+    @traced("repository")
+    async def release_stock(self, product_id: str, quantity: int) -> bool:
+        # Only units held by earlier reservations can be returned.
+        return await self._adjust_stock(
+            product_id,
+            quantity,
+            ProductModel.reserved_quantity >= quantity,
+        )
+
+    async def _adjust_stock(self, product_id: str, delta: int, *conditions) -> bool:
+        if not is_valid_product_id(product_id):
+            return False
+
+        result = await self._session.execute(
+            update(ProductModel)
+            .where(ProductModel.id == product_id, *conditions)
+            .values(
+                stock_quantity=ProductModel.stock_quantity + delta,
+                reserved_quantity=ProductModel.reserved_quantity - delta,
+                version=ProductModel.version + 1,
+                updated_at=datetime.utcnow(),
+            )
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount == 1
+
+    @traced("repository")
+    async def bulk_update_verification(self, products: List[Product]) -> None:
+        # One executemany round trip for a whole chunk instead of a
+        # SELECT + UPDATE per product through the ORM.
+        if not products:
+            return
+
+        table = ProductModel.__table__
+        await self._session.execute(
+            update(table)
+            .where(table.c.id == bindparam("b_id"))
+            .values(
+                status=bindparam("b_status"),
+                verification_policy_version=bindparam("b_policy_version"),
+                verification_hash=bindparam("b_hash"),
+                updated_at=bindparam("b_updated_at"),
+                version=table.c.version + 1,
+            ),
+            [
+                {
+                    "b_id": product.product_id,
+                    "b_status": ProductStatusEnum(product.status.value),
+                    "b_policy_version": product.verification_policy_version,
+                    "b_hash": product.verification_hash,
+                    "b_updated_at": product.updated_at,
+                }
+                for product in products
+            ],
+        )
+
+    @traced("repository")
+    async def list_page(self, after_id: Optional[str], limit: int) -> List[Product]:
+        query = select(ProductModel).order_by(ProductModel.id).limit(limit)
+        if after_id is not None:
+            query = query.where(ProductModel.id > after_id)
+
+        result = await self._session.execute(query)
+        return [self._to_domain(model) for model in result.scalars()]
+
+    @staticmethod
+    def _to_domain(model: ProductModel) -> Product:
         return Product(
             product_id=model.id,
             name=model.name,
@@ -47,21 +172,7 @@ class MySQLProductRepository(ProductRepository):
             status=ProductStatus(model.status.value),
             created_at=model.created_at,
             updated_at=model.updated_at,
+            version=model.version,
+            verification_policy_version=model.verification_policy_version,
+            verification_hash=model.verification_hash,
         )
-
-    async def update(self, product: Product) -> None:
-        result = await self._session.execute(
-            select(ProductModel).where(ProductModel.id == product.product_id)
-        )
-        model = result.scalar_one_or_none()
-
-        if model:
-            model.name = product.name
-            model.price = product.price
-            model.currency = product.currency
-            model.category = product.category
-            model.stock_quantity = product.stock_quantity
-            model.assets = product.assets
-            model.status = product.status.value
-            model.updated_at = product.updated_at
-            await self._session.flush()
@@ -0,0 +1,159 @@
+import asyncio
+import time
+import uuid
+from datetime import datetime
+from typing import AsyncIterator, Awaitable, List, Optional, TypeVar
+
+from pymongo.errors import PyMongoError
+
+from src.domain.repositories import (
+    VerificationRepository,
+    VerificationStoreUnavailableError,
+)
+from src.infrastructure.circuit_breaker import CircuitBreaker
+from src.infrastructure.verification_spool import VerificationSpool
+from src.observability import MetricsRegistry
+
+MONGO_ERRORS = (asyncio.TimeoutError, PyMongoError)
+
+T = TypeVar("T")
+
+
+class ResilientVerificationRepository(VerificationRepository):
+    # Verification records are an audit trail, so a slow or unavailable Mongo
+    # must not block product state transitions in MySQL. Writes go through a
+    # circuit breaker and fall back to the local spool, which is replayed in
+    # bulk once Mongo recovers. Reads share the breaker: while it is open
+    # they fail at once instead of waiting out the Mongo timeout.
+    def __init__(
+        self,
+        repository: VerificationRepository,
+        breaker: CircuitBreaker,
+        spool: VerificationSpool,
+        metrics: Optional[MetricsRegistry] = None,
+    ):
+        self._repository = repository
+        self._breaker = breaker
+        self._spool = spool
+        self._metrics = metrics or MetricsRegistry()
+
+    async def save_verification(
+        self,
+        product_id: str,
+        checks: dict,
+        reasons: List[str],
+        verified_at: datetime,
+        policy_version: Optional[str] = None,
+    ) -> None:
+        document = {
+            "product_id": product_id,
+            "checks": checks,
+            "reasons": reasons,
+            "verified_at": verified_at,
+        }
+        if policy_version is not None:
+            document["policy_version"] = policy_version
+        await self.save_verifications([document])
+
+    async def save_verifications(self, records: List[dict]) -> None:
+        if not records:
+            return
+        # Every record gets a string id before the first attempt: pymongo
+        # would otherwise add an ObjectId in place (which the spool cannot
+        # store), and a batch partly inserted before a timeout is
+        # deduplicated when the spooled copy is replayed.
+        for record in records:
+            record.setdefault("_id", uuid.uuid4().hex)
+        if self._breaker.allow():
+            try:
+                await self._repository.save_verifications(records)
+                self._breaker.record_success()
+                return
+            except MONGO_ERRORS as e:
+                self._breaker.record_failure()
+                self._metrics.increment("verification_mongo_failures")
+                print(f"[VERIFICATION WRITE SPOOLED] {e!r}")
+
+        await self._spool.append(records)
+        self._metrics.increment("verification_records_spooled", len(records))
+
+    async def find_by_product_id(self, product_id: str) -> Optional[dict]:
+        self._check_readable()
+        return await self._read(self._repository.find_by_product_id(product_id))
+
+    async def iter_verifications(self, batch_size: int) -> AsyncIterator[dict]:
+        self._check_readable()
+        try:
+            async for document in self._repository.iter_verifications(batch_size):
+                yield document
+        except MONGO_ERRORS as e:
+            raise self._read_failed(e) from e
+
+    async def find_history(
+        self,
+        product_id: str,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        limit: Optional[int] = None,
+    ) -> List[dict]:
+        self._check_readable()
+        return await self._read(
+            self._repository.find_history(product_id, since, until, limit)
+        )
+
+    async def iter_verifications_before(
+        self, cutoff: datetime, batch_size: int
+    ) -> AsyncIterator[dict]:
+        async for document in self._repository.iter_verifications_before(
+            cutoff, batch_size
+        ):
+            yield document
+
+    async def delete_verifications(self, record_ids: List) -> int:
+        return await self._repository.delete_verifications(record_ids)
+
+    def _check_readable(self) -> None:
+        if self._breaker.state == CircuitBreaker.OPEN:
+            self._metrics.increment("verification_reads_rejected")
+            raise VerificationStoreUnavailableError("verification store circuit open")
+
+    async def _read(self, operation: Awaitable[T]) -> T:
+        try:
+            result = await operation
+        except MONGO_ERRORS as e:
+            raise self._read_failed(e) from e
+        self._breaker.record_success()
+        return result
+
+    def _read_failed(self, error: Exception) -> VerificationStoreUnavailableError:
+        self._breaker.record_failure()
+        self._metrics.increment("verification_mongo_failures")
+        return VerificationStoreUnavailableError(repr(error))
+
+    async def replay_spool(self, batch_size: int = 1000) -> int:
+        if not self._spool.pending or not self._breaker.allow():
+            return 0
+        if not await self._spool.start_replay():
+            self._breaker.record_success()
+            return 0
+
+        started = time.perf_counter()
+        replayed = 0
+        try:
+            for batch in self._spool.replay_batches(batch_size):
+                await self._repository.save_verifications(batch)
+                replayed += len(batch)
+                self._metrics.increment("verification_records_replayed", len(batch))
+        except MONGO_ERRORS as e:
+            self._breaker.record_failure()
+            print(f"[VERIFICATION SPOOL REPLAY FAILED] {e!r}")
+            return replayed
+
+        self._breaker.record_success()
+        await self._spool.finish_replay()
+        elapsed = time.perf_counter() - started
+        if elapsed > 0:
+            self._metrics.set_gauge(
+                "verification_spool_replay_records_per_second", replayed / elapsed
+            )
+        return replayed
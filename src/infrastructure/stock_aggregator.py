@@ -0,0 +1,116 @@
+import asyncio
+import contextvars
+from typing import Dict, List, Optional, Tuple
+
+from src.domain.repositories import StockRepository
+from src.infrastructure.mysql_repository import MySQLProductRepository
+
+_Request = Tuple[int, asyncio.Future]
+
+
+class StockReservationAggregator(StockRepository):
+    # Merges concurrent reservations/releases on the same product into one
+    # conditional UPDATE per tick, so a hot row takes one lock acquisition per
+    # tick instead of one per checkout. Results are only resolved after the
+    # tick's transaction has committed.
+    def __init__(self, session_factory, tick_interval: float = 0.002):
+        self._session_factory = session_factory
+        self._tick_interval = tick_interval
+        self._pending: Dict[str, List[_Request]] = {}
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+    async def reserve_stock(self, product_id: str, quantity: int) -> bool:
+        return await self._submit(product_id, -quantity)
+
+    async def release_stock(self, product_id: str, quantity: int) -> bool:
+        return await self._submit(product_id, quantity)
+
+    async def close(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        if self._pending:
+            batch, self._pending = self._pending, {}
+            await self._flush(batch)
+
+    async def _submit(self, product_id: str, delta: int) -> bool:
+        if self._task is None:
+            # A fresh context: the first caller's request (and its trace)
+            # ends long before this batching loop does.
+            self._task = asyncio.create_task(self._run(), context=contextvars.Context())
+
+        future = asyncio.get_running_loop().create_future()
+        self._pending.setdefault(product_id, []).append((delta, future))
+        self._wakeup.set()
+        return await future
+
+    async def _run(self) -> None:
+        while True:
+            await self._wakeup.wait()
+            # Give concurrent requests one tick to join the batch.
+            await asyncio.sleep(self._tick_interval)
+            self._wakeup.clear()
+            batch, self._pending = self._pending, {}
+            await self._flush(batch)
+
+    async def _flush(self, batch: Dict[str, List[_Request]]) -> None:
+        results: List[Tuple[asyncio.Future, bool]] = []
+        try:
+            async with self._session_factory() as session:
+                repository = MySQLProductRepository(session)
+                for product_id, requests in batch.items():
+                    results.extend(await self._apply(repository, product_id, requests))
+                await session.commit()
+        except Exception as e:
+            for requests in batch.values():
+                for _, future in requests:
+                    if not future.done():
+                        future.set_exception(e)
+            return
+
+        for future, result in results:
+            if not future.done():
+                future.set_result(result)
+
+    @staticmethod
+    async def _apply(
+        repository: MySQLProductRepository,
+        product_id: str,
+        requests: List[_Request],
+    ) -> List[Tuple[asyncio.Future, bool]]:
+        results = []
+
+        # Releases go first so returned stock is available to this tick.
+        releases = [(delta, future) for delta, future in requests if delta > 0]
+        if releases:
+            if await repository.release_stock(
+                product_id, sum(quantity for quantity, _ in releases)
+            ):
+                results.extend((future, True) for _, future in releases)
+            elif len(releases) == 1:
+                results.append((releases[0][1], False))
+            else:
+                # More than is reserved in total: release one request at a
+                # time so the ones covered by reservations still succeed.
+                for quantity, future in releases:
+                    released = await repository.release_stock(product_id, quantity)
+                    results.append((future, released))
+
+        reservations = [(-delta, future) for delta, future in requests if delta < 0]
+        if not reservations:
+            return results
+
+        if await repository.reserve_stock(
+            product_id, sum(quantity for quantity, _ in reservations)
+        ):
+            results.extend((future, True) for _, future in reservations)
+            return results
+
+        # Not enough stock for the whole batch: fall back to first come,
+        # first served so smaller requests can still succeed.
+        for quantity, future in reservations:
+            reserved = await repository.reserve_stock(product_id, quantity)
+            results.append((future, reserved))
+        return results
@@ -1,14 +1,33 @@
 from abc import ABC, abstractmethod
+from typing import Optional
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.domain.repositories import ProductRepository, VerificationRepository
+from src.domain.repositories import (
+    ProductRepository,
+    VerificationRepository,
+    CheckpointRepository,
+)
 from src.infrastructure.mysql_repository import MySQLProductRepository
-from src.infrastructure.mongo_repository import MongoVerificationRepository
+from src.infrastructure.mongo_repository import (
+    MongoVerificationRepository,
+    MongoCheckpointRepository,
+)
+from src.infrastructure.circuit_breaker import CircuitBreaker
+from src.infrastructure.verification_spool import VerificationSpool
+from src.infrastructure.resilient_verification_repository import (
+    ResilientVerificationRepository,
+)
+from src.infrastructure.verification_archive import VerificationArchive
+from src.infrastructure.archived_verification_repository import (
+    ArchivedVerificationRepository,
+)
+from src.observability import MetricsRegistry
 
 
 class UnitOfWork(ABC):
     products: ProductRepository
     verifications: VerificationRepository
+    checkpoints: CheckpointRepository
 
     @abstractmethod
     async def __aenter__(self):
@@ -28,18 +47,45 @@ class UnitOfWork(ABC):
 
 
 class SQLAlchemyUnitOfWork(UnitOfWork):
-    def __init__(self, session_factory, mongo_client, mongo_db: str):
+    def __init__(
+        self,
+        session_factory,
+        mongo_client,
+        mongo_db: str,
+        mongo_timeout: Optional[float] = None,
+        verification_breaker: Optional[CircuitBreaker] = None,
+        verification_spool: Optional[VerificationSpool] = None,
+        metrics: Optional[MetricsRegistry] = None,
+        verification_archive: Optional[VerificationArchive] = None,
+    ):
         self._session_factory = session_factory
         self._mongo_client = mongo_client
         self._mongo_db = mongo_db
+        self._mongo_timeout = mongo_timeout
+        self._verification_breaker = verification_breaker
+        self._verification_spool = verification_spool
+        self._metrics = metrics
+        self._verification_archive = verification_archive
         self._session: AsyncSession = None
 
     async def __aenter__(self):
         self._session = self._session_factory()
         self.products = MySQLProductRepository(self._session)
         self.verifications = MongoVerificationRepository(
-            self._mongo_client, self._mongo_db
+            self._mongo_client, self._mongo_db, self._mongo_timeout
         )
+        if self._verification_spool is not None:
+            self.verifications = ResilientVerificationRepository(
+                self.verifications,
+                self._verification_breaker or CircuitBreaker(),
+                self._verification_spool,
+                self._metrics,
+            )
+        if self._verification_archive is not None:
+            self.verifications = ArchivedVerificationRepository(
+                self.verifications, self._verification_archive
+            )
+        self.checkpoints = MongoCheckpointRepository(self._mongo_client, self._mongo_db)
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
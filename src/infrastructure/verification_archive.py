@@ -0,0 +1,408 @@
+import asyncio
+import hashlib
+import json
+import mmap
+import os
+import struct
+import threading
+import time
+import uuid
+import zlib
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from datetime import date, datetime, timedelta, timezone
+from typing import AsyncIterator, Dict, Iterator, List, Optional, Tuple
+
+MAGIC = b"VCA1"
+_TRAILER = struct.Struct("<Q4s")
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+_PARTITION_PREFIX = "verified_date="
+_BLOOM_BITS_PER_KEY = 10
+_BLOOM_HASHES = 7
+CHECK_ABSENT = 2
+
+
+def _to_micros(value: datetime) -> int:
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return (value - _EPOCH) // _MICROSECOND
+
+
+def _from_micros(value: int) -> datetime:
+    return _EPOCH + timedelta(microseconds=value)
+
+
+def _bloom_positions(key: str, bits: int) -> Iterator[int]:
+    digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+    first = int.from_bytes(digest[:8], "little")
+    step = int.from_bytes(digest[8:], "little") | 1
+    for i in range(_BLOOM_HASHES):
+        yield (first + i * step) % bits
+
+
+def _bloom_contains(bloom, key: str) -> bool:
+    for position in _bloom_positions(key, len(bloom) * 8):
+        if not bloom[position >> 3] & (1 << (position & 7)):
+            return False
+    return True
+
+
+def _bloom(keys: List[str]) -> bytearray:
+    bits = max(64, len(keys) * _BLOOM_BITS_PER_KEY)
+    bloom = bytearray((bits + 7) // 8)
+    for key in keys:
+        for position in _bloom_positions(key, len(bloom) * 8):
+            bloom[position >> 3] |= 1 << (position & 7)
+    return bloom
+
+
+class _ArchiveFile:
+    # An open, memory-mapped archive file and its decoded footer. Column
+    # blocks are decompressed straight out of the mapping, and only for row
+    # groups whose bloom filter admits the product id.
+    def __init__(self, path: str):
+        with open(path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        footer_length, magic = _TRAILER.unpack_from(
+            self._map, len(self._map) - _TRAILER.size
+        )
+        if magic != MAGIC or self._map[: len(MAGIC)] != MAGIC:
+            self._map.close()
+            raise ValueError(f"{path} is not a verification archive file")
+        footer_end = len(self._map) - _TRAILER.size
+        self.footer = json.loads(
+            zlib.decompress(self._map[footer_end - footer_length : footer_end])
+        )
+
+    def close(self) -> None:
+        self._map.close()
+
+    def find(self, product_id: str) -> List[dict]:
+        records = []
+        for group in self.footer["row_groups"]:
+            if not group["min_product_id"] <= product_id <= group["max_product_id"]:
+                continue
+            if not self._bloom_contains(group, product_id):
+                continue
+            product_ids = self._column(group, "product_id")
+            start = bisect_left(product_ids, product_id)
+            end = bisect_right(product_ids, product_id, start)
+            if start < end:
+                records.extend(self._rows(group, product_ids, start, end))
+        return records
+
+    def scan(self) -> Iterator[dict]:
+        for group in self.footer["row_groups"]:
+            product_ids = self._column(group, "product_id")
+            yield from self._rows(group, product_ids, 0, len(product_ids))
+
+    def newest_verified_at(self) -> int:
+        newest = 0
+        for group in self.footer["row_groups"]:
+            verified_at = array("q")
+            verified_at.frombytes(self._block(group, "verified_at"))
+            newest = max(newest, max(verified_at, default=0))
+        return newest
+
+    def manifest(self) -> "_FileManifest":
+        return _FileManifest(
+            [
+                (
+                    group["min_product_id"],
+                    group["max_product_id"],
+                    bytes(self._bloom(group)),
+                )
+                for group in self.footer["row_groups"]
+            ]
+        )
+
+    def _bloom(self, group: dict) -> memoryview:
+        offset, length = group["bloom"]
+        return memoryview(self._map)[offset : offset + length]
+
+    def _bloom_contains(self, group: dict, product_id: str) -> bool:
+        return _bloom_contains(self._bloom(group), product_id)
+
+    def _block(self, group: dict, name: str) -> bytes:
+        offset, length = group["columns"][name]
+        return zlib.decompress(memoryview(self._map)[offset : offset + length])
+
+    def _column(self, group: dict, name: str) -> list:
+        return json.loads(self._block(group, name))
+
+    def _rows(
+        self, group: dict, product_ids: List[str], start: int, end: int
+    ) -> Iterator[dict]:
+        record_ids = self._column(group, "record_id")
+        verified_at = array("q")
+        verified_at.frombytes(self._block(group, "verified_at"))
+        policy_versions = self._column(group, "policy_version")
+        reasons = self._column(group, "reasons")
+        checks = {
+            name: self._block(group, f"checks.{name}") for name in group["checks"]
+        }
+        for row in range(start, end):
+            record = {
+                "_record_id": record_ids[row],
+                "product_id": product_ids[row],
+                "checks": {
+                    name: bool(values[row])
+                    for name, values in checks.items()
+                    if values[row] != CHECK_ABSENT
+                },
+                "reasons": reasons[row],
+                "verified_at": _from_micros(verified_at[row]),
+            }
+            if policy_versions[row] is not None:
+                record["policy_version"] = policy_versions[row]
+            yield record
+
+
+class _FileManifest:
+    # The product id ranges and bloom filters of a file's row groups, kept in
+    # memory (about 1.25 bytes per distinct product per file) so lookups of
+    # products a file cannot contain never open it.
+    __slots__ = ("min_product_id", "max_product_id", "groups")
+
+    def __init__(self, groups: List[Tuple[str, str, bytes]]):
+        self.groups = groups
+        self.min_product_id = min((group[0] for group in groups), default="")
+        self.max_product_id = max((group[1] for group in groups), default="")
+
+    def may_contain(self, product_id: str) -> bool:
+        if not self.min_product_id <= product_id <= self.max_product_id:
+            return False
+        return any(
+            low <= product_id <= high and _bloom_contains(bloom, product_id)
+            for low, high, bloom in self.groups
+        )
+
+
+def _encode_file(records: List[dict], row_group_size: int, level: int) -> bytes:
+    records = sorted(
+        records, key=lambda r: (r["product_id"], _to_micros(r["verified_at"]))
+    )
+    chunks = [MAGIC]
+    offset = len(MAGIC)
+    row_groups = []
+
+    def add(block: bytes) -> List[int]:
+        nonlocal offset
+        chunks.append(block)
+        location = [offset, len(block)]
+        offset += len(block)
+        return location
+
+    for start in range(0, len(records), row_group_size):
+        rows = records[start : start + row_group_size]
+        product_ids = [r["product_id"] for r in rows]
+        check_names = sorted({name for r in rows for name in r.get("checks", {})})
+        group = {
+            "rows": len(rows),
+            "min_product_id": product_ids[0],
+            "max_product_id": product_ids[-1],
+            "bloom": add(bytes(_bloom(sorted(set(product_ids))))),
+            "checks": check_names,
+            "columns": {},
+        }
+        columns = {
+            "record_id": json.dumps([str(r["_id"]) for r in rows]).encode(),
+            "product_id": json.dumps(product_ids).encode(),
+            "verified_at": array(
+                "q", [_to_micros(r["verified_at"]) for r in rows]
+            ).tobytes(),
+            "policy_version": json.dumps(
+                [r.get("policy_version") for r in rows]
+            ).encode(),
+            "reasons": json.dumps(
+                [list(r.get("reasons") or []) for r in rows]
+            ).encode(),
+        }
+        for name in check_names:
+            columns[f"checks.{name}"] = bytes(
+                int(r["checks"][name]) if name in r.get("checks", {}) else CHECK_ABSENT
+                for r in rows
+            )
+        for name, column in columns.items():
+            group["columns"][name] = add(zlib.compress(column, level))
+        row_groups.append(group)
+
+    footer = zlib.compress(
+        json.dumps({"rows": len(records), "row_groups": row_groups}).encode(), level
+    )
+    chunks.append(footer)
+    chunks.append(_TRAILER.pack(len(footer), MAGIC))
+    return b"".join(chunks)
+
+
+class VerificationArchive:
+    # Cold tier for verification records, on local disk under
+    # root/verified_date=YYYY-MM-DD/part-*.vca. Each file is immutable and
+    # column oriented: rows sorted by (product_id, verified_at) and split into
+    # row groups, each column zlib compressed separately, with a bloom filter
+    # and product id range per row group in the footer. Lookups map the files
+    # and only decompress row groups that can contain the product.
+    def __init__(
+        self,
+        root: str,
+        row_group_size: int = 1024,
+        compression_level: int = 6,
+        max_open_files: int = 128,
+    ):
+        self._root = root
+        self._row_group_size = row_group_size
+        self._compression_level = compression_level
+        self._max_open_files = max_open_files
+        self._open_files: "OrderedDict[str, _ArchiveFile]" = OrderedDict()
+        # Files are immutable, so manifests are kept for every file seen.
+        self._manifests: Dict[str, _FileManifest] = {}
+        self._lock = threading.Lock()
+        os.makedirs(root, exist_ok=True)
+
+    async def write(self, records: List[dict]) -> List[str]:
+        # Records must carry their Mongo _id; it is kept so records archived
+        # twice (a crash between writing and deleting) are only read once.
+        if not records:
+            return []
+        return await asyncio.to_thread(self._write, records)
+
+    async def find_history(
+        self,
+        product_id: str,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+    ) -> List[dict]:
+        return await asyncio.to_thread(self._find_history, product_id, since, until)
+
+    async def iter_records(self, with_record_ids: bool = False) -> AsyncIterator[dict]:
+        # A record always falls in the partition of its verified date, so
+        # copies archived twice are deduplicated one partition at a time.
+        for partition in self._partitions():
+            records = await asyncio.to_thread(self._scan, partition)
+            for record_id, record in records.items():
+                if with_record_ids:
+                    record["_record_id"] = record_id
+                yield record
+
+    async def newest_verified_at(self) -> Optional[datetime]:
+        return await asyncio.to_thread(self._newest_verified_at)
+
+    def close(self) -> None:
+        with self._lock:
+            for archive_file in self._open_files.values():
+                archive_file.close()
+            self._open_files.clear()
+
+    def _write(self, records: List[dict]) -> List[str]:
+        partitions: Dict[date, List[dict]] = {}
+        for record in records:
+            day = _from_micros(_to_micros(record["verified_at"])).date()
+            partitions.setdefault(day, []).append(record)
+
+        paths = []
+        for day, rows in sorted(partitions.items()):
+            directory = os.path.join(self._root, f"{_PARTITION_PREFIX}{day}")
+            os.makedirs(directory, exist_ok=True)
+            name = f"part-{time.time_ns()}-{uuid.uuid4().hex[:8]}.vca"
+            path = os.path.join(directory, name)
+            data = _encode_file(rows, self._row_group_size, self._compression_level)
+            tmp_path = os.path.join(directory, f".{name}.tmp")
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, path)
+            directory_fd = os.open(directory, os.O_RDONLY)
+            try:
+                os.fsync(directory_fd)
+            finally:
+                os.close(directory_fd)
+            paths.append(path)
+        return paths
+
+    def _find_history(
+        self, product_id: str, since: Optional[datetime], until: Optional[datetime]
+    ) -> List[dict]:
+        records = {}
+        for path in self._files(since, until):
+            if not self._manifest(path).may_contain(product_id):
+                continue
+            for record in self._open(path).find(product_id):
+                if since is not None and record["verified_at"] < since:
+                    continue
+                if until is not None and record["verified_at"] >= until:
+                    continue
+                records[record.pop("_record_id")] = record
+        return sorted(records.values(), key=lambda r: r["verified_at"], reverse=True)
+
+    def _scan(self, partition: str) -> Dict[str, dict]:
+        records = {}
+        for path in self._partition_files(partition):
+            for record in self._open(path).scan():
+                records[record.pop("_record_id")] = record
+        return records
+
+    def _newest_verified_at(self) -> Optional[datetime]:
+        partitions = self._partitions()
+        if not partitions:
+            return None
+        newest = max(
+            (
+                self._open(path).newest_verified_at()
+                for path in self._partition_files(partitions[-1])
+            ),
+            default=None,
+        )
+        return _from_micros(newest) if newest is not None else None
+
+    def _files(
+        self, since: Optional[datetime] = None, until: Optional[datetime] = None
+    ) -> List[str]:
+        paths = []
+        for partition in self._partitions():
+            day = date.fromisoformat(partition[len(_PARTITION_PREFIX) :])
+            if since is not None and day < since.date():
+                continue
+            if until is not None and day > until.date():
+                continue
+            paths.extend(self._partition_files(partition))
+        return paths
+
+    def _partitions(self) -> List[str]:
+        return sorted(
+            partition
+            for partition in os.listdir(self._root)
+            if partition.startswith(_PARTITION_PREFIX)
+        )
+
+    def _partition_files(self, partition: str) -> List[str]:
+        directory = os.path.join(self._root, partition)
+        return [
+            os.path.join(directory, name)
+            for name in sorted(os.listdir(directory))
+            if name.endswith(".vca")
+        ]
+
+    def _manifest(self, path: str) -> _FileManifest:
+        manifest = self._manifests.get(path)
+        if manifest is None:
+            manifest = self._open(path).manifest()
+            with self._lock:
+                self._manifests[path] = manifest
+        return manifest
+
+    def _open(self, path: str) -> _ArchiveFile:
+        with self._lock:
+            archive_file = self._open_files.get(path)
+            if archive_file is not None:
+                self._open_files.move_to_end(path)
+                return archive_file
+            archive_file = _ArchiveFile(path)
+            self._open_files[path] = archive_file
+            if len(self._open_files) > self._max_open_files:
+                # Not closed here: a concurrent lookup may still be reading
+                # it. The mapping is released with its last reference.
+                self._open_files.popitem(last=False)
+            return archive_file
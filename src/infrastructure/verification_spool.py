@@ -0,0 +1,116 @@
+import asyncio
+import contextvars
+import json
+import os
+from datetime import datetime
+from typing import Iterator, List, Optional, Tuple
+
+
+def _encode(value):
+    if isinstance(value, datetime):
+        return {"$datetime": value.isoformat()}
+    raise TypeError(f"Cannot spool {type(value).__name__}")
+
+
+def _decode(document: dict):
+    if len(document) == 1 and "$datetime" in document:
+        return datetime.fromisoformat(document["$datetime"])
+    return document
+
+
+class VerificationSpool:
+    # Append-only JSON lines file holding verification records that could not
+    # be written to Mongo. Appends are group committed: everything buffered
+    # within flush_interval is written and fsynced once, and append() only
+    # returns after its records are on disk.
+    def __init__(self, path: str, flush_interval: float = 0.005):
+        self._path = path
+        self._replay_path = f"{path}.replay"
+        self._flush_interval = flush_interval
+        self._buffer: List[Tuple[bytes, int, asyncio.Future]] = []
+        self._flush_task: Optional[asyncio.Task] = None
+        self._lock = asyncio.Lock()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.pending = self._count_lines(path) + self._count_lines(self._replay_path)
+
+    async def append(self, records: List[dict]) -> None:
+        if not records:
+            return
+        data = b"".join(
+            json.dumps(record, default=_encode).encode("utf-8") + b"\n"
+            for record in records
+        )
+        future = asyncio.get_running_loop().create_future()
+        self._buffer.append((data, len(records), future))
+        if self._flush_task is None or self._flush_task.done():
+            # Not part of the request that happened to start it, so no
+            # request context (or trace) is inherited.
+            self._flush_task = asyncio.create_task(
+                self._flush(), context=contextvars.Context()
+            )
+        await future
+
+    async def start_replay(self) -> bool:
+        # Appends go to a fresh file while the previous one is replayed. A
+        # replay file left by an interrupted run is replayed again first.
+        async with self._lock:
+            if os.path.exists(self._replay_path):
+                return True
+            if not os.path.exists(self._path) or os.path.getsize(self._path) == 0:
+                return False
+            os.replace(self._path, self._replay_path)
+            return True
+
+    def replay_batches(self, batch_size: int) -> Iterator[List[dict]]:
+        batch = []
+        with open(self._replay_path, "rb") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                batch.append(json.loads(line, object_hook=_decode))
+                if len(batch) >= batch_size:
+                    yield batch
+                    batch = []
+        if batch:
+            yield batch
+
+    async def finish_replay(self) -> int:
+        async with self._lock:
+            replayed = self._count_lines(self._replay_path)
+            os.remove(self._replay_path)
+            self.pending -= replayed
+            return replayed
+
+    async def _flush(self) -> None:
+        while self._buffer:
+            await asyncio.sleep(self._flush_interval)
+            batch, self._buffer = self._buffer, []
+            data = b"".join(data for data, _, _ in batch)
+            try:
+                async with self._lock:
+                    await asyncio.to_thread(self._write, data)
+            except Exception as e:
+                for _, _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+
+            self.pending += sum(count for _, count, _ in batch)
+            for _, _, future in batch:
+                if not future.done():
+                    future.set_result(None)
+
+    def _write(self, data: bytes) -> None:
+        with open(self._path, "ab") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+
+    @staticmethod
+    def _count_lines(path: str) -> int:
+        if not os.path.exists(path):
+            return 0
+        with open(path, "rb") as f:
+            return sum(1 for line in f if line.strip())
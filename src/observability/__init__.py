@@ -0,0 +1,19 @@
+from .metrics import MetricsRegistry
+from .tracing import (
+    Tracer,
+    Span,
+    BatchFileSpanExporter,
+    tracer,
+    traced,
+    instrument_sqlalchemy,
+)
+
+__all__ = [
+    "MetricsRegistry",
+    "Tracer",
+    "Span",
+    "BatchFileSpanExporter",
+    "tracer",
+    "traced",
+    "instrument_sqlalchemy",
+]
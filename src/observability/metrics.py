@@ -0,0 +1,27 @@
+from collections import defaultdict
+from typing import Callable, Dict
+
+
+class MetricsRegistry:
+    def __init__(self):
+        self._counters: Dict[str, float] = defaultdict(float)
+        self._gauges: Dict[str, float] = {}
+        self._gauge_callbacks: Dict[str, Callable[[], float]] = {}
+
+    def increment(self, name: str, value: float = 1) -> None:
+        self._counters[name] += value
+
+    def set_gauge(self, name: str, value: float) -> None:
+        self._gauges[name] = value
+
+    def register_gauge(self, name: str, callback: Callable[[], float]) -> None:
+        self._gauge_callbacks[name] = callback
+
+    def counter(self, name: str) -> float:
+        return self._counters.get(name, 0)
+
+    def snapshot(self) -> dict:
+        gauges = dict(self._gauges)
+        for name, callback in self._gauge_callbacks.items():
+            gauges[name] = callback()
+        return {"counters": dict(self._counters), "gauges": gauges}
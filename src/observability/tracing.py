@@ -0,0 +1,388 @@
+import functools
+import json
+import os
+import queue
+import random
+import re
+import threading
+import time
+from contextvars import ContextVar
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import event
+
+_TRACEPARENT = re.compile(r"^00-([0-9a-f]{32})-([0-9a-f]{16})-([0-9a-f]{2})$")
+
+SPAN_KIND_INTERNAL = 1
+SPAN_KIND_SERVER = 2
+SPAN_KIND_CLIENT = 3
+
+MAX_STATEMENT_LENGTH = 2000
+
+
+class Span:
+    __slots__ = (
+        "trace_id",
+        "span_id",
+        "parent_id",
+        "name",
+        "kind",
+        "start_ns",
+        "end_ns",
+        "attributes",
+        "error",
+    )
+
+    def __init__(
+        self,
+        trace_id: int,
+        parent_id: Optional[int],
+        name: str,
+        kind: int,
+        attributes: Optional[Dict[str, Any]],
+    ):
+        self.trace_id = trace_id
+        self.span_id = random.getrandbits(64)
+        self.parent_id = parent_id
+        self.name = name
+        self.kind = kind
+        self.start_ns = time.time_ns()
+        self.end_ns = 0
+        self.attributes = dict(attributes) if attributes else {}
+        self.error: Optional[str] = None
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    @property
+    def duration(self) -> float:
+        return (self.end_ns - self.start_ns) / 1e9
+
+
+class _Trace:
+    __slots__ = ("trace_id", "sampled", "spans", "dropped")
+
+    def __init__(self, trace_id: int, sampled: bool):
+        self.trace_id = trace_id
+        self.sampled = sampled
+        self.spans: List[Span] = []
+        self.dropped = 0
+
+
+_current_trace: ContextVar[Optional[_Trace]] = ContextVar("trace", default=None)
+_current_span: ContextVar[Optional[Span]] = ContextVar("span", default=None)
+
+
+class _SpanScope:
+    __slots__ = ("_tracer", "_span", "_token")
+
+    def __init__(self, tracer: "Tracer", span: Span):
+        self._tracer = tracer
+        self._span = span
+        self._token = None
+
+    def __enter__(self) -> Span:
+        self._token = _current_span.set(self._span)
+        return self._span
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        _current_span.reset(self._token)
+        self._tracer.end_span(self._span, exc)
+        return False
+
+
+class _NoopScope:
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        return False
+
+
+_NOOP_SCOPE = _NoopScope()
+
+
+class Tracer:
+    # Spans are only recorded inside a trace started by the HTTP middleware;
+    # everywhere else span() is a shared no-op. Every request records its
+    # spans in memory and the keep/drop decision is made when it finishes:
+    # head sampled (incoming sampled traceparent or sample_rate), slower than
+    # slow_threshold, or failed with a server error.
+    def __init__(
+        self,
+        sample_rate: float = 0.0,
+        slow_threshold: Optional[float] = None,
+        exporter=None,
+        max_spans_per_trace: int = 256,
+    ):
+        self.configure(sample_rate, slow_threshold, exporter, max_spans_per_trace)
+
+    def configure(
+        self,
+        sample_rate: float = 0.0,
+        slow_threshold: Optional[float] = None,
+        exporter=None,
+        max_spans_per_trace: int = 256,
+    ) -> None:
+        self._sample_rate = sample_rate
+        self._slow_threshold = slow_threshold
+        self._exporter = exporter
+        self._max_spans_per_trace = max_spans_per_trace
+
+    def start_trace(
+        self,
+        name: str,
+        traceparent: Optional[str] = None,
+        attributes: Optional[Dict[str, Any]] = None,
+    ) -> Span:
+        trace_id = parent_id = None
+        sampled = False
+        match = _TRACEPARENT.match(traceparent.strip().lower()) if traceparent else None
+        if match and int(match.group(1), 16) and int(match.group(2), 16):
+            trace_id = int(match.group(1), 16)
+            parent_id = int(match.group(2), 16)
+            sampled = bool(int(match.group(3), 16) & 1)
+        if trace_id is None:
+            trace_id = random.getrandbits(128)
+        if not sampled and self._sample_rate:
+            sampled = random.random() < self._sample_rate
+
+        trace = _Trace(trace_id, sampled)
+        root = Span(trace_id, parent_id, name, SPAN_KIND_SERVER, attributes)
+        trace.spans.append(root)
+        _current_trace.set(trace)
+        _current_span.set(root)
+        return root
+
+    def finish_trace(self, root: Span, error: Optional[BaseException] = None) -> bool:
+        trace = _current_trace.get()
+        self.end_span(root, error)
+        _current_trace.set(None)
+        _current_span.set(None)
+        if trace is None:
+            return False
+
+        keep = (
+            trace.sampled
+            or error is not None
+            or (
+                self._slow_threshold is not None
+                and root.duration >= self._slow_threshold
+            )
+        )
+        if keep and self._exporter is not None:
+            if trace.dropped:
+                root.attributes["trace.dropped_spans"] = trace.dropped
+            self._exporter.export(trace.spans)
+        return keep
+
+    def traceparent(self, span: Span) -> str:
+        trace = _current_trace.get()
+        flags = "01" if trace is not None and trace.sampled else "00"
+        return f"00-{span.trace_id:032x}-{span.span_id:016x}-{flags}"
+
+    def span(
+        self,
+        name: str,
+        attributes: Optional[Dict[str, Any]] = None,
+        kind: int = SPAN_KIND_INTERNAL,
+    ):
+        span = self.start_span(name, attributes, kind)
+        if span is None:
+            return _NOOP_SCOPE
+        return _SpanScope(self, span)
+
+    def start_span(
+        self,
+        name: str,
+        attributes: Optional[Dict[str, Any]] = None,
+        kind: int = SPAN_KIND_INTERNAL,
+    ) -> Optional[Span]:
+        trace = _current_trace.get()
+        if trace is None:
+            return None
+        if len(trace.spans) >= self._max_spans_per_trace:
+            trace.dropped += 1
+            return None
+
+        parent = _current_span.get()
+        span = Span(
+            trace.trace_id,
+            parent.span_id if parent is not None else None,
+            name,
+            kind,
+            attributes,
+        )
+        trace.spans.append(span)
+        return span
+
+    def end_span(self, span: Span, error: Optional[BaseException] = None) -> None:
+        span.end_ns = time.time_ns()
+        if error is not None:
+            span.error = f"{type(error).__name__}: {error}"
+
+
+tracer = Tracer()
+
+
+def traced(layer: str):
+    def decorate(function):
+        name = function.__qualname__
+        attributes = {"code.layer": layer}
+
+        @functools.wraps(function)
+        async def wrapper(*args, **kwargs):
+            with tracer.span(name, attributes):
+                return await function(*args, **kwargs)
+
+        return wrapper
+
+    return decorate
+
+
+def instrument_sqlalchemy(engine, system: str = "mysql") -> None:
+    sync_engine = getattr(engine, "sync_engine", engine)
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, many):
+        operation = statement.split(None, 1)[0].upper() if statement else "QUERY"
+        span = tracer.start_span(
+            f"{system} {operation}",
+            {
+                "db.system": system,
+                "db.operation": operation,
+                "db.statement": statement[:MAX_STATEMENT_LENGTH],
+                "db.executemany": many,
+            },
+            SPAN_KIND_CLIENT,
+        )
+        if span is not None:
+            context._trace_span = span
+
+    def after_cursor_execute(conn, cursor, statement, parameters, context, many):
+        span = getattr(context, "_trace_span", None)
+        if span is not None:
+            tracer.end_span(span)
+
+    def handle_error(exception_context):
+        span = getattr(exception_context.execution_context, "_trace_span", None)
+        if span is not None:
+            tracer.end_span(span, exception_context.original_exception)
+
+    event.listen(sync_engine, "before_cursor_execute", before_cursor_execute)
+    event.listen(sync_engine, "after_cursor_execute", after_cursor_execute)
+    event.listen(sync_engine, "handle_error", handle_error)
+
+
+def _otlp_value(value: Any) -> dict:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+def _otlp_span(span: Span) -> dict:
+    document = {
+        "traceId": f"{span.trace_id:032x}",
+        "spanId": f"{span.span_id:016x}",
+        "name": span.name,
+        "kind": span.kind,
+        "startTimeUnixNano": str(span.start_ns),
+        "endTimeUnixNano": str(span.end_ns),
+        "attributes": [
+            {"key": key, "value": _otlp_value(value)}
+            for key, value in span.attributes.items()
+        ],
+        "status": {"code": 2, "message": span.error} if span.error else {},
+    }
+    if span.parent_id is not None:
+        document["parentSpanId"] = f"{span.parent_id:016x}"
+    return document
+
+
+class BatchFileSpanExporter:
+    # Writes kept traces as OTLP/JSON ExportTraceServiceRequest lines, the
+    # format the OpenTelemetry collector file exporter and OTLP/HTTP use.
+    # Requests only enqueue; a background thread batches and writes, and
+    # spans are dropped (and counted) rather than blocking if it falls behind.
+    def __init__(
+        self,
+        path: str,
+        service_name: str = "product-verification-api",
+        max_batch: int = 512,
+        flush_interval: float = 1.0,
+        max_queue: int = 10_000,
+    ):
+        self._path = path
+        self._resource = {
+            "attributes": [
+                {"key": "service.name", "value": {"stringValue": service_name}}
+            ]
+        }
+        self._max_batch = max_batch
+        self._flush_interval = flush_interval
+        self._queue: "queue.Queue[Optional[List[Span]]]" = queue.Queue(max_queue)
+        self._thread: Optional[threading.Thread] = None
+        self.exported = 0
+        self.dropped = 0
+
+    def start(self) -> None:
+        directory = os.path.dirname(self._path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._thread = threading.Thread(
+            target=self._run, name="span-exporter", daemon=True
+        )
+        self._thread.start()
+
+    def export(self, spans: List[Span]) -> None:
+        try:
+            self._queue.put_nowait(spans)
+        except queue.Full:
+            self.dropped += len(spans)
+
+    def shutdown(self) -> None:
+        if self._thread is None:
+            return
+        self._queue.put(None)
+        self._thread.join()
+        self._thread = None
+
+    def _run(self) -> None:
+        batch: List[Span] = []
+        deadline = time.monotonic() + self._flush_interval
+        while True:
+            try:
+                spans = self._queue.get(timeout=max(0.0, deadline - time.monotonic()))
+            except queue.Empty:
+                spans = []
+            if spans is None:
+                self._write(batch)
+                return
+            batch.extend(spans)
+            if len(batch) >= self._max_batch or time.monotonic() >= deadline:
+                self._write(batch)
+                batch = []
+                deadline = time.monotonic() + self._flush_interval
+
+    def _write(self, spans: List[Span]) -> None:
+        if not spans:
+            return
+        request = {
+            "resourceSpans": [
+                {
+                    "resource": self._resource,
+                    "scopeSpans": [
+                        {
+                            "scope": {"name": "src.observability.tracing"},
+                            "spans": [_otlp_span(span) for span in spans],
+                        }
+                    ],
+                }
+            ]
+        }
+        with open(self._path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(request, separators=(",", ":")) + "\n")
+        self.exported += len(spans)
@@ -1,5 +1,37 @@
 from .create_product import CreateProductUseCase
 from .verify_product import VerifyProductUseCase
 from .get_product import GetProductUseCase
+from .get_product_with_verification import GetProductWithVerificationUseCase
+from .get_product_version import GetProductVersionUseCase
+from .get_catalogue_stats import GetCatalogueStatsUseCase
+from .checkpoint_catalogue_stats import CheckpointCatalogueStatsUseCase
+from .restore_catalogue_stats import RestoreCatalogueStatsUseCase
+from .rebuild_catalogue_stats import RebuildCatalogueStatsUseCase
+from .search_products import SearchProductsUseCase
+from .build_product_search_index import BuildProductSearchIndexUseCase
+from .reserve_stock import ReserveStockUseCase
+from .release_stock import ReleaseStockUseCase
+from .reverify_catalogue import ReverifyCatalogueUseCase
+from .get_metrics import GetMetricsUseCase
+from .archive_verifications import ArchiveVerificationsUseCase
+from .get_verification_history import GetVerificationHistoryUseCase
 
-__all__ = ["CreateProductUseCase", "VerifyProductUseCase", "GetProductUseCase"]
+__all__ = [
+    "CreateProductUseCase",
+    "VerifyProductUseCase",
+    "GetProductUseCase",
+    "GetProductWithVerificationUseCase",
+    "GetProductVersionUseCase",
+    "GetCatalogueStatsUseCase",
+    "CheckpointCatalogueStatsUseCase",
+    "RestoreCatalogueStatsUseCase",
+    "RebuildCatalogueStatsUseCase",
+    "SearchProductsUseCase",
+    "BuildProductSearchIndexUseCase",
+    "ReserveStockUseCase",
+    "ReleaseStockUseCase",
+    "ReverifyCatalogueUseCase",
+    "GetMetricsUseCase",
+    "ArchiveVerificationsUseCase",
+    "GetVerificationHistoryUseCase",
+]
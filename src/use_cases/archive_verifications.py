@@ -0,0 +1,51 @@
+from datetime import datetime, timedelta
+from typing import Optional
+
+from src.infrastructure.unit_of_work import UnitOfWork
+from src.infrastructure.verification_archive import VerificationArchive
+
+
+class ArchiveVerificationsUseCase:
+    def __init__(
+        self,
+        uow: UnitOfWork,
+        archive: VerificationArchive,
+        max_age: timedelta,
+        batch_size: int = 10_000,
+    ):
+        self._uow = uow
+        self._archive = archive
+        self._max_age = max_age
+        self._batch_size = batch_size
+
+    async def execute(self, now: Optional[datetime] = None) -> dict:
+        cutoff = (now or datetime.utcnow()) - self._max_age
+        state = {"cutoff": cutoff, "archived": 0, "deleted": 0, "files": 0}
+
+        # Each batch is durably written to the archive before it is deleted
+        # from Mongo, and the next batch is queried afresh, so an interrupted
+        # run can simply be started again.
+        while True:
+            async with self._uow:
+                batch = []
+                documents = self._uow.verifications.iter_verifications_before(
+                    cutoff, self._batch_size
+                )
+                try:
+                    async for document in documents:
+                        batch.append(document)
+                        if len(batch) >= self._batch_size:
+                            break
+                finally:
+                    await documents.aclose()
+                if not batch:
+                    return state
+
+                files = await self._archive.write(batch)
+                deleted = await self._uow.verifications.delete_verifications(
+                    [document["_id"] for document in batch]
+                )
+
+            state["archived"] += len(batch)
+            state["deleted"] += deleted
+            state["files"] += len(files)
@@ -0,0 +1,40 @@
+import asyncio
+
+from src.infrastructure.unit_of_work import UnitOfWork
+from src.application import ProductSearchIndex
+
+
+class BuildProductSearchIndexUseCase:
+    def __init__(
+        self, uow: UnitOfWork, index: ProductSearchIndex, chunk_size: int = 1000
+    ):
+        self._uow = uow
+        self._index = index
+        self._chunk_size = chunk_size
+
+    async def execute(self) -> int:
+        indexed = 0
+        last_id = None
+        while True:
+            async with self._uow:
+                products = await self._uow.products.list_page(last_id, self._chunk_size)
+            if not products:
+                break
+
+            for product in products:
+                # Events received while the build is running are newer than
+                # the streamed rows, so never overwrite them.
+                self._index.add(
+                    product.product_id,
+                    product.name,
+                    product.category,
+                    product.status,
+                    replace=False,
+                )
+            indexed += len(products)
+            last_id = products[-1].product_id
+
+            # Let request handlers run between chunks.
+            await asyncio.sleep(0)
+
+        return indexed
@@ -0,0 +1,40 @@
+from src.infrastructure.unit_of_work import UnitOfWork
+from src.application import CatalogueStats
+from src.application.catalogue_stats import CATALOGUE_STATS_CHECKPOINT
+
+
+class CheckpointCatalogueStatsUseCase:
+    def __init__(self, uow: UnitOfWork, stats: CatalogueStats):
+        self._uow = uow
+        self._stats = stats
+
+    async def execute(self) -> None:
+        async with self._uow:
+            stored = await self._uow.checkpoints.load(CATALOGUE_STATS_CHECKPOINT)
+
+            # A rebuild (possibly run from another process) bumps the
+            # generation; adopt its counters instead of overwriting them.
+            if stored is not None and stored.get("generation", 0) > (
+                self._stats.generation
+            ):
+                self._stats.restore(stored)
+                return
+
+            if not self._stats.dirty:
+                return
+
+            # The counters only see this process's events, so only a single
+            # worker is supported; another writer means each overwrites the
+            # other's counts.
+            if stored is not None and stored.get("writer") != self._stats.last_writer:
+                print(
+                    "[STATS CHECKPOINT CONFLICT] checkpoint was written by "
+                    f"another process ({stored.get('writer')}); "
+                    "run a single worker"
+                )
+
+            changes = self._stats.changes
+            await self._uow.checkpoints.save(
+                CATALOGUE_STATS_CHECKPOINT, self._stats.to_state()
+            )
+            self._stats.mark_saved(changes)
@@ -4,6 +4,7 @@ from src.infrastructure.unit_of_work import UnitOfWork
 from src.application import ProductService
 from src.domain import Product, ProductVerificationPolicy
 from src.domain.event_dispatcher import EventDispatcher
+from src.observability import traced
 
 
 class CreateProductUseCase:
@@ -11,6 +12,7 @@ class CreateProductUseCase:
         self._uow = uow
         self._event_dispatcher = event_dispatcher
 
+    @traced("use_case")
     async def execute(
         self,
         name: str,
@@ -0,0 +1,11 @@
+from src.application import CatalogueStats
+from src.observability import traced
+
+
+class GetCatalogueStatsUseCase:
+    def __init__(self, stats: CatalogueStats):
+        self._stats = stats
+
+    @traced("use_case")
+    async def execute(self) -> dict:
+        return self._stats.snapshot()
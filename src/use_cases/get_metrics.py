@@ -0,0 +1,9 @@
+from src.observability import MetricsRegistry
+
+
+class GetMetricsUseCase:
+    def __init__(self, metrics: MetricsRegistry):
+        self._metrics = metrics
+
+    async def execute(self) -> dict:
+        return self._metrics.snapshot()
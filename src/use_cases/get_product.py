@@ -1,12 +1,14 @@
 from src.infrastructure.unit_of_work import UnitOfWork
 from src.application import ProductService
 from src.domain import Product, ProductVerificationPolicy
+from src.observability import traced
 
 
 class GetProductUseCase:
     def __init__(self, uow: UnitOfWork):
         self._uow = uow
 
+    @traced("use_case")
     async def execute(self, product_id: str) -> Product:
         async with self._uow:
             verification_policy = ProductVerificationPolicy()
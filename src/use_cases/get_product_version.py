@@ -0,0 +1,19 @@
+from src.infrastructure.unit_of_work import UnitOfWork
+from src.application import ProductService
+from src.domain import ProductVerificationPolicy
+from src.observability import traced
+
+
+class GetProductVersionUseCase:
+    def __init__(self, uow: UnitOfWork):
+        self._uow = uow
+
+    @traced("use_case")
+    async def execute(self, product_id: str) -> int:
+        async with self._uow:
+            verification_policy = ProductVerificationPolicy()
+            service = ProductService(
+                self._uow.products, self._uow.verifications, verification_policy
+            )
+
+            return await service.get_product_version(product_id)
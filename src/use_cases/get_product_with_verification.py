@@ -0,0 +1,25 @@
+from typing import Optional, Tuple
+
+from src.infrastructure.unit_of_work import UnitOfWork
+from src.application import ProductService
+from src.domain import Product, ProductVerificationPolicy
+from src.observability import MetricsRegistry, traced
+
+
+class GetProductWithVerificationUseCase:
+    def __init__(self, uow: UnitOfWork, metrics: Optional[MetricsRegistry] = None):
+        self._uow = uow
+        self._metrics = metrics
+
+    @traced("use_case")
+    async def execute(self, product_id: str) -> Tuple[Product, Optional[dict]]:
+        async with self._uow:
+            verification_policy = ProductVerificationPolicy()
+            service = ProductService(
+                self._uow.products,
+                self._uow.verifications,
+                verification_policy,
+                metrics=self._metrics,
+            )
+
+            return await service.get_product_with_verification(product_id)
@@ -0,0 +1,31 @@
+from datetime import datetime, timezone
+from typing import List, Optional
+
+from src.infrastructure.unit_of_work import UnitOfWork
+from src.observability import traced
+
+
+def _naive_utc(value: Optional[datetime]) -> Optional[datetime]:
+    # Verification times are stored as naive UTC; query bounds with an
+    # offset (e.g. "...Z" in the query string) are converted to match.
+    if value is None or value.tzinfo is None:
+        return value
+    return value.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+class GetVerificationHistoryUseCase:
+    def __init__(self, uow: UnitOfWork):
+        self._uow = uow
+
+    @traced("use_case")
+    async def execute(
+        self,
+        product_id: str,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        limit: Optional[int] = None,
+    ) -> List[dict]:
+        async with self._uow:
+            return await self._uow.verifications.find_history(
+                product_id, _naive_utc(since), _naive_utc(until), limit
+            )
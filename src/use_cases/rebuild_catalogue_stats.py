@@ -0,0 +1,44 @@
+from src.infrastructure.unit_of_work import UnitOfWork
+from src.application import CatalogueStats
+from src.application.catalogue_stats import CATALOGUE_STATS_CHECKPOINT
+from src.domain import ProductStatus
+
+
+class RebuildCatalogueStatsUseCase:
+    def __init__(self, uow: UnitOfWork, stats: CatalogueStats, chunk_size: int = 1000):
+        self._uow = uow
+        self._stats = stats
+        self._chunk_size = chunk_size
+
+    async def execute(self) -> dict:
+        rebuilt = CatalogueStats()
+
+        last_id = None
+        while True:
+            async with self._uow:
+                products = await self._uow.products.list_page(last_id, self._chunk_size)
+            if not products:
+                break
+            for product in products:
+                rebuilt.record_product(
+                    product.status, product.category, product.currency
+                )
+            last_id = products[-1].product_id
+
+        async with self._uow:
+            async for verification in self._uow.verifications.iter_verifications(
+                self._chunk_size
+            ):
+                reasons = verification.get("reasons") or []
+                rebuilt.record_verification(not reasons, reasons)
+
+            stored = await self._uow.checkpoints.load(CATALOGUE_STATS_CHECKPOINT)
+            stored_generation = stored.get("generation", 0) if stored else 0
+            rebuilt.generation = max(stored_generation, self._stats.generation) + 1
+
+            await self._uow.checkpoints.save(
+                CATALOGUE_STATS_CHECKPOINT, rebuilt.to_state()
+            )
+
+        self._stats.restore(rebuilt.to_state())
+        return self._stats.snapshot()
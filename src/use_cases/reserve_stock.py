@@ -0,0 +1,30 @@
+from typing import Optional
+
+from src.infrastructure.unit_of_work import UnitOfWork
+from src.application import ProductService
+from src.domain import ProductVerificationPolicy
+from src.domain.repositories import StockRepository
+from src.observability import traced
+
+
+class ReserveStockUseCase:
+    def __init__(
+        self, uow: UnitOfWork, stock_repository: Optional[StockRepository] = None
+    ):
+        self._uow = uow
+        self._stock_repository = stock_repository
+
+    @traced("use_case")
+    async def execute(self, product_id: str, quantity: int) -> None:
+        async with self._uow:
+            verification_policy = ProductVerificationPolicy()
+            service = ProductService(
+                self._uow.products,
+                self._uow.verifications,
+                verification_policy,
+                stock_repository=self._stock_repository,
+            )
+
+            await service.reserve_stock(product_id, quantity)
+
+            await self._uow.commit()
@@ -0,0 +1,19 @@
+from src.infrastructure.unit_of_work import UnitOfWork
+from src.application import CatalogueStats
+from src.application.catalogue_stats import CATALOGUE_STATS_CHECKPOINT
+
+
+class RestoreCatalogueStatsUseCase:
+    def __init__(self, uow: UnitOfWork, stats: CatalogueStats):
+        self._uow = uow
+        self._stats = stats
+
+    async def execute(self) -> bool:
+        async with self._uow:
+            stored = await self._uow.checkpoints.load(CATALOGUE_STATS_CHECKPOINT)
+
+        if stored is None:
+            return False
+
+        self._stats.restore(stored)
+        return True
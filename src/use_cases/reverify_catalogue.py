@@ -0,0 +1,200 @@
+import asyncio
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from typing import List, Optional, Tuple
+
+from src.infrastructure.unit_of_work import UnitOfWork
+from src.domain import (
+    Product,
+    ProductStatus,
+    ProductVerificationPolicy,
+    ProductVerificationCompleted,
+)
+from src.domain.event_dispatcher import EventDispatcher
+
+_Row = Tuple[str, str, str, str, float, int, List[str]]
+_Outcome = Tuple[str, bool, List[str], dict]
+
+
+def evaluate_rows(rows: List[_Row]) -> List[_Outcome]:
+    # Runs in a worker process: plain tuples in and out keep pickling cheap.
+    policy = ProductVerificationPolicy()
+    outcomes = []
+    for product_id, name, category, currency, price, stock_quantity, assets in rows:
+        result = policy.evaluate(
+            name=name,
+            category=category,
+            currency=currency,
+            price=price,
+            stock_quantity=stock_quantity,
+            assets=assets,
+        )
+        outcomes.append((product_id, result.passed, result.reasons, result.checks))
+    return outcomes
+
+
+class ReverifyCatalogueUseCase:
+    def __init__(
+        self,
+        uow: UnitOfWork,
+        event_dispatcher: EventDispatcher,
+        chunk_size: int = 1000,
+        workers: int = 4,
+        max_rows_per_second: Optional[float] = None,
+        write_duty_cycle: float = 0.5,
+    ):
+        self._uow = uow
+        self._event_dispatcher = event_dispatcher
+        self._chunk_size = chunk_size
+        self._workers = workers
+        self._max_rows_per_second = max_rows_per_second
+        self._write_duty_cycle = write_duty_cycle
+
+    async def execute(self, restart: bool = False) -> dict:
+        policy = ProductVerificationPolicy()
+        checkpoint_name = f"reverification_sweep:{policy.version}"
+        current_versions = (policy.version, policy.version_for(asset_check=True))
+
+        async with self._uow:
+            state = (
+                None if restart else await self._uow.checkpoints.load(checkpoint_name)
+            )
+        state = state or {
+            "policy_version": policy.version,
+            "last_id": None,
+            "scanned": 0,
+            "evaluated": 0,
+            "changed": 0,
+            "completed": False,
+        }
+        if state["completed"]:
+            return state
+
+        pool = ProcessPoolExecutor(self._workers) if self._workers > 0 else None
+        try:
+            while True:
+                chunk_started = time.perf_counter()
+
+                async with self._uow:
+                    page = await self._uow.products.list_page(
+                        state["last_id"], self._chunk_size
+                    )
+                if not page:
+                    break
+
+                # Pending products get the current policy on their first
+                # verify; products already on this version were done by an
+                # earlier, interrupted run. The sweep does not check asset
+                # reachability, so products verified with it under this
+                # policy are left alone rather than evaluated without it.
+                products = [
+                    product
+                    for product in page
+                    if product.status != ProductStatus.PENDING_VERIFICATION
+                    and product.verification_policy_version not in current_versions
+                ]
+
+                write_seconds = 0.0
+                if products:
+                    outcomes = await self._evaluate(pool, products)
+                    write_started = time.perf_counter()
+                    events = await self._write(products, outcomes, policy.version)
+                    write_seconds = time.perf_counter() - write_started
+                    await self._event_dispatcher.dispatch_all(events)
+                    state["evaluated"] += len(products)
+                    state["changed"] += len(events)
+
+                state["last_id"] = page[-1].product_id
+                state["scanned"] += len(page)
+                async with self._uow:
+                    await self._uow.checkpoints.save(checkpoint_name, state)
+
+                await self._throttle(
+                    len(page), time.perf_counter() - chunk_started, write_seconds
+                )
+        finally:
+            if pool is not None:
+                pool.shutdown()
+
+        state["completed"] = True
+        async with self._uow:
+            await self._uow.checkpoints.save(checkpoint_name, state)
+        return state
+
+    async def _evaluate(
+        self, pool: Optional[ProcessPoolExecutor], products: List[Product]
+    ) -> List[_Outcome]:
+        rows = [
+            (
+                product.product_id,
+                product.name,
+                product.category,
+                product.currency,
+                product.price,
+                product.stock_quantity,
+                product.assets,
+            )
+            for product in products
+        ]
+        if pool is None:
+            return evaluate_rows(rows)
+
+        slice_size = -(-len(rows) // self._workers)
+        loop = asyncio.get_running_loop()
+        results = await asyncio.gather(
+            *(
+                loop.run_in_executor(pool, evaluate_rows, rows[i : i + slice_size])
+                for i in range(0, len(rows), slice_size)
+            )
+        )
+        return [outcome for result in results for outcome in result]
+
+    async def _write(
+        self, products: List[Product], outcomes: List[_Outcome], policy_version: str
+    ) -> List[ProductVerificationCompleted]:
+        verified_at = datetime.utcnow()
+        records = []
+        events = []
+        for product, (_, passed, reasons, checks) in zip(products, outcomes):
+            previous_status = product.status
+            product.reevaluate(passed, policy_version)
+            product.verification_hash = product.content_hash()
+            records.append(
+                {
+                    "product_id": product.product_id,
+                    "checks": checks,
+                    "reasons": reasons,
+                    "verified_at": verified_at,
+                    "policy_version": policy_version,
+                }
+            )
+            if product.status != previous_status:
+                events.append(
+                    ProductVerificationCompleted(
+                        product_id=product.product_id,
+                        status=product.status,
+                        reasons=reasons,
+                        previous_status=previous_status,
+                    )
+                )
+
+        async with self._uow:
+            await self._uow.verifications.save_verifications(records)
+            await self._uow.products.bulk_update_verification(products)
+            await self._uow.commit()
+
+        return events
+
+    async def _throttle(
+        self, rows: int, chunk_seconds: float, write_seconds: float
+    ) -> None:
+        # Keep the primary usable for live traffic: cap the scan rate and
+        # leave the database idle for a share of the time spent writing.
+        pause = 0.0
+        if self._max_rows_per_second:
+            pause = rows / self._max_rows_per_second - chunk_seconds
+        if 0 < self._write_duty_cycle < 1:
+            pause = max(pause, write_seconds * (1 / self._write_duty_cycle - 1))
+        if pause > 0:
+            await asyncio.sleep(pause)
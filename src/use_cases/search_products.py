@@ -0,0 +1,16 @@
+from typing import Optional
+
+from src.application import ProductSearchIndex, SearchResults
+from src.domain import ProductStatus
+from src.observability import traced
+
+
+class SearchProductsUseCase:
+    def __init__(self, index: ProductSearchIndex):
+        self._index = index
+
+    @traced("use_case")
+    async def execute(
+        self, query: str, status: Optional[ProductStatus] = None, limit: int = 20
+    ) -> SearchResults:
+        return self._index.search(query, status=status, limit=limit)
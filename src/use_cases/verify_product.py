@@ -1,19 +1,35 @@
+from typing import Optional
+
 from src.infrastructure.unit_of_work import UnitOfWork
 from src.application import ProductService
-from src.domain import Product, ProductVerificationPolicy
+from src.domain import AssetChecker, Product, ProductVerificationPolicy
 from src.domain.event_dispatcher import EventDispatcher
+from src.observability import MetricsRegistry, traced
 
 
 class VerifyProductUseCase:
-    def __init__(self, uow: UnitOfWork, event_dispatcher: EventDispatcher):
+    def __init__(
+        self,
+        uow: UnitOfWork,
+        event_dispatcher: EventDispatcher,
+        metrics: Optional[MetricsRegistry] = None,
+        asset_checker: Optional[AssetChecker] = None,
+    ):
         self._uow = uow
         self._event_dispatcher = event_dispatcher
+        self._metrics = metrics
+        self._asset_checker = asset_checker
 
+    @traced("use_case")
     async def execute(self, product_id: str) -> Product:
         async with self._uow:
             verification_policy = ProductVerificationPolicy()
             service = ProductService(
-                self._uow.products, self._uow.verifications, verification_policy
+                self._uow.products,
+                self._uow.verifications,
+                verification_policy,
+                metrics=self._metrics,
+                asset_checker=self._asset_checker,
             )
 
             product = await service.get_product(product_id)
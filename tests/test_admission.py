@@ -0,0 +1,125 @@
+import asyncio
+
+import pytest
+from httpx import AsyncClient
+
+from src.api.admission import (
+    AdaptiveLimiter,
+    AdmissionClass,
+    AdmissionController,
+    AdmissionControlMiddleware,
+    classify_product_request,
+    QUERY,
+    READ,
+    VERIFY,
+    WRITE,
+)
+from src.observability import MetricsRegistry
+
+
+def config(**overrides):
+    values = dict(
+        initial_limit=2,
+        max_limit=8,
+        target_latency=0.05,
+        queue_timeout=0.05,
+        max_queue=2,
+    )
+    values.update(overrides)
+    return AdmissionClass(**values)
+
+
+class TestAdaptiveLimiter:
+    def test_additive_increase_on_fast_completions(self):
+        limiter = AdaptiveLimiter(config())
+
+        for _ in range(4):
+            assert limiter.try_acquire()
+            assert limiter.try_acquire()
+            limiter.release(0.001)
+            limiter.release(0.001)
+
+        assert 2 < limiter.limit <= 8
+
+    def test_light_load_does_not_raise_limit(self):
+        limiter = AdaptiveLimiter(config(initial_limit=4))
+
+        for _ in range(1000):
+            assert limiter.try_acquire()
+            limiter.release(0.001)
+
+        assert limiter.limit == 4
+
+    def test_multiplicative_decrease_on_slow_completion(self):
+        limiter = AdaptiveLimiter(config(initial_limit=4))
+
+        limiter.try_acquire()
+        limiter.release(1.0)
+
+        assert limiter.limit == pytest.approx(3.6)
+
+    @pytest.mark.asyncio
+    async def test_queued_request_gets_released_slot(self):
+        limiter = AdaptiveLimiter(config(initial_limit=1, queue_timeout=1.0))
+        assert limiter.try_acquire()
+
+        waiter = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0)
+        assert limiter.queued == 1
+        limiter.release()
+
+        assert await waiter is True
+        assert limiter.in_flight == 1
+
+    @pytest.mark.asyncio
+    async def test_queue_deadline_and_bound(self):
+        limiter = AdaptiveLimiter(config(initial_limit=1, max_queue=1))
+        assert limiter.try_acquire()
+
+        queued = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0)
+
+        assert await limiter.acquire() is False
+        assert await queued is False
+        assert limiter.queued == 0
+
+
+def test_classify_product_request():
+    assert classify_product_request("GET", "/api/v1/products/abc") == READ
+    assert classify_product_request("GET", "/api/v1/products/search") == QUERY
+    assert classify_product_request("GET", "/api/v1/products/stats") == QUERY
+    assert (
+        classify_product_request("GET", "/api/v1/products/abc/verifications") == QUERY
+    )
+    assert classify_product_request("POST", "/api/v1/products/abc/verify") == VERIFY
+    assert classify_product_request("POST", "/api/v1/products") == WRITE
+    assert classify_product_request("GET", "/api/v1/metrics") is None
+
+
+@pytest.mark.asyncio
+async def test_middleware_sheds_with_retry_after():
+    release = asyncio.Event()
+
+    async def slow_app(scope, receive, send):
+        await release.wait()
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b"ok"})
+
+    metrics = MetricsRegistry()
+    controller = AdmissionController(
+        {READ: config(initial_limit=1, max_queue=0)}, metrics
+    )
+    app = AdmissionControlMiddleware(slow_app, controller)
+
+    async with AsyncClient(app=app, base_url="http://test") as client:
+        first = asyncio.create_task(client.get("/api/v1/products/a"))
+        await asyncio.sleep(0.01)
+        shed = await client.get("/api/v1/products/b")
+        release.set()
+        admitted = await first
+
+    assert admitted.status_code == 200
+    assert shed.status_code == 503
+    assert shed.headers["retry-after"] == "1"
+    assert metrics.counter("admission_read_shed") == 1
+    assert metrics.snapshot()["gauges"]["admission_read_in_flight"] == 0
@@ -0,0 +1,303 @@
+import asyncio
+from collections import Counter
+from urllib.parse import parse_qs, urlsplit
+
+import httpx
+import pytest
+
+from src.application import ProductService
+from src.domain import Product, ProductStatus, ProductVerificationPolicy
+from src.infrastructure import HttpAssetChecker, asset_checker
+from src.observability import MetricsRegistry, tracer
+
+
+class StubAssetServer:
+    # Minimal keep-alive HTTP/1.1 server: /ok/* -> 200, /missing/* -> 404,
+    # /slow/* -> 200 after a delay, /nohead/* -> 405 for HEAD, 200 for GET,
+    # /redirect?to=<url> -> 302 to that URL.
+    def __init__(self, delay=0.2):
+        self._delay = delay
+        self.requests = Counter()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._handlers = set()
+
+    async def __aenter__(self):
+        self._server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        port = self._server.sockets[0].getsockname()[1]
+        self.url = f"http://127.0.0.1:{port}"
+        return self
+
+    async def __aexit__(self, *exc):
+        self._server.close()
+        for handler in self._handlers:
+            handler.cancel()
+        await asyncio.gather(*self._handlers, return_exceptions=True)
+
+    async def _handle(self, reader, writer):
+        self._handlers.add(asyncio.current_task())
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                while (await reader.readline()) not in (b"\r\n", b""):
+                    pass
+                method, path, _ = request_line.decode().split(" ", 2)
+                self.requests[(method, path)] += 1
+                self.in_flight += 1
+                self.max_in_flight = max(self.max_in_flight, self.in_flight)
+                try:
+                    status = await self._status(method, path)
+                finally:
+                    self.in_flight -= 1
+                headers = "Content-Length: 0\r\n"
+                if status == 302:
+                    (location,) = parse_qs(urlsplit(path).query)["to"]
+                    headers += f"Location: {location}\r\n"
+                writer.write(f"HTTP/1.1 {status} X\r\n{headers}\r\n".encode())
+                await writer.drain()
+        except (ConnectionError, asyncio.CancelledError):
+            pass
+        finally:
+            writer.close()
+            self._handlers.discard(asyncio.current_task())
+
+    async def _status(self, method, path):
+        if path.startswith("/slow/"):
+            await asyncio.sleep(self._delay)
+        if path.startswith("/missing/"):
+            return 404
+        if path.startswith("/redirect"):
+            return 302
+        if path.startswith("/nohead/") and method == "HEAD":
+            return 405
+        return 200
+
+
+@pytest.fixture
+async def client():
+    async with httpx.AsyncClient() as client:
+        yield client
+
+
+@pytest.mark.asyncio
+async def test_reachability_and_unchecked_urls(client):
+    async with StubAssetServer() as server:
+        checker = HttpAssetChecker(client, allow_private_addresses=True)
+        results = await checker.check(
+            [
+                f"{server.url}/ok/a.jpg",
+                f"{server.url}/missing/b.jpg",
+                f"{server.url}/nohead/c.jpg",
+                "image1.jpg",
+                "ftp://example.com/d.jpg",
+            ]
+        )
+
+    assert results == {
+        f"{server.url}/ok/a.jpg": True,
+        f"{server.url}/missing/b.jpg": False,
+        f"{server.url}/nohead/c.jpg": True,
+    }
+    assert server.requests[("GET", "/nohead/c.jpg")] == 1
+
+
+@pytest.mark.asyncio
+async def test_results_are_cached_and_shared_in_flight(client):
+    async with StubAssetServer(delay=0.05) as server:
+        checker = HttpAssetChecker(client, allow_private_addresses=True)
+        url = f"{server.url}/slow/shared.jpg"
+
+        first, second = await asyncio.gather(
+            checker.check([url, url]), checker.check([url])
+        )
+        third = await checker.check([url])
+
+    assert first == second == third == {url: True}
+    assert server.requests[("HEAD", "/slow/shared.jpg")] == 1
+
+
+@pytest.mark.asyncio
+async def test_shared_fetch_does_not_join_the_callers_trace(client):
+    class Exporter:
+        traces = []
+
+        def export(self, spans):
+            self.traces.append(spans)
+
+    exporter = Exporter()
+    tracer.configure(sample_rate=1.0, exporter=exporter)
+    try:
+        async with StubAssetServer(delay=0.05) as server:
+            checker = HttpAssetChecker(client, allow_private_addresses=True)
+            url = f"{server.url}/slow/shared.jpg"
+
+            root = tracer.start_trace("POST /products")
+            first = asyncio.create_task(checker.check([url]))
+            await asyncio.sleep(0)
+            tracer.finish_trace(root)
+            second = await checker.check([url])
+            assert await first == second == {url: True}
+    finally:
+        tracer.configure()
+
+    assert [[span.name for span in spans] for spans in exporter.traces] == [
+        ["POST /products"]
+    ]
+
+
+@pytest.mark.asyncio
+async def test_expired_entries_are_checked_again(client):
+    async with StubAssetServer() as server:
+        checker = HttpAssetChecker(
+            client, allow_private_addresses=True, cache_ttl=0, negative_cache_ttl=0
+        )
+        url = f"{server.url}/ok/a.jpg"
+
+        await checker.check([url])
+        await checker.check([url])
+
+    assert server.requests[("HEAD", "/ok/a.jpg")] == 2
+
+
+@pytest.mark.asyncio
+async def test_per_host_concurrency_is_capped(client):
+    async with StubAssetServer(delay=0.05) as server:
+        checker = HttpAssetChecker(
+            client, allow_private_addresses=True, per_host_limit=2
+        )
+        urls = [f"{server.url}/slow/{i}.jpg" for i in range(8)]
+
+        results = await checker.check(urls)
+
+    assert all(results.values())
+    assert server.max_in_flight == 2
+
+
+@pytest.mark.asyncio
+async def test_deadline_leaves_slow_assets_unchecked(client):
+    async with StubAssetServer(delay=0.3) as server:
+        checker = HttpAssetChecker(client, allow_private_addresses=True, deadline=0.05)
+        slow, fast = f"{server.url}/slow/a.jpg", f"{server.url}/ok/b.jpg"
+
+        results = await checker.check([slow, fast])
+        await asyncio.sleep(0.4)
+        later = await checker.check([slow])
+
+    assert results == {slow: None, fast: True}
+    assert later == {slow: True}
+
+
+@pytest.mark.asyncio
+async def test_request_timeout_counts_as_unreachable(client):
+    async with StubAssetServer(delay=0.3) as server:
+        checker = HttpAssetChecker(
+            client, allow_private_addresses=True, request_timeout=0.05
+        )
+        url = f"{server.url}/slow/a.jpg"
+
+        assert await checker.check([url]) == {url: False}
+
+
+@pytest.mark.asyncio
+async def test_private_and_loopback_addresses_are_not_requested(client):
+    async with StubAssetServer() as server:
+        metrics = MetricsRegistry()
+        checker = HttpAssetChecker(client, metrics=metrics)
+        port = server.url.rsplit(":", 1)[1]
+        urls = [
+            f"{server.url}/ok/a.jpg",
+            f"http://localhost:{port}/ok/b.jpg",
+            "http://169.254.169.254/latest/meta-data/",
+            "http://10.0.0.1/c.jpg",
+            "http://[::1]/d.jpg",
+        ]
+
+        results = await checker.check(urls)
+
+    assert results == {url: False for url in urls}
+    assert server.requests == {}
+    assert metrics.counter("asset_check_blocked") == len(urls)
+
+
+@pytest.mark.asyncio
+async def test_redirects_to_blocked_addresses_are_not_followed(client, monkeypatch):
+    # Treat the stub server's address as public, and nothing else.
+    monkeypatch.setattr(
+        asset_checker, "_is_public", lambda address: address == "127.0.0.1"
+    )
+    async with StubAssetServer() as server:
+        checker = HttpAssetChecker(client)
+        port = server.url.rsplit(":", 1)[1]
+        allowed = f"{server.url}/redirect?to={server.url}/ok/a.jpg"
+        blocked = f"{server.url}/redirect?to=http://127.0.0.2:{port}/ok/b.jpg"
+
+        results = await checker.check([allowed, blocked])
+
+    assert results == {allowed: True, blocked: False}
+    assert server.requests[("HEAD", "/ok/a.jpg")] == 1
+    assert checker._host_limits == {}
+
+
+def test_only_global_unicast_addresses_are_public():
+    assert asset_checker._is_public("93.184.216.34")
+    assert asset_checker._is_public("2606:2800:220:1:248:1893:25c8:1946")
+    for address in (
+        "127.0.0.1",
+        "10.1.2.3",
+        "172.16.0.1",
+        "192.168.1.1",
+        "169.254.169.254",
+        "100.64.0.1",
+        "0.0.0.0",
+        "224.0.0.1",
+        "::1",
+        "fe80::1%eth0",
+        "fd00::1",
+        "::ffff:127.0.0.1",
+    ):
+        assert not asset_checker._is_public(address), address
+
+
+class Products:
+    async def update(self, product):
+        pass
+
+
+class Verifications:
+    def __init__(self):
+        self.saved = []
+
+    async def save_verification(self, **record):
+        self.saved.append(record)
+
+
+@pytest.mark.asyncio
+async def test_verification_rejects_unreachable_assets(client):
+    async with StubAssetServer() as server:
+        verifications = Verifications()
+        service = ProductService(
+            Products(),
+            verifications,
+            ProductVerificationPolicy(),
+            asset_checker=HttpAssetChecker(client, allow_private_addresses=True),
+        )
+        product = Product(
+            product_id="p1",
+            name="Test Product",
+            price=99.99,
+            currency="USD",
+            category="Electronics",
+            stock_quantity=10,
+            assets=[f"{server.url}/ok/a.jpg", f"{server.url}/missing/b.jpg"],
+        )
+
+        await service.verify_product(product)
+
+    (record,) = verifications.saved
+    assert product.status == ProductStatus.REJECTED
+    assert record["checks"]["asset_0_reachable"] is True
+    assert record["checks"]["asset_1_reachable"] is False
+    assert record["checks"]["assets_reachable"] is False
+    assert record["reasons"] == [f"asset {server.url}/missing/b.jpg is unreachable"]
@@ -0,0 +1,35 @@
+from src.api.caching import product_etag, etag_matches
+
+
+class TestProductETag:
+    def test_etag_changes_with_version(self):
+        assert product_etag("abc", 1) != product_etag("abc", 2)
+
+    def test_etag_is_strong_and_quoted(self):
+        etag = product_etag("abc", 1)
+
+        assert etag.startswith('"') and etag.endswith('"')
+
+    def test_matches_exact_tag(self):
+        etag = product_etag("abc", 3)
+
+        assert etag_matches(etag, etag) is True
+
+    def test_matches_any_tag_in_list(self):
+        etag = product_etag("abc", 3)
+
+        assert etag_matches(f'"other", {etag}', etag) is True
+
+    def test_matches_weak_form(self):
+        etag = product_etag("abc", 3)
+
+        assert etag_matches(f"W/{etag}", etag) is True
+
+    def test_matches_wildcard(self):
+        assert etag_matches("*", product_etag("abc", 3)) is True
+
+    def test_stale_tag_does_not_match(self):
+        assert etag_matches(product_etag("abc", 2), product_etag("abc", 3)) is False
+
+    def test_missing_header_does_not_match(self):
+        assert etag_matches(None, product_etag("abc", 3)) is False
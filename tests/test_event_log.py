@@ -0,0 +1,245 @@
+import asyncio
+import os
+import time
+
+import orjson
+import pytest
+
+from src.domain import ProductStatus
+from src.domain.product import (
+    ProductCreatedPendingVerification,
+    ProductVerificationCompleted,
+)
+from src.infrastructure import EventLog, EventLogDispatcher, event_compaction_key
+from src.infrastructure.event_log import _Segment
+from src.infrastructure.event_log_dispatcher import decode_event, encode_event
+from src.observability import MetricsRegistry
+
+
+def payload(i):
+    return f"event-{i}".encode()
+
+
+def completed(product_id, status=ProductStatus.ACTIVE):
+    return ProductVerificationCompleted(
+        product_id=product_id, status=status, reasons=[]
+    )
+
+
+class TestEventLog:
+    @pytest.mark.asyncio
+    async def test_append_assigns_offsets_and_reads_from_any_offset(self, tmp_path):
+        log = EventLog(str(tmp_path), segment_bytes=256, index_interval_bytes=64)
+
+        results = await asyncio.gather(*(log.append([payload(i)]) for i in range(50)))
+
+        assert sorted(offset for offsets in results for offset in offsets) == list(
+            range(50)
+        )
+        assert log.end_offset == 50
+        assert log.segment_count > 1
+        records = log.read(0, max_records=100)
+        assert [offset for offset, _ in records] == list(range(50))
+        by_offset = dict(records)
+        for offsets, i in zip(results, range(50)):
+            assert by_offset[offsets[0]] == payload(i)
+        tail = log.read(37, max_records=5)
+        assert [offset for offset, _ in tail] == list(range(37, 42))
+        assert log.read(50) == []
+        await log.close()
+
+    @pytest.mark.asyncio
+    async def test_single_large_batch_rotates_segments(self, tmp_path):
+        log = EventLog(str(tmp_path), segment_bytes=200)
+
+        offsets = await log.append([payload(i) for i in range(40)])
+
+        assert offsets == list(range(40))
+        assert log.segment_count > 1
+        assert [p for _, p in log.read(0, 100)] == [payload(i) for i in range(40)]
+        await log.close()
+
+    @pytest.mark.asyncio
+    async def test_reopen_recovers_and_truncates_torn_tail(self, tmp_path):
+        log = EventLog(str(tmp_path), segment_bytes=256, index_interval_bytes=64)
+        await log.append([payload(i) for i in range(30)])
+        await log.close()
+
+        last = max(name for name in os.listdir(tmp_path) if name.endswith(".log"))
+        with open(tmp_path / last, "r+b") as f:
+            f.truncate(os.path.getsize(tmp_path / last) - 3)
+
+        log = EventLog(str(tmp_path), segment_bytes=256, index_interval_bytes=64)
+        assert log.end_offset == 29
+        assert [offset for offset, _ in log.read(0, 100)] == list(range(29))
+        assert await log.append([b"after"]) == [29]
+        assert log.read(29) == [(29, b"after")]
+        await log.close()
+
+    @pytest.mark.asyncio
+    async def test_retention_removes_old_segments_but_keeps_active_one(self, tmp_path):
+        log = EventLog(str(tmp_path), segment_bytes=200, retention_bytes=400)
+        await log.append([payload(i) for i in range(60)])
+        segments = log.segment_count
+
+        removed = log.apply_retention()
+
+        assert removed > 0
+        assert log.segment_count == segments - removed
+        assert log.size_bytes <= 400 or log.segment_count == 1
+        assert log.start_offset > 0
+        assert log.read(0, 1)[0][0] == log.start_offset
+        assert log.end_offset == 60
+        await log.close()
+
+        log = EventLog(str(tmp_path), segment_bytes=200, retention_seconds=0)
+        log.apply_retention(now=os.path.getmtime(tmp_path) + 3600)
+        assert log.segment_count == 1
+        await log.close()
+
+    @pytest.mark.asyncio
+    async def test_compaction_keeps_latest_record_per_key(self, tmp_path):
+        log = EventLog(str(tmp_path), segment_bytes=256, index_interval_bytes=64)
+        await log.append([f"p{i % 5}:{i}".encode() for i in range(100)])
+
+        removed = log.compact(lambda record: record.split(b":")[0])
+
+        records = log.read(0, 1000)
+        assert removed > 0
+        assert len(records) == 100 - removed
+        latest = {}
+        for offset, record in records:
+            latest[record.split(b":")[0]] = offset
+        assert latest == {f"p{i}".encode(): 95 + i for i in range(5)}
+        assert [offset for offset, _ in records] == sorted(
+            offset for offset, _ in records
+        )
+        assert await log.append([b"p0:100"]) == [100]
+        await log.close()
+
+        reopened = EventLog(str(tmp_path), segment_bytes=256)
+        assert reopened.read(0, 1000)[: len(records)] == records
+        await reopened.close()
+
+    @pytest.mark.asyncio
+    async def test_compaction_does_not_postpone_time_retention(self, tmp_path):
+        log = EventLog(str(tmp_path), segment_bytes=256, retention_seconds=3600)
+        await log.append([f"p{i % 5}:{i}".encode() for i in range(100)])
+        written_at = time.time() - 7200
+        for name in os.listdir(tmp_path):
+            if name.endswith(".log"):
+                os.utime(tmp_path / name, (written_at, written_at))
+
+        assert log.compact(lambda record: record.split(b":")[0]) > 0
+        log.apply_retention()
+
+        assert log.segment_count == 1
+        await log.close()
+
+    @pytest.mark.asyncio
+    async def test_compaction_only_scans_segments_closed_since_last_run(
+        self, tmp_path, monkeypatch
+    ):
+        def key(record):
+            return record.split(b":")[0]
+
+        log = EventLog(str(tmp_path), segment_bytes=256)
+        await log.append([f"p{i % 5}:{i}".encode() for i in range(100)])
+        assert log.compact(key) > 0
+
+        scanned = []
+        original_scan = _Segment.scan
+
+        def counting_scan(segment):
+            scanned.append(segment.base_offset)
+            return original_scan(segment)
+
+        monkeypatch.setattr(_Segment, "scan", counting_scan)
+        assert log.compact(key) == 0
+        assert scanned == []
+        await log.close()
+
+        reopened = EventLog(str(tmp_path), segment_bytes=256)
+        assert reopened.compact(key) == 0
+        assert scanned == []
+        await reopened.append([f"p0:{i}".encode() for i in range(100, 160)])
+        assert reopened.compact(key) > 0
+        latest = {}
+        for offset, record in reopened.read(0, 1000):
+            latest[key(record)] = offset
+        assert latest[b"p0"] == 159
+        assert latest[b"p1"] == 96
+        await reopened.close()
+
+
+class TestEventLogDispatcher:
+    def test_events_round_trip_through_encoding(self):
+        event = completed("p-1", ProductStatus.REJECTED)
+        event.reasons = ["price must be positive"]
+
+        decoded = decode_event(encode_event(event))
+
+        assert decoded == event
+        assert isinstance(decoded.status, ProductStatus)
+
+    def test_unknown_event_types_decode_to_none(self):
+        payload = orjson.dumps({"type": "SomethingNew", "data": {}})
+
+        assert decode_event(payload) is None
+        assert event_compaction_key(payload) is None
+
+    def test_compaction_key_is_event_type_and_product(self):
+        event = ProductCreatedPendingVerification(product_id="p-1", name="Lamp")
+
+        assert event_compaction_key(encode_event(event)) == (
+            "ProductCreatedPendingVerification",
+            "p-1",
+        )
+
+    @pytest.mark.asyncio
+    async def test_dispatch_appends_then_notifies_and_replays(self, tmp_path):
+        dispatcher = EventLogDispatcher(EventLog(str(tmp_path)))
+        seen = []
+
+        async def handler(event):
+            seen.append(event)
+
+        dispatcher.subscribe(handler)
+        events = [completed(f"p-{i}") for i in range(4)]
+        await dispatcher.dispatch_all(events[:3])
+        await dispatcher.dispatch(events[3])
+
+        assert seen == events
+        assert dispatcher.log.end_offset == 4
+
+        replayed = []
+
+        async def rebuild(event):
+            replayed.append(event.product_id)
+
+        assert await dispatcher.replay(rebuild, batch_size=2) == 4
+        assert replayed == ["p-0", "p-1", "p-2", "p-3"]
+        assert await dispatcher.replay(rebuild, offset=4) == 4
+        await dispatcher.log.close()
+
+    @pytest.mark.asyncio
+    async def test_failed_append_still_notifies_handlers(self, tmp_path, capsys):
+        log = EventLog(str(tmp_path))
+        metrics = MetricsRegistry()
+        dispatcher = EventLogDispatcher(log, metrics)
+        seen = []
+
+        async def handler(event):
+            seen.append(event)
+
+        async def failing_append(payloads):
+            raise OSError("disk full")
+
+        dispatcher.subscribe(handler)
+        log.append = failing_append
+        await dispatcher.dispatch(completed("p-1"))
+
+        assert len(seen) == 1
+        assert "[EVENT LOG APPEND FAILED]" in capsys.readouterr().out
+        assert metrics.counter("event_log_append_failures") == 1
+        await log.close()
@@ -92,3 +92,119 @@ async def test_get_nonexistent_product():
         get_response = await client.get("/api/v1/products/nonexistent-id")
 
         assert get_response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_get_product_conditional_request():
+    async with AsyncClient(app=app, base_url="http://test") as client:
+        create_response = await client.post(
+            "/api/v1/products",
+            json={
+                "name": "iPhone 15",
+                "price": 999.99,
+                "currency": "USD",
+                "category": "Electronics",
+                "stock_quantity": 50,
+                "assets": ["image1.jpg"],
+            },
+        )
+        product_id = create_response.json()["product_id"]
+
+        get_response = await client.get(f"/api/v1/products/{product_id}")
+
+        assert get_response.status_code == 200
+        etag = get_response.headers["etag"]
+        assert get_response.headers["cache-control"] == "private, no-cache"
+
+        not_modified_response = await client.get(
+            f"/api/v1/products/{product_id}", headers={"If-None-Match": etag}
+        )
+
+        assert not_modified_response.status_code == 304
+        assert not_modified_response.content == b""
+        assert not_modified_response.headers["etag"] == etag
+
+        await client.post(f"/api/v1/products/{product_id}/verify")
+
+        modified_response = await client.get(
+            f"/api/v1/products/{product_id}", headers={"If-None-Match": etag}
+        )
+
+        assert modified_response.status_code == 200
+        assert modified_response.headers["etag"] != etag
+        assert modified_response.json()["status"] == "active"
+
+
+@pytest.mark.asyncio
+async def test_get_catalogue_stats():
+    async with AsyncClient(app=app, base_url="http://test") as client:
+        stats_response = await client.get("/api/v1/products/stats")
+
+        assert stats_response.status_code == 200
+        stats = stats_response.json()
+        assert set(stats) == {
+            "total_products",
+            "by_status",
+            "by_category",
+            "by_currency",
+            "verifications",
+        }
+        assert 0.0 <= stats["verifications"]["pass_rate"] <= 1.0
+
+
+@pytest.mark.asyncio
+async def test_reserve_and_release_stock():
+    async with AsyncClient(app=app, base_url="http://test") as client:
+        create_response = await client.post(
+            "/api/v1/products",
+            json={
+                "name": "iPhone 15",
+                "price": 999.99,
+                "currency": "USD",
+                "category": "Electronics",
+                "stock_quantity": 3,
+                "assets": ["image1.jpg"],
+            },
+        )
+        product_id = create_response.json()["product_id"]
+
+        reserve_response = await client.post(
+            f"/api/v1/products/{product_id}/stock/reserve", json={"quantity": 2}
+        )
+
+        assert reserve_response.status_code == 200
+        assert reserve_response.json()["quantity"] == 2
+
+        oversell_response = await client.post(
+            f"/api/v1/products/{product_id}/stock/reserve", json={"quantity": 2}
+        )
+
+        assert oversell_response.status_code == 409
+
+        release_response = await client.post(
+            f"/api/v1/products/{product_id}/stock/release", json={"quantity": 1}
+        )
+
+        assert release_response.status_code == 200
+
+        reserve_again_response = await client.post(
+            f"/api/v1/products/{product_id}/stock/reserve", json={"quantity": 2}
+        )
+
+        assert reserve_again_response.status_code == 200
+
+        over_release_response = await client.post(
+            f"/api/v1/products/{product_id}/stock/release", json={"quantity": 10}
+        )
+
+        assert over_release_response.status_code == 409
+
+
+@pytest.mark.asyncio
+async def test_reserve_stock_nonexistent_product():
+    async with AsyncClient(app=app, base_url="http://test") as client:
+        reserve_response = await client.post(
+            "/api/v1/products/nonexistent-id/stock/reserve", json={"quantity": 1}
+        )
+
+        assert reserve_response.status_code == 404
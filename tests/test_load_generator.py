@@ -0,0 +1,118 @@
+import asyncio
+import random
+
+import pytest
+from httpx import AsyncClient
+
+from benchmarks.load_generator import (
+    Catalogue,
+    Histogram,
+    run_load,
+    seed_catalogue,
+    synthetic_product,
+)
+from src.api.app import app
+from src.api.container import Container, MEMORY_BACKEND
+from src.domain import ProductVerificationPolicy
+
+
+class TestHistogram:
+    def test_percentiles_are_within_precision(self):
+        histogram = Histogram()
+        for value in range(1, 100_001):
+            histogram.record(value)
+
+        for pct in (50, 90, 99, 99.9):
+            expected = 100_000 * pct / 100
+            assert abs(histogram.percentile(pct) - expected) <= expected / 1024
+        assert histogram.percentile(100) == 100_000
+        assert histogram.min == 1
+
+    def test_merge(self):
+        first, second = Histogram(), Histogram()
+        first.record(10, count=99)
+        second.record(5000)
+
+        first.merge(second)
+
+        assert first.count == 100
+        assert first.percentile(50) == 10
+        assert first.max == 5000
+
+    def test_rejects_negative_values(self):
+        with pytest.raises(ValueError):
+            Histogram().record(-1)
+
+
+def test_synthetic_catalogue_is_seeded_and_includes_invalid_products():
+    policy = ProductVerificationPolicy()
+
+    rng = random.Random(7)
+    batch = [synthetic_product(rng, 0.3) for _ in range(500)]
+    invalid = [p for p in batch if not policy.evaluate(**p).passed]
+
+    assert synthetic_product(random.Random(7), 0.3) == batch[0]
+    assert 100 < len(invalid) < 200
+
+
+class StallingApp:
+    # Answers immediately except for one long stall.
+    def __init__(self, stall: float):
+        self._stall = stall
+        self.requests = 0
+
+    async def __call__(self, scope, receive, send):
+        self.requests += 1
+        if self.requests == 5:
+            await asyncio.sleep(self._stall)
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b"{}"})
+
+
+@pytest.mark.asyncio
+async def test_latency_counts_time_requests_waited_to_be_sent():
+    catalogue = Catalogue(random.Random(1), 0.0)
+    async with AsyncClient(app=StallingApp(0.3), base_url="http://test") as client:
+        # A single in-flight slot: everything scheduled during the stall is
+        # late, which the corrected latency must show.
+        report = await run_load(
+            client, catalogue, 100, 1.0, {"stats": 1}, random.Random(1), 1
+        )
+
+    stats = report.routes["stats"]
+    assert report.dropped > 0
+    assert stats.dropped == report.dropped
+    assert stats.latency.count == report.scheduled
+    assert stats.service_time.percentile(90) < 50_000
+    assert stats.latency.max >= 250_000
+
+
+@pytest.mark.asyncio
+async def test_mix_against_memory_backend():
+    container = Container(
+        "mysql+aiomysql://", "mongodb://localhost", "test", backend=MEMORY_BACKEND
+    )
+    app.state.container = container
+    rng = random.Random(3)
+    catalogue = Catalogue(rng, 0.5)
+    try:
+        async with AsyncClient(app=app, base_url="http://test") as client:
+            await seed_catalogue(client, catalogue, 20, 0.5, rng)
+            report = await run_load(
+                client,
+                catalogue,
+                200,
+                0.5,
+                {"create": 1, "verify": 1, "get": 1, "get_with_verification": 1},
+                rng,
+            )
+            stats = (await client.get("/api/v1/products/stats")).json()
+    finally:
+        del app.state.container
+        await container.close()
+
+    overall = report.overall()
+    assert overall.errors == 0
+    assert set(overall.statuses) <= {200, 201}
+    assert overall.latency.count == report.scheduled
+    assert stats["by_status"].get("rejected", 0) > 0
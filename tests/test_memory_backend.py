@@ -0,0 +1,117 @@
+import pytest
+
+from src.domain import Product
+from src.infrastructure import InMemoryStore, InMemoryUnitOfWork
+
+
+def make_product(product_id, stock_quantity=10):
+    return Product(
+        product_id=product_id,
+        name="Test Product",
+        price=99.99,
+        currency="USD",
+        category="Electronics",
+        stock_quantity=stock_quantity,
+        assets=["https://example.com/image1.jpg"],
+    )
+
+
+@pytest.mark.asyncio
+async def test_writes_are_visible_only_after_commit():
+    store = InMemoryStore()
+
+    async with InMemoryUnitOfWork(store) as uow:
+        await uow.products.save(make_product("p1"))
+        assert await uow.products.find_by_id("p1") is not None
+
+    async with InMemoryUnitOfWork(store) as uow:
+        assert await uow.products.find_by_id("p1") is None
+        await uow.products.save(make_product("p1"))
+        await uow.commit()
+
+    async with InMemoryUnitOfWork(store) as uow:
+        product = await uow.products.find_by_id("p1")
+        product.name = "Changed"
+        assert (await uow.products.find_by_id("p1")).name == "Test Product"
+
+
+@pytest.mark.asyncio
+async def test_update_bumps_version_and_list_page_is_ordered():
+    store = InMemoryStore()
+    async with InMemoryUnitOfWork(store) as uow:
+        for product_id in ("p3", "p1", "p2"):
+            await uow.products.save(make_product(product_id))
+        await uow.commit()
+
+    async with InMemoryUnitOfWork(store) as uow:
+        product = await uow.products.find_by_id("p2")
+        await uow.products.update(product)
+        await uow.commit()
+        assert await uow.products.get_version("p2") == 2
+
+        first = await uow.products.list_page(None, 2)
+        rest = await uow.products.list_page(first[-1].product_id, 2)
+
+    assert [p.product_id for p in first] == ["p1", "p2"]
+    assert [p.product_id for p in rest] == ["p3"]
+
+
+@pytest.mark.asyncio
+async def test_reserve_stock_is_conditional():
+    store = InMemoryStore()
+    async with InMemoryUnitOfWork(store) as uow:
+        await uow.products.save(make_product("p1", stock_quantity=3))
+        await uow.commit()
+
+    async with InMemoryUnitOfWork(store) as uow:
+        assert await uow.products.reserve_stock("p1", 2)
+        assert not await uow.products.reserve_stock("p1", 2)
+        assert not await uow.products.reserve_stock("missing", 1)
+        assert (await uow.products.find_by_id("p1")).stock_quantity == 1
+        assert not await uow.products.release_stock("p1", 3)
+        assert await uow.products.release_stock("p1", 2)
+        assert (await uow.products.find_by_id("p1")).stock_quantity == 3
+
+
+@pytest.mark.asyncio
+async def test_update_does_not_undo_concurrent_reservation():
+    store = InMemoryStore()
+    async with InMemoryUnitOfWork(store) as uow:
+        await uow.products.save(make_product("p1", stock_quantity=10))
+        await uow.commit()
+
+    async with InMemoryUnitOfWork(store) as verify:
+        product = await verify.products.find_by_id("p1")
+        product.verification_hash = "h"
+        await verify.products.update(product)
+
+        async with InMemoryUnitOfWork(store) as reserve:
+            assert await reserve.products.reserve_stock("p1", 4)
+            await reserve.commit()
+        version = store.products["p1"].version
+
+        await verify.commit()
+
+    stored = store.products["p1"]
+    assert stored.stock_quantity == 6
+    assert stored.verification_hash == "h"
+    assert stored.version == version + 1
+
+
+@pytest.mark.asyncio
+async def test_latest_verification_is_returned():
+    from datetime import datetime, timedelta
+
+    store = InMemoryStore()
+    now = datetime(2024, 1, 1)
+    async with InMemoryUnitOfWork(store) as uow:
+        await uow.verifications.save_verification("p1", {}, [], now, "1")
+        await uow.verifications.save_verification(
+            "p1", {}, ["late"], now - timedelta(seconds=1), "1"
+        )
+
+        latest = await uow.verifications.find_by_product_id("p1")
+        history = [doc async for doc in uow.verifications.iter_verifications(10)]
+
+    assert latest["verified_at"] == now
+    assert len(history) == 2
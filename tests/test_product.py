@@ -0,0 +1,78 @@
+import pytest
+
+from src.domain import Product, ProductStatus
+
+
+def make_product(status=ProductStatus.PENDING_VERIFICATION):
+    return Product(
+        product_id="p1",
+        name="Test Product",
+        price=99.99,
+        currency="USD",
+        category="Electronics",
+        stock_quantity=10,
+        assets=["image1.jpg"],
+        status=status,
+    )
+
+
+class TestProductTransitions:
+    def test_verification_records_policy_version(self):
+        product = make_product()
+
+        product.transition_to_active("1")
+
+        assert product.status == ProductStatus.ACTIVE
+        assert product.verification_policy_version == "1"
+
+    def test_cannot_verify_twice(self):
+        product = make_product(ProductStatus.ACTIVE)
+
+        with pytest.raises(ValueError):
+            product.transition_to_rejected("1")
+
+    def test_reevaluate_active_to_rejected(self):
+        product = make_product(ProductStatus.ACTIVE)
+
+        product.reevaluate(passed=False, policy_version="2")
+
+        assert product.status == ProductStatus.REJECTED
+        assert product.verification_policy_version == "2"
+
+    def test_reevaluate_rejected_to_active(self):
+        product = make_product(ProductStatus.REJECTED)
+
+        product.reevaluate(passed=True, policy_version="2")
+
+        assert product.status == ProductStatus.ACTIVE
+
+    def test_cannot_reevaluate_pending_product(self):
+        product = make_product()
+
+        with pytest.raises(ValueError):
+            product.reevaluate(passed=True, policy_version="2")
+
+
+class TestContentHash:
+    def test_hash_is_stable(self):
+        assert make_product().content_hash() == make_product().content_hash()
+
+    def test_hash_changes_with_verified_fields(self):
+        product = make_product()
+        original = product.content_hash()
+
+        product.stock_quantity = 0
+
+        assert product.content_hash() != original
+
+    def test_verified_for_requires_hash_version_and_verified_status(self):
+        product = make_product(ProductStatus.ACTIVE)
+        product.verification_policy_version = "1"
+        product.verification_hash = product.content_hash()
+
+        assert product.is_verified_for(product.content_hash(), "1")
+        assert not product.is_verified_for(product.content_hash(), "2")
+        assert not product.is_verified_for("other", "1")
+
+        product.status = ProductStatus.PENDING_VERIFICATION
+        assert not product.is_verified_for(product.content_hash(), "1")
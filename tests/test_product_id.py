@@ -0,0 +1,57 @@
+from datetime import datetime, timedelta
+from uuid import UUID, uuid4
+
+from src.domain.product_id import (
+    uuid7,
+    new_product_id,
+    is_valid_product_id,
+    product_id_to_bytes,
+    product_id_from_bytes,
+    product_id_created_at,
+)
+
+
+class TestProductId:
+    def test_uuid7_version_and_variant(self):
+        value = uuid7()
+
+        assert value.version == 7
+        assert value.variant == "specified in RFC 4122"
+
+    def test_ids_are_time_ordered(self):
+        ids = [uuid7() for _ in range(10_000)]
+
+        assert ids == sorted(ids)
+        assert [i.bytes for i in ids] == sorted(i.bytes for i in ids)
+        assert len(set(ids)) == len(ids)
+
+    def test_new_product_id_is_canonical_string(self):
+        product_id = new_product_id()
+
+        assert len(product_id) == 36
+        assert str(UUID(product_id)) == product_id
+
+    def test_bytes_round_trip(self):
+        product_id = new_product_id()
+        raw = product_id_to_bytes(product_id)
+
+        assert len(raw) == 16
+        assert product_id_from_bytes(raw) == product_id
+
+    def test_legacy_uuid4_ids_round_trip(self):
+        legacy_id = "3f2b8c1e-9d4a-4e7b-8f6a-1c2d3e4f5a6b"
+
+        assert product_id_from_bytes(product_id_to_bytes(legacy_id)) == legacy_id
+
+    def test_is_valid_product_id(self):
+        assert is_valid_product_id(new_product_id()) is True
+        assert is_valid_product_id("nonexistent-id") is False
+        assert is_valid_product_id("") is False
+
+    def test_created_at_from_uuid7_timestamp(self):
+        before = datetime.utcnow()
+        created_at = product_id_created_at(new_product_id())
+
+        assert before - timedelta(milliseconds=1) <= created_at <= datetime.utcnow()
+        assert product_id_created_at(str(uuid4())) is None
+        assert product_id_created_at("p1") is None
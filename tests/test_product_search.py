@@ -0,0 +1,154 @@
+import pytest
+
+from src.application import product_search
+from src.application.product_search import ProductSearchIndex
+from src.domain import (
+    ProductStatus,
+    ProductCreatedPendingVerification,
+    ProductVerificationCompleted,
+)
+
+
+class TestProductSearchIndex:
+    def setup_method(self):
+        self.index = ProductSearchIndex()
+        self.index.add("p1", "iPhone 15 Pro", "Electronics", ProductStatus.ACTIVE)
+        self.index.add("p2", "iPad Air", "Electronics", ProductStatus.REJECTED)
+        self.index.add("p3", "Garden Hose", "Home & Garden", ProductStatus.ACTIVE)
+
+    def ids(self, results):
+        return [hit.product_id for hit in results.hits]
+
+    def test_prefix_match_on_name(self):
+        assert set(self.ids(self.index.search("ip"))) == {"p1", "p2"}
+
+    def test_exact_token_ranks_above_prefix(self):
+        self.index.add("p4", "Pro Max Case", "Accessories", ProductStatus.ACTIVE)
+        self.index.add("p5", "Professional Tripod", "Photo", ProductStatus.ACTIVE)
+
+        hits = self.index.search("pro").hits
+
+        assert hits[-1].product_id == "p5"
+        assert hits[0].score > hits[-1].score
+
+    def test_name_match_ranks_above_category_match(self):
+        self.index.add("p4", "Electronics Toolkit", "Tools", ProductStatus.ACTIVE)
+
+        assert self.ids(self.index.search("electronics"))[0] == "p4"
+
+    def test_all_query_tokens_must_match(self):
+        assert self.ids(self.index.search("iphone pro")) == ["p1"]
+        assert self.index.search("iphone garden").hits == []
+
+    def test_matches_category(self):
+        assert self.ids(self.index.search("garden")) == ["p3"]
+
+    def test_status_filter(self):
+        results = self.index.search("electronics", status=ProductStatus.REJECTED)
+
+        assert self.ids(results) == ["p2"]
+
+    def test_limit(self):
+        assert len(self.index.search("electronics", limit=1).hits) == 1
+
+    def test_case_insensitive(self):
+        assert self.ids(self.index.search("IPHONE")) == ["p1"]
+
+    def test_short_prefix_reports_truncated_expansion(self):
+        index = ProductSearchIndex(max_prefix_expansions=3)
+        for i in range(5):
+            index.add(f"s{i}", f"Widget sku{i}", "Parts", ProductStatus.ACTIVE)
+
+        truncated = index.search("sku")
+
+        assert truncated.truncated
+        assert self.ids(truncated) == ["s0", "s1", "s2"]
+        assert not index.search("sku1").truncated
+        assert not index.search("widget").truncated
+
+    def test_equal_scores_order_by_name_length_then_id_on_both_paths(self):
+        index = ProductSearchIndex()
+        for i in range(6000):
+            index.add(f"p{i:05d}", f"Lamp {i % 7}", "Home", ProductStatus.ACTIVE)
+        index.add("long", "Lamp extra long name", "Home", ProductStatus.ACTIVE)
+
+        tiered = index.search("lamp", limit=5)
+        index.remove("p00000")
+        for i in range(1, 2000):
+            index.remove(f"p{i:05d}")
+        scored = index.search("lamp", limit=5)
+
+        assert self.ids(tiered) == ["p00000", "p00001", "p00002", "p00003", "p00004"]
+        assert self.ids(scored) == ["p02000", "p02001", "p02002", "p02003", "p02004"]
+
+    def test_equal_scores_from_different_tiers_rank_together(self, monkeypatch):
+        # Forces the tiered path, which ranks tier combinations separately.
+        monkeypatch.setattr(product_search, "_SCORE_ALL_LIMIT", 0)
+        index = ProductSearchIndex()
+        index.add("a", "Sony Headphones Plus XL", "Kitchen", ProductStatus.ACTIVE)
+        index.add("b", "Sony Kettle Plus", "Home", ProductStatus.ACTIVE)
+
+        hits = index.search("h plus k").hits
+
+        assert [(hit.product_id, hit.score) for hit in hits] == [("b", 7), ("a", 7)]
+
+    def test_query_work_is_capped_and_reported(self, monkeypatch):
+        monkeypatch.setattr(product_search, "_SCORE_ALL_LIMIT", 0)
+        index = ProductSearchIndex()
+        for i in range(200):
+            name = "Lamp " + "x" * (i % 50)
+            index.add(f"p{i:03d}", name, "Home", ProductStatus.ACTIVE)
+
+        complete = index.search("lamp", status=ProductStatus.REJECTED)
+        monkeypatch.setattr(product_search, "_MAX_QUERY_WORK", 10)
+        capped = index.search("lamp", status=ProductStatus.REJECTED)
+
+        assert complete.hits == [] and not complete.truncated
+        assert capped.hits == [] and capped.truncated
+
+    def test_remove(self):
+        self.index.remove("p1")
+
+        assert self.ids(self.index.search("ip")) == ["p2"]
+
+    def test_bounded_size_evicts_oldest(self):
+        index = ProductSearchIndex(max_products=2)
+        index.add("a", "alpha", "x", ProductStatus.ACTIVE)
+        index.add("b", "beta", "x", ProductStatus.ACTIVE)
+        index.add("c", "gamma", "x", ProductStatus.ACTIVE)
+
+        assert len(index) == 2
+        assert index.evicted == 1
+        assert index.search("alpha").hits == []
+        assert self.ids(index.search("gamma")) == ["c"]
+
+    def test_add_without_replace_keeps_existing(self):
+        self.index.add(
+            "p1",
+            "Old Name",
+            "Electronics",
+            ProductStatus.PENDING_VERIFICATION,
+            replace=False,
+        )
+
+        assert self.ids(self.index.search("iphone")) == ["p1"]
+
+    @pytest.mark.asyncio
+    async def test_kept_current_from_events(self):
+        index = ProductSearchIndex()
+        await index.handle(
+            ProductCreatedPendingVerification(
+                product_id="p9", name="Kindle Paperwhite", category="Books"
+            )
+        )
+
+        assert (
+            index.search("kindle").hits[0].status == ProductStatus.PENDING_VERIFICATION
+        )
+
+        await index.handle(
+            ProductVerificationCompleted(product_id="p9", status=ProductStatus.ACTIVE)
+        )
+
+        hits = index.search("kindle", status=ProductStatus.ACTIVE).hits
+        assert hits[0].product_id == "p9"
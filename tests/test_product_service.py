@@ -0,0 +1,188 @@
+import asyncio
+import time
+
+import pytest
+
+from src.application import ProductService
+from src.domain import Product, ProductStatus, ProductVerificationPolicy
+from src.observability import MetricsRegistry
+
+
+class SlowProducts:
+    def __init__(self, delay, fail=False):
+        self._delay = delay
+        self._fail = fail
+        self.products = {}
+
+    async def update(self, product):
+        await asyncio.sleep(self._delay)
+        if self._fail:
+            raise RuntimeError("mysql down")
+        self.products[product.product_id] = product
+
+    async def find_by_id(self, product_id):
+        await asyncio.sleep(self._delay)
+        return self.products.get(product_id)
+
+
+class SlowVerifications:
+    def __init__(self, delay):
+        self._delay = delay
+        self.saved = []
+        self.cancelled = False
+
+    async def save_verification(self, **record):
+        try:
+            await asyncio.sleep(self._delay)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        self.saved.append(record)
+
+    async def find_by_product_id(self, product_id):
+        await asyncio.sleep(self._delay)
+        matches = [r for r in self.saved if r["product_id"] == product_id]
+        return matches[-1] if matches else None
+
+
+def make_product():
+    return Product(
+        product_id="p1",
+        name="Test Product",
+        price=99.99,
+        currency="USD",
+        category="Electronics",
+        stock_quantity=10,
+        assets=["https://example.com/image1.jpg"],
+    )
+
+
+@pytest.mark.asyncio
+async def test_verify_overlaps_mysql_and_mongo_writes():
+    products = SlowProducts(0.1)
+    verifications = SlowVerifications(0.1)
+    service = ProductService(products, verifications, ProductVerificationPolicy())
+    product = make_product()
+
+    started = time.perf_counter()
+    await service.verify_product(product)
+    elapsed = time.perf_counter() - started
+
+    assert elapsed < 0.18
+    assert product.status == ProductStatus.ACTIVE
+    assert len(verifications.saved) == 1
+    assert products.products["p1"] is product
+
+
+@pytest.mark.asyncio
+async def test_verify_failure_cancels_sibling_and_raises_original_error():
+    verifications = SlowVerifications(1.0)
+    service = ProductService(
+        SlowProducts(0.01, fail=True), verifications, ProductVerificationPolicy()
+    )
+    product = make_product()
+
+    with pytest.raises(RuntimeError, match="mysql down"):
+        await service.verify_product(product)
+
+    assert verifications.cancelled
+    assert product.get_domain_events() == []
+
+
+@pytest.mark.asyncio
+async def test_get_product_with_verification():
+    products = SlowProducts(0.05)
+    verifications = SlowVerifications(0.05)
+    service = ProductService(products, verifications, ProductVerificationPolicy())
+    await service.verify_product(make_product())
+
+    started = time.perf_counter()
+    product, verification = await service.get_product_with_verification("p1")
+    elapsed = time.perf_counter() - started
+
+    assert elapsed < 0.09
+    assert product.product_id == "p1"
+    assert verification["policy_version"] == ProductVerificationPolicy.version
+
+    with pytest.raises(ValueError):
+        await service.get_product_with_verification("missing")
+
+
+class UnavailableVerifications(SlowVerifications):
+    async def find_by_product_id(self, product_id):
+        raise TimeoutError("mongo unavailable")
+
+
+@pytest.mark.asyncio
+async def test_get_product_with_verification_survives_mongo_outage():
+    products = SlowProducts(0)
+    metrics = MetricsRegistry()
+    service = ProductService(
+        products,
+        UnavailableVerifications(0),
+        ProductVerificationPolicy(),
+        metrics=metrics,
+    )
+    products.products["p1"] = make_product()
+
+    product, verification = await service.get_product_with_verification("p1")
+
+    assert product.product_id == "p1"
+    assert verification is None
+    assert metrics.counter("verification_lookup_failures") == 1
+
+
+class StubAssetChecker:
+    def __init__(self, result):
+        self.result = result
+        self.calls = 0
+
+    async def check(self, urls):
+        self.calls += 1
+        return {url: self.result for url in urls}
+
+
+@pytest.mark.asyncio
+async def test_outcomes_resting_on_failed_asset_checks_are_not_memoized():
+    checker = StubAssetChecker(False)
+    service = ProductService(
+        SlowProducts(0),
+        SlowVerifications(0),
+        ProductVerificationPolicy(),
+        asset_checker=checker,
+    )
+    product = make_product()
+
+    await service.verify_product(product)
+    assert product.status == ProductStatus.REJECTED
+    assert product.verification_policy_version == "1+assets"
+
+    checker.result = None
+    await service.verify_product(product)
+    assert checker.calls == 2
+
+    checker.result = True
+    await service.verify_product(product)
+    await service.verify_product(product)
+
+    assert product.status == ProductStatus.ACTIVE
+    assert checker.calls == 3
+
+
+@pytest.mark.asyncio
+async def test_enabling_asset_check_reverifies_memoized_products():
+    product = make_product()
+    await ProductService(
+        SlowProducts(0), SlowVerifications(0), ProductVerificationPolicy()
+    ).verify_product(product)
+
+    checker = StubAssetChecker(False)
+    await ProductService(
+        SlowProducts(0),
+        SlowVerifications(0),
+        ProductVerificationPolicy(),
+        asset_checker=checker,
+    ).verify_product(product)
+
+    assert checker.calls == 1
+    assert product.status == ProductStatus.REJECTED
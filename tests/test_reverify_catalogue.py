@@ -0,0 +1,160 @@
+from typing import List, Optional
+
+import pytest
+
+from src.domain import Product, ProductStatus, ProductVerificationPolicy
+from src.domain.event_dispatcher import InMemoryEventDispatcher
+from src.use_cases import ReverifyCatalogueUseCase
+
+
+class FakeProducts:
+    def __init__(self, products):
+        self.rows = {product.product_id: product for product in products}
+        self.bulk_updates = 0
+
+    async def list_page(self, after_id: Optional[str], limit: int) -> List[Product]:
+        ids = sorted(pid for pid in self.rows if after_id is None or pid > after_id)
+        return [self.rows[pid] for pid in ids[:limit]]
+
+    async def bulk_update_verification(self, products):
+        self.bulk_updates += 1
+        for product in products:
+            self.rows[product.product_id] = product
+
+
+class FakeVerifications:
+    def __init__(self):
+        self.records = []
+        self.insert_many_calls = 0
+
+    async def save_verifications(self, records):
+        self.insert_many_calls += 1
+        self.records.extend(records)
+
+
+class FakeCheckpoints:
+    def __init__(self):
+        self.states = {}
+
+    async def load(self, name):
+        state = self.states.get(name)
+        return dict(state) if state else None
+
+    async def save(self, name, state):
+        self.states[name] = dict(state)
+
+
+class FakeUnitOfWork:
+    def __init__(self, products):
+        self.products = FakeProducts(products)
+        self.verifications = FakeVerifications()
+        self.checkpoints = FakeCheckpoints()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        pass
+
+    async def commit(self):
+        pass
+
+
+def product(product_id, status, price=10.0, policy_version="0"):
+    return Product(
+        product_id=product_id,
+        name="Desk Lamp",
+        price=price,
+        currency="USD",
+        category="Home",
+        stock_quantity=1,
+        assets=["lamp.jpg"],
+        status=status,
+        verification_policy_version=policy_version,
+    )
+
+
+@pytest.fixture
+def uow():
+    return FakeUnitOfWork(
+        [
+            product("p1", ProductStatus.ACTIVE),
+            product("p2", ProductStatus.ACTIVE, price=-1),
+            product("p3", ProductStatus.REJECTED),
+            product("p4", ProductStatus.PENDING_VERIFICATION, policy_version=None),
+            product("p5", ProductStatus.ACTIVE),
+        ]
+    )
+
+
+@pytest.mark.asyncio
+async def test_sweep_reevaluates_verified_products(uow):
+    dispatcher = InMemoryEventDispatcher()
+    use_case = ReverifyCatalogueUseCase(uow, dispatcher, chunk_size=2, workers=0)
+
+    state = await use_case.execute()
+
+    rows = uow.products.rows
+    version = ProductVerificationPolicy.version
+    assert state["completed"] is True
+    assert state["scanned"] == 5
+    assert state["evaluated"] == 4
+    assert state["changed"] == 2
+    assert rows["p2"].status == ProductStatus.REJECTED
+    assert rows["p3"].status == ProductStatus.ACTIVE
+    assert rows["p4"].status == ProductStatus.PENDING_VERIFICATION
+    assert rows["p4"].verification_policy_version is None
+    assert all(
+        rows[pid].verification_policy_version == version
+        for pid in "p1 p2 p3 p5".split()
+    )
+    assert len(uow.verifications.records) == 4
+    assert uow.verifications.insert_many_calls == 3
+    assert {e.product_id for e in dispatcher.get_dispatched_events()} == {"p2", "p3"}
+
+
+@pytest.mark.asyncio
+async def test_sweep_resumes_from_checkpoint(uow):
+    checkpoint_name = f"reverification_sweep:{ProductVerificationPolicy.version}"
+    uow.checkpoints.states[checkpoint_name] = {
+        "policy_version": ProductVerificationPolicy.version,
+        "last_id": "p2",
+        "scanned": 2,
+        "evaluated": 2,
+        "changed": 1,
+        "completed": False,
+    }
+    use_case = ReverifyCatalogueUseCase(
+        uow, InMemoryEventDispatcher(), chunk_size=10, workers=0
+    )
+
+    state = await use_case.execute()
+
+    assert state["scanned"] == 5
+    assert uow.products.rows["p1"].verification_policy_version == "0"
+    assert uow.products.rows["p3"].status == ProductStatus.ACTIVE
+
+
+@pytest.mark.asyncio
+async def test_completed_sweep_is_not_repeated(uow):
+    use_case = ReverifyCatalogueUseCase(
+        uow, InMemoryEventDispatcher(), chunk_size=10, workers=0
+    )
+    await use_case.execute()
+    bulk_updates = uow.products.bulk_updates
+
+    await use_case.execute()
+
+    assert uow.products.bulk_updates == bulk_updates
+
+
+@pytest.mark.asyncio
+async def test_sweep_evaluates_in_process_pool(uow):
+    use_case = ReverifyCatalogueUseCase(
+        uow, InMemoryEventDispatcher(), chunk_size=10, workers=2
+    )
+
+    state = await use_case.execute()
+
+    assert state["evaluated"] == 4
+    assert uow.products.rows["p2"].status == ProductStatus.REJECTED
@@ -0,0 +1,186 @@
+from datetime import datetime
+
+import pytest
+from fastapi.responses import JSONResponse
+
+from src.api.schemas import (
+    CatalogueStatsResponse,
+    ProductResponse,
+    ProductSearchResponse,
+    ProductWithVerificationResponse,
+    StockReservationResponse,
+    VerificationHistoryResponse,
+    VerifyProductResponse,
+)
+from src.api.serializers import (
+    catalogue_stats_json,
+    product_json,
+    product_with_verification_json,
+    search_results_json,
+    stock_reservation_json,
+    verification_history_json,
+    verify_result_json,
+)
+from src.application import SearchHit, SearchResults
+from src.domain import Product, ProductStatus
+
+PRICES = [0, 0.0, 10, 9.99, 0.1 + 0.2, 1e-4, 9.99e-5, 1e-7, 1e15, 1e16, 1e300, -5.5]
+TIMESTAMPS = [
+    datetime(2024, 1, 1, 12, 0),
+    datetime(2024, 1, 1, 12, 0, 0, 400000),
+    datetime(2024, 1, 1, 12, 0, 0, 123456),
+]
+
+
+def pydantic_bytes(model, exclude_unset=False) -> bytes:
+    # What FastAPI produced before: response model dumped in JSON mode and
+    # encoded by JSONResponse.
+    return JSONResponse(model.model_dump(mode="json", exclude_unset=exclude_unset)).body
+
+
+def make_product(price, timestamp, name='Ünïcode "quoted"   😀'):
+    return Product(
+        product_id="01a1540a-4ad1-758a-9196-61ffb3ecc3e4",
+        name=name,
+        price=price,
+        currency="USD",
+        category="Electronics",
+        stock_quantity=3,
+        assets=["https://example.com/a.jpg"],
+        status=ProductStatus.ACTIVE,
+        created_at=timestamp,
+        updated_at=timestamp,
+    )
+
+
+def product_model(product, model=ProductResponse, **extra):
+    return model(
+        product_id=product.product_id,
+        name=product.name,
+        price=product.price,
+        currency=product.currency,
+        status=product.status.value,
+        created_at=product.created_at,
+        updated_at=product.updated_at,
+        **extra,
+    )
+
+
+@pytest.mark.parametrize("price", PRICES)
+@pytest.mark.parametrize("timestamp", TIMESTAMPS)
+def test_product_json_matches_response_model(price, timestamp):
+    product = make_product(price, timestamp)
+
+    assert product_json(product) == pydantic_bytes(product_model(product))
+
+
+def test_non_finite_price_is_still_rejected():
+    with pytest.raises(ValueError):
+        product_json(make_product(float("nan"), TIMESTAMPS[0]))
+
+
+@pytest.mark.parametrize(
+    "verification",
+    [
+        None,
+        {
+            "checks": {"price_valid": True, "assets_present": False},
+            "reasons": ["assets must not be empty"],
+            "verified_at": datetime(2024, 1, 2, 3, 4, 5, 678000),
+            "policy_version": "1",
+        },
+        {
+            "checks": {"price_valid": True},
+            "reasons": [],
+            "verified_at": datetime(2024, 1, 2, 3, 4, 5),
+        },
+    ],
+)
+def test_product_with_verification_json_matches_response_model(verification):
+    product = make_product(9.99, TIMESTAMPS[1])
+    model = product_model(
+        product, ProductWithVerificationResponse, verification=verification
+    )
+
+    assert product_with_verification_json(product, verification) == pydantic_bytes(
+        model, exclude_unset=True
+    )
+
+
+def test_verification_history_json_matches_response_model():
+    verifications = [
+        {
+            "checks": {"price_valid": False},
+            "reasons": ["price must be greater than 0"],
+            "verified_at": datetime(2024, 1, 2, 3, 4, 5, 678000),
+            "policy_version": "1",
+        },
+        {"checks": {}, "reasons": [], "verified_at": datetime(2024, 1, 1)},
+    ]
+    model = VerificationHistoryResponse(product_id="p1", verifications=verifications)
+
+    assert verification_history_json("p1", verifications) == pydantic_bytes(
+        model, exclude_unset=True
+    )
+
+
+def test_small_responses_match_response_models():
+    product = make_product(9.99, TIMESTAMPS[0])
+
+    assert verify_result_json(product, "Product verified and activated") == (
+        pydantic_bytes(
+            VerifyProductResponse(
+                product_id=product.product_id,
+                status="active",
+                message="Product verified and activated",
+            )
+        )
+    )
+    assert stock_reservation_json("p1", 3, "Stock reserved") == pydantic_bytes(
+        StockReservationResponse(product_id="p1", quantity=3, message="Stock reserved")
+    )
+
+
+@pytest.mark.parametrize("pass_rate", [0.0, 1.0, 2 / 3, 1e-5])
+def test_catalogue_stats_json_matches_response_model(pass_rate):
+    stats = {
+        "total_products": 3,
+        "by_status": {"active": 2, "rejected": 1},
+        "by_category": {"Électronique": 3},
+        "by_currency": {"USD": 3},
+        "verifications": {
+            "total": 3,
+            "passed": 2,
+            "pass_rate": pass_rate,
+            "top_rejection_reasons": [{"reason": "price must be > 0", "count": 1}],
+        },
+    }
+
+    assert catalogue_stats_json(stats) == pydantic_bytes(
+        CatalogueStatsResponse(**stats)
+    )
+
+
+def test_search_results_json_matches_response_model():
+    hits = [
+        SearchHit("p1", "Apple iPhone", "Phones", ProductStatus.ACTIVE, 6.0),
+        SearchHit("p2", "Apple Watch", "Wearables", ProductStatus.REJECTED, 4),
+    ]
+    model = ProductSearchResponse(
+        results=[
+            {
+                "product_id": hit.product_id,
+                "name": hit.name,
+                "category": hit.category,
+                "status": hit.status.value,
+                "score": hit.score,
+            }
+            for hit in hits
+        ],
+        truncated=True,
+    )
+
+    assert search_results_json(SearchResults(hits, True)) == pydantic_bytes(model)
+    assert search_results_json(SearchResults([])) == pydantic_bytes(
+        ProductSearchResponse(results=[])
+    )
@@ -0,0 +1,148 @@
+import asyncio
+
+import pytest
+
+from src.infrastructure import stock_aggregator
+from src.infrastructure.stock_aggregator import StockReservationAggregator
+from src.observability import tracer
+
+
+class FakeSession:
+    def __init__(self, db):
+        self.db = db
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        pass
+
+    async def commit(self):
+        self.db.commits += 1
+
+
+class FakeStockDatabase:
+    def __init__(self, stock):
+        self.stock = dict(stock)
+        self.reserved = {product_id: 0 for product_id in stock}
+        self.statements = 0
+        self.commits = 0
+        self.spans = []
+
+    def session(self):
+        return FakeSession(self)
+
+
+class FakeProductRepository:
+    def __init__(self, session):
+        self._db = session.db
+
+    async def reserve_stock(self, product_id, quantity):
+        self._db.statements += 1
+        with tracer.span("UPDATE products") as span:
+            self._db.spans.append(span)
+        if self._db.stock.get(product_id, -1) < quantity:
+            return False
+        self._db.stock[product_id] -= quantity
+        self._db.reserved[product_id] += quantity
+        return True
+
+    async def release_stock(self, product_id, quantity):
+        self._db.statements += 1
+        if self._db.reserved.get(product_id, -1) < quantity:
+            return False
+        self._db.stock[product_id] += quantity
+        self._db.reserved[product_id] -= quantity
+        return True
+
+
+@pytest.fixture
+def db(monkeypatch):
+    monkeypatch.setattr(
+        stock_aggregator, "MySQLProductRepository", FakeProductRepository
+    )
+    return FakeStockDatabase({"hot": 100, "cold": 5})
+
+
+@pytest.mark.asyncio
+async def test_concurrent_reservations_merge_into_one_statement(db):
+    aggregator = StockReservationAggregator(db.session, tick_interval=0.01)
+
+    results = await asyncio.gather(
+        *(aggregator.reserve_stock("hot", 1) for _ in range(50))
+    )
+    await aggregator.close()
+
+    assert all(results)
+    assert db.stock["hot"] == 50
+    assert db.statements == 1
+    assert db.commits == 1
+
+
+@pytest.mark.asyncio
+async def test_insufficient_batch_falls_back_to_first_come_first_served(db):
+    aggregator = StockReservationAggregator(db.session, tick_interval=0.01)
+
+    results = await asyncio.gather(
+        aggregator.reserve_stock("cold", 3),
+        aggregator.reserve_stock("cold", 3),
+        aggregator.reserve_stock("cold", 2),
+    )
+    await aggregator.close()
+
+    assert results == [True, False, True]
+    assert db.stock["cold"] == 0
+
+
+@pytest.mark.asyncio
+async def test_releases_apply_before_reservations(db):
+    aggregator = StockReservationAggregator(db.session, tick_interval=0.01)
+    assert await aggregator.reserve_stock("cold", 3)
+
+    results = await asyncio.gather(
+        aggregator.reserve_stock("cold", 5),
+        aggregator.release_stock("cold", 3),
+    )
+    await aggregator.close()
+
+    assert results == [True, True]
+    assert db.stock["cold"] == 0
+    assert db.reserved["cold"] == 5
+
+
+@pytest.mark.asyncio
+async def test_releases_cannot_exceed_reserved_quantity(db):
+    aggregator = StockReservationAggregator(db.session, tick_interval=0.01)
+    assert await aggregator.reserve_stock("cold", 2)
+
+    results = await asyncio.gather(
+        aggregator.release_stock("cold", 2),
+        aggregator.release_stock("cold", 1),
+    )
+    await aggregator.close()
+
+    assert results == [True, False]
+    assert db.stock["cold"] == 5
+    assert db.reserved["cold"] == 0
+
+
+@pytest.mark.asyncio
+async def test_unknown_product_is_not_reserved(db):
+    aggregator = StockReservationAggregator(db.session, tick_interval=0.01)
+
+    assert await aggregator.reserve_stock("missing", 1) is False
+    assert await aggregator.release_stock("missing", 1) is False
+    await aggregator.close()
+
+
+@pytest.mark.asyncio
+async def test_batching_loop_does_not_join_the_first_callers_trace(db):
+    aggregator = StockReservationAggregator(db.session, tick_interval=0.01)
+
+    root = tracer.start_trace("POST /reserve")
+    assert await aggregator.reserve_stock("hot", 1)
+    tracer.finish_trace(root)
+    assert await aggregator.reserve_stock("hot", 1)
+    await aggregator.close()
+
+    assert db.spans == [None, None]
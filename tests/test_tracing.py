@@ -0,0 +1,158 @@
+import asyncio
+import json
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import create_engine, text
+
+from src.api.tracing_middleware import TracingMiddleware
+from src.observability import (
+    BatchFileSpanExporter,
+    Tracer,
+    instrument_sqlalchemy,
+    traced,
+    tracer,
+)
+
+PARENT = "00-0af7651916cd43dd8448eb211c80319c-b7ad6b7169203331-01"
+
+
+class CollectingExporter:
+    def __init__(self):
+        self.traces = []
+
+    def export(self, spans):
+        self.traces.append(spans)
+
+
+@pytest.fixture
+def exporter():
+    exporter = CollectingExporter()
+    tracer.configure(exporter=exporter)
+    yield exporter
+    tracer.configure()
+
+
+class Service:
+    @traced("service")
+    async def work(self):
+        with tracer.span("db call", {"db.system": "test"}):
+            await asyncio.sleep(0)
+        async with asyncio.TaskGroup() as group:
+            group.create_task(self.child())
+
+    @traced("repository")
+    async def child(self):
+        await asyncio.sleep(0)
+
+
+def test_span_outside_trace_is_noop():
+    with tracer.span("orphan") as span:
+        assert span is None
+
+
+@pytest.mark.asyncio
+async def test_spans_nest_across_layers_and_tasks(exporter):
+    root = tracer.start_trace("GET /x", PARENT)
+    await Service().work()
+    assert tracer.finish_trace(root)
+
+    spans = {span.name: span for span in exporter.traces[0]}
+    assert root.trace_id == 0x0AF7651916CD43DD8448EB211C80319C
+    assert root.parent_id == 0xB7AD6B7169203331
+    assert spans["Service.work"].parent_id == root.span_id
+    assert spans["db call"].parent_id == spans["Service.work"].span_id
+    assert spans["Service.child"].parent_id == spans["Service.work"].span_id
+    assert spans["Service.work"].attributes["code.layer"] == "service"
+    assert all(span.end_ns >= span.start_ns for span in spans.values())
+
+
+@pytest.mark.asyncio
+async def test_unsampled_trace_is_dropped_unless_slow_or_failed(exporter):
+    unsampled = PARENT[:-2] + "00"
+
+    assert not tracer.finish_trace(tracer.start_trace("fast", unsampled))
+
+    tracer.configure(slow_threshold=0.0, exporter=exporter)
+    assert tracer.finish_trace(tracer.start_trace("slow", unsampled))
+
+    tracer.configure(exporter=exporter)
+    root = tracer.start_trace("failed", unsampled)
+    assert tracer.finish_trace(root, RuntimeError("HTTP 500"))
+    assert [spans[0].name for spans in exporter.traces] == ["slow", "failed"]
+
+
+@pytest.mark.asyncio
+async def test_spans_per_trace_are_capped():
+    exporter = CollectingExporter()
+    capped = Tracer(sample_rate=1.0, exporter=exporter, max_spans_per_trace=3)
+
+    root = capped.start_trace("bulk")
+    for _ in range(5):
+        with capped.span("row"):
+            pass
+    capped.finish_trace(root)
+
+    assert len(exporter.traces[0]) == 3
+    assert root.attributes["trace.dropped_spans"] == 3
+
+
+def test_sql_statements_are_recorded(exporter):
+    engine = create_engine("sqlite://")
+    instrument_sqlalchemy(engine, system="sqlite")
+
+    root = tracer.start_trace("query", PARENT)
+    with engine.connect() as connection:
+        connection.execute(text("SELECT 1"))
+    tracer.finish_trace(root)
+
+    query = exporter.traces[0][1]
+    assert query.name == "sqlite SELECT"
+    assert query.attributes["db.statement"] == "SELECT 1"
+    assert query.parent_id == root.span_id
+
+
+@pytest.mark.asyncio
+async def test_middleware_propagates_traceparent(exporter):
+    async def app(scope, receive, send):
+        with tracer.span("handler"):
+            await send({"type": "http.response.start", "status": 200, "headers": []})
+            await send({"type": "http.response.body", "body": b"ok"})
+
+    async with AsyncClient(
+        app=TracingMiddleware(app, tracer), base_url="http://test"
+    ) as client:
+        response = await client.get("/items/1", headers={"traceparent": PARENT})
+
+    version, trace_id, span_id, flags = response.headers["traceparent"].split("-")
+    assert trace_id == "0af7651916cd43dd8448eb211c80319c"
+    assert flags == "01"
+    root, handler = exporter.traces[0]
+    assert f"{root.span_id:016x}" == span_id
+    assert root.attributes["http.status_code"] == 200
+    assert handler.parent_id == root.span_id
+
+
+@pytest.mark.asyncio
+async def test_file_exporter_writes_otlp_json_batches(tmp_path):
+    path = tmp_path / "traces.jsonl"
+    exporter = BatchFileSpanExporter(str(path), flush_interval=60.0)
+    exporter.start()
+    batch_tracer = Tracer(sample_rate=1.0, exporter=exporter)
+
+    for _ in range(3):
+        root = batch_tracer.start_trace("GET /x")
+        with batch_tracer.span("child", {"db.system": "mysql", "rows": 2}):
+            pass
+        batch_tracer.finish_trace(root)
+    exporter.shutdown()
+
+    lines = path.read_text().splitlines()
+    assert len(lines) == 1
+    resource_spans = json.loads(lines[0])["resourceSpans"][0]
+    spans = resource_spans["scopeSpans"][0]["spans"]
+    assert len(spans) == 6
+    child = next(span for span in spans if span["name"] == "child")
+    assert child["parentSpanId"]
+    assert {"key": "rows", "value": {"intValue": "2"}} in child["attributes"]
+    assert exporter.exported == 6
@@ -0,0 +1,277 @@
+import os
+import random
+from datetime import datetime, timedelta, timezone
+from uuid import UUID
+
+import pytest
+
+from src.infrastructure import (
+    ArchivedVerificationRepository,
+    InMemoryStore,
+    InMemoryUnitOfWork,
+    VerificationArchive,
+)
+from src.infrastructure.verification_archive import _ArchiveFile
+from src.application import CatalogueStats
+from src.use_cases import (
+    ArchiveVerificationsUseCase,
+    GetVerificationHistoryUseCase,
+    RebuildCatalogueStatsUseCase,
+)
+
+NOW = datetime(2024, 6, 1, 12, 0)
+CHECKS = {"name_present": True, "price_valid": False}
+
+
+def record(product_id, verified_at, record_id=None, **extra):
+    document = {
+        "_id": record_id or f"{product_id}-{verified_at.isoformat()}",
+        "product_id": product_id,
+        "checks": CHECKS,
+        "reasons": ["price must be greater than 0"],
+        "verified_at": verified_at,
+        "policy_version": "1",
+    }
+    document.update(extra)
+    return document
+
+
+def archived(document):
+    document = dict(document)
+    document.pop("_id")
+    return document
+
+
+class TestVerificationArchive:
+    @pytest.mark.asyncio
+    async def test_round_trip_partitioned_by_date(self, tmp_path):
+        archive = VerificationArchive(str(tmp_path), row_group_size=4)
+        records = [
+            record(f"p{i % 5}", NOW - timedelta(days=i % 3, microseconds=i))
+            for i in range(30)
+        ]
+        records.append(record("p9", NOW, checks={}, reasons=[], policy_version=None))
+        del records[-1]["policy_version"]
+
+        paths = await archive.write(records)
+
+        assert sorted(os.listdir(tmp_path)) == [
+            "verified_date=2024-05-30",
+            "verified_date=2024-05-31",
+            "verified_date=2024-06-01",
+        ]
+        assert len(paths) == 3
+        for product_id in ("p0", "p3", "p9"):
+            expected = sorted(
+                (archived(r) for r in records if r["product_id"] == product_id),
+                key=lambda r: r["verified_at"],
+                reverse=True,
+            )
+            assert await archive.find_history(product_id) == expected
+        assert await archive.find_history("missing") == []
+        assert len([r async for r in archive.iter_records()]) == 31
+        archive.close()
+
+    @pytest.mark.asyncio
+    async def test_time_range_and_duplicate_archival(self, tmp_path):
+        archive = VerificationArchive(str(tmp_path))
+        records = [record("p1", NOW - timedelta(days=day)) for day in range(5)]
+        await archive.write(records)
+        # A crash after writing but before deleting archives records again.
+        await archive.write(records[:2])
+
+        history = await archive.find_history(
+            "p1", since=NOW - timedelta(days=3), until=NOW
+        )
+
+        assert [r["verified_at"] for r in history] == [
+            NOW - timedelta(days=1),
+            NOW - timedelta(days=2),
+            NOW - timedelta(days=3),
+        ]
+        assert len(await archive.find_history("p1")) == 5
+        assert len([r async for r in archive.iter_records()]) == 5
+
+    @pytest.mark.asyncio
+    async def test_columns_compress(self, tmp_path):
+        archive = VerificationArchive(str(tmp_path))
+        rng = random.Random(1)
+        records = [
+            record(f"01a15417-{rng.getrandbits(48):012x}", NOW, record_id=str(i))
+            for i in range(5000)
+        ]
+
+        (path,) = await archive.write(records)
+
+        assert os.path.getsize(path) < 40 * len(records)
+
+
+@pytest.mark.asyncio
+async def test_archive_job_moves_old_records_and_reads_span_both_tiers(tmp_path):
+    store = InMemoryStore()
+    archive = VerificationArchive(str(tmp_path))
+    async with InMemoryUnitOfWork(store) as uow:
+        for day in range(10):
+            await uow.verifications.save_verification(
+                "p1", CHECKS, [], NOW - timedelta(days=day), "1"
+            )
+        await uow.verifications.save_verification(
+            "p2", CHECKS, [], NOW - timedelta(days=40), "1"
+        )
+
+    use_case = ArchiveVerificationsUseCase(
+        InMemoryUnitOfWork(store), archive, timedelta(days=5), batch_size=3
+    )
+    state = await use_case.execute(now=NOW)
+
+    assert state["archived"] == state["deleted"] == 5
+    assert len(store.verifications) == 6
+    assert await use_case.execute(now=NOW) == {
+        **state,
+        "archived": 0,
+        "deleted": 0,
+        "files": 0,
+    }
+
+    async with InMemoryUnitOfWork(store) as uow:
+        repository = ArchivedVerificationRepository(uow.verifications, archive)
+        history = await repository.find_history("p1")
+        newest = await repository.find_history("p1", limit=3)
+        oldest = await repository.find_history("p1", until=NOW - timedelta(days=7))
+        latest_p2 = await repository.find_by_product_id("p2")
+        everything = [r async for r in repository.iter_verifications(100)]
+
+    assert [r["verified_at"] for r in history] == [
+        NOW - timedelta(days=day) for day in range(10)
+    ]
+    assert [r["verified_at"] for r in newest] == [
+        NOW - timedelta(days=day) for day in range(3)
+    ]
+    assert [r["verified_at"] for r in oldest] == [
+        NOW - timedelta(days=day) for day in (8, 9)
+    ]
+    assert latest_p2["verified_at"] == NOW - timedelta(days=40)
+    assert len(everything) == 11
+
+
+@pytest.mark.asyncio
+async def test_interrupted_archive_run_is_not_counted_twice(tmp_path):
+    store = InMemoryStore()
+    archive = VerificationArchive(str(tmp_path))
+    async with InMemoryUnitOfWork(store) as uow:
+        for day in range(6):
+            await uow.verifications.save_verification(
+                "p1", CHECKS, [], NOW - timedelta(days=day), "1"
+            )
+    # Crash after writing the archive but before deleting from Mongo.
+    old = [r for r in store.verifications if r["verified_at"] < NOW - timedelta(days=2)]
+    await archive.write(old)
+    await archive.write(old)
+
+    async with InMemoryUnitOfWork(store) as uow:
+        repository = ArchivedVerificationRepository(uow.verifications, archive)
+        everything = [r async for r in repository.iter_verifications(100)]
+
+    assert sorted(r["verified_at"] for r in everything) == [
+        NOW - timedelta(days=day) for day in reversed(range(6))
+    ]
+
+
+@pytest.mark.asyncio
+async def test_history_accepts_timezone_aware_bounds(tmp_path):
+    store = InMemoryStore()
+    async with InMemoryUnitOfWork(store) as uow:
+        for day in range(3):
+            await uow.verifications.save_verification(
+                "p1", CHECKS, [], NOW - timedelta(days=day), "1"
+            )
+
+    since = (NOW - timedelta(days=1)).replace(tzinfo=timezone.utc)
+    history = await GetVerificationHistoryUseCase(InMemoryUnitOfWork(store)).execute(
+        "p1", since=since.astimezone(timezone(timedelta(hours=2)))
+    )
+
+    assert [r["verified_at"] for r in history] == [NOW, NOW - timedelta(days=1)]
+
+
+class ArchivedInMemoryUnitOfWork(InMemoryUnitOfWork):
+    def __init__(self, store, archive):
+        super().__init__(store)
+        self._archive = archive
+
+    async def __aenter__(self):
+        await super().__aenter__()
+        self.verifications = ArchivedVerificationRepository(
+            self.verifications, self._archive
+        )
+        return self
+
+
+@pytest.mark.asyncio
+async def test_rebuilt_catalogue_stats_count_archived_verifications(tmp_path):
+    store = InMemoryStore()
+    archive = VerificationArchive(str(tmp_path))
+    async with InMemoryUnitOfWork(store) as uow:
+        for day in range(10):
+            await uow.verifications.save_verification(
+                f"p{day}",
+                CHECKS,
+                ["price must be greater than 0"] * (day % 2),
+                NOW - timedelta(days=day),
+                "1",
+            )
+
+    rebuild = RebuildCatalogueStatsUseCase(
+        ArchivedInMemoryUnitOfWork(store, archive), CatalogueStats()
+    )
+    before = (await rebuild.execute())["verifications"]
+    await ArchiveVerificationsUseCase(
+        InMemoryUnitOfWork(store), archive, timedelta(days=5)
+    ).execute(now=NOW)
+    after = (await rebuild.execute())["verifications"]
+
+    assert len(store.verifications) == 6
+    assert before["total"] == 10
+    assert after == before
+
+
+def uuid7_at(created_at):
+    millis = (created_at - datetime(1970, 1, 1)) // timedelta(milliseconds=1)
+    return str(
+        UUID(int=(millis << 80) | (0x7 << 76) | (0b10 << 62) | random.getrandbits(62))
+    )
+
+
+@pytest.mark.asyncio
+async def test_lookups_skip_files_by_manifest_and_creation_time(tmp_path, monkeypatch):
+    archive = VerificationArchive(str(tmp_path), max_open_files=2)
+    product_ids = []
+    for day in range(30):
+        verified_at = NOW - timedelta(days=30 - day)
+        product_ids.append(uuid7_at(verified_at - timedelta(hours=1)))
+        await archive.write([record(product_ids[-1], verified_at)])
+
+    opened = []
+    original_init = _ArchiveFile.__init__
+
+    def counting_init(self, path):
+        opened.append(path)
+        original_init(self, path)
+
+    monkeypatch.setattr(_ArchiveFile, "__init__", counting_init)
+    async with InMemoryUnitOfWork(InMemoryStore()) as uow:
+        repository = ArchivedVerificationRepository(uow.verifications, archive)
+        never_verified = uuid7_at(NOW)
+        assert await repository.find_by_product_id(never_verified) is None
+        assert opened == []
+
+        assert await repository.find_history("p-unknown") == []
+        assert len(opened) == 30
+        for _ in range(3):
+            assert await repository.find_history("p-unknown") == []
+        assert len(opened) == 30
+
+        found = await repository.find_by_product_id(product_ids[12])
+        assert found["verified_at"] == NOW - timedelta(days=18)
+        history = await repository.find_history(product_ids[3], limit=5)
+        assert [r["product_id"] for r in history] == [product_ids[3]]
@@ -0,0 +1,106 @@
+import pytest
+
+from src.application import ProductService
+from src.application.product_service import (
+    VERIFICATION_MEMO_HITS,
+    VERIFICATION_MEMO_MISSES,
+)
+from src.domain import Product, ProductStatus, ProductVerificationPolicy
+from src.observability import MetricsRegistry
+
+
+class FakeProducts:
+    def __init__(self):
+        self.updates = 0
+
+    async def update(self, product):
+        self.updates += 1
+
+
+class FakeVerifications:
+    def __init__(self):
+        self.saved = 0
+
+    async def save_verification(self, **record):
+        self.saved += 1
+
+
+class CountingPolicy(ProductVerificationPolicy):
+    def __init__(self):
+        super().__init__()
+        self.runs = 0
+
+    def evaluate(self, **fields):
+        self.runs += 1
+        return super().evaluate(**fields)
+
+
+def make_product():
+    return Product(
+        product_id="p1",
+        name="Test Product",
+        price=99.99,
+        currency="USD",
+        category="Electronics",
+        stock_quantity=10,
+        assets=["https://example.com/image1.jpg"],
+    )
+
+
+@pytest.fixture
+def service():
+    products = FakeProducts()
+    verifications = FakeVerifications()
+    policy = CountingPolicy()
+    metrics = MetricsRegistry()
+    service = ProductService(products, verifications, policy, metrics=metrics)
+    return service, products, verifications, policy, metrics
+
+
+@pytest.mark.asyncio
+async def test_repeat_verification_is_memoized(service):
+    service, products, verifications, policy, metrics = service
+    product = make_product()
+
+    await service.verify_product(product)
+    status = product.status
+    product.clear_domain_events()
+    await service.verify_product(product)
+
+    assert product.status == status
+    assert product.get_domain_events() == []
+    assert policy.runs == 1
+    assert verifications.saved == 1
+    assert products.updates == 1
+    assert metrics.counter(VERIFICATION_MEMO_HITS) == 1
+    assert metrics.counter(VERIFICATION_MEMO_MISSES) == 1
+
+
+@pytest.mark.asyncio
+async def test_changed_fields_are_reevaluated(service):
+    service, products, verifications, policy, metrics = service
+    product = make_product()
+
+    await service.verify_product(product)
+    assert product.status == ProductStatus.ACTIVE
+    product.stock_quantity = -1
+    await service.verify_product(product)
+
+    assert product.status == ProductStatus.REJECTED
+    assert policy.runs == 2
+    assert verifications.saved == 2
+    assert product.verification_hash == product.content_hash()
+    assert metrics.counter(VERIFICATION_MEMO_HITS) == 0
+
+
+@pytest.mark.asyncio
+async def test_new_policy_version_misses_memo(service):
+    service, products, verifications, policy, metrics = service
+    product = make_product()
+
+    await service.verify_product(product)
+    policy.version = "2"
+    await service.verify_product(product)
+
+    assert policy.runs == 2
+    assert product.verification_policy_version == "2"
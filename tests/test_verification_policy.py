@@ -140,3 +140,39 @@ class TestProductVerificationPolicy:
         assert "price must be greater than 0" in result.reasons
         assert "stock_quantity must be >= 0" in result.reasons
         assert "at least 1 asset is required" in result.reasons
+
+    def test_asset_reachability_adds_checks_for_checked_assets(self):
+        result = self.policy.evaluate(
+            name="Test Product",
+            category="Electronics",
+            currency="USD",
+            price=99.99,
+            stock_quantity=10,
+            assets=["https://a/1.jpg", "image.jpg", "https://a/2.jpg"],
+            asset_reachability={
+                "https://a/1.jpg": True,
+                "image.jpg": None,
+                "https://a/2.jpg": False,
+            },
+        )
+
+        assert result.passed is False
+        assert result.checks["asset_0_reachable"] is True
+        assert "asset_1_reachable" not in result.checks
+        assert result.checks["asset_2_reachable"] is False
+        assert result.checks["assets_reachable"] is False
+        assert result.reasons == ["asset https://a/2.jpg is unreachable"]
+
+    def test_unchecked_assets_do_not_change_the_outcome(self):
+        result = self.policy.evaluate(
+            name="Test Product",
+            category="Electronics",
+            currency="USD",
+            price=99.99,
+            stock_quantity=10,
+            assets=["image.jpg"],
+            asset_reachability={"image.jpg": None},
+        )
+
+        assert result.passed is True
+        assert "assets_reachable" not in result.checks
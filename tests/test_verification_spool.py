@@ -0,0 +1,178 @@
+import asyncio
+from datetime import datetime
+
+import pytest
+from bson import ObjectId
+from pymongo.errors import ServerSelectionTimeoutError
+
+from src.domain.repositories import VerificationStoreUnavailableError
+from src.infrastructure import (
+    CircuitBreaker,
+    VerificationSpool,
+    ResilientVerificationRepository,
+)
+from src.observability import MetricsRegistry
+
+
+class FlakyVerifications:
+    def __init__(self):
+        self.available = True
+        self.documents = {}
+        self.calls = 0
+
+    async def save_verifications(self, records):
+        self.calls += 1
+        # Like pymongo, ids are added to the caller's dicts before sending.
+        for record in records:
+            record.setdefault("_id", ObjectId())
+        if not self.available:
+            raise ServerSelectionTimeoutError("mongo down")
+        for record in records:
+            self.documents[record["_id"]] = record
+
+    async def find_by_product_id(self, product_id):
+        self.calls += 1
+        if not self.available:
+            raise asyncio.TimeoutError()
+        matches = [d for d in self.documents.values() if d["product_id"] == product_id]
+        return matches[-1] if matches else None
+
+    async def find_history(self, product_id, since=None, until=None, limit=None):
+        self.calls += 1
+        if not self.available:
+            raise asyncio.TimeoutError()
+        return [d for d in self.documents.values() if d["product_id"] == product_id]
+
+
+def record(product_id):
+    return {
+        "product_id": product_id,
+        "checks": {"price_positive": True},
+        "reasons": [],
+        "verified_at": datetime(2024, 1, 1, 12, 0),
+    }
+
+
+class TestCircuitBreaker:
+    def test_opens_after_threshold_and_probes_after_timeout(self, monkeypatch):
+        now = [100.0]
+        monkeypatch.setattr("time.monotonic", lambda: now[0])
+        breaker = CircuitBreaker(failure_threshold=2, reset_timeout=5.0)
+
+        breaker.record_failure()
+        assert breaker.allow()
+        breaker.record_failure()
+        assert breaker.state == CircuitBreaker.OPEN
+        assert not breaker.allow()
+
+        now[0] += 5.0
+        assert breaker.state == CircuitBreaker.HALF_OPEN
+        assert breaker.allow()
+        assert not breaker.allow()
+
+        breaker.record_success()
+        assert breaker.state == CircuitBreaker.CLOSED
+
+    def test_failed_probe_reopens(self, monkeypatch):
+        now = [100.0]
+        monkeypatch.setattr("time.monotonic", lambda: now[0])
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=5.0)
+        breaker.record_failure()
+        now[0] += 5.0
+
+        assert breaker.allow()
+        breaker.record_failure()
+
+        assert breaker.state == CircuitBreaker.OPEN
+
+
+@pytest.mark.asyncio
+async def test_spool_group_commits_and_round_trips(tmp_path):
+    spool = VerificationSpool(str(tmp_path / "spool.jsonl"))
+
+    await asyncio.gather(*(spool.append([record(f"p{i}")]) for i in range(10)))
+
+    assert spool.pending == 10
+    assert await spool.start_replay()
+    batches = list(spool.replay_batches(4))
+    assert [len(batch) for batch in batches] == [4, 4, 2]
+    assert batches[0][0]["verified_at"] == datetime(2024, 1, 1, 12, 0)
+    assert await spool.finish_replay() == 10
+    assert spool.pending == 0
+
+
+@pytest.mark.asyncio
+async def test_spool_survives_restart(tmp_path):
+    path = str(tmp_path / "spool.jsonl")
+    await VerificationSpool(path).append([record("p1"), record("p2")])
+
+    assert VerificationSpool(path).pending == 2
+
+
+@pytest.mark.asyncio
+async def test_writes_are_spooled_while_mongo_is_down_and_replayed(tmp_path):
+    mongo = FlakyVerifications()
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.0)
+    spool = VerificationSpool(str(tmp_path / "spool.jsonl"))
+    metrics = MetricsRegistry()
+    repository = ResilientVerificationRepository(mongo, breaker, spool, metrics)
+
+    mongo.available = False
+    await repository.save_verification(
+        "p1", {"ok": False}, ["bad"], datetime.utcnow(), policy_version="1"
+    )
+    await repository.save_verifications([record("p2"), record("p3")])
+
+    assert spool.pending == 3
+    assert mongo.documents == {}
+    assert metrics.counter("verification_records_spooled") == 3
+
+    assert await repository.replay_spool() == 0
+    assert spool.pending == 3
+
+    mongo.available = True
+    assert await repository.replay_spool() == 3
+    assert spool.pending == 0
+    assert len(mongo.documents) == 3
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert metrics.counter("verification_records_replayed") == 3
+
+
+@pytest.mark.asyncio
+async def test_open_breaker_skips_mongo(tmp_path):
+    mongo = FlakyVerifications()
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=60.0)
+    spool = VerificationSpool(str(tmp_path / "spool.jsonl"))
+    repository = ResilientVerificationRepository(mongo, breaker, spool)
+
+    mongo.available = False
+    await repository.save_verifications([record("p1")])
+    await repository.save_verifications([record("p2")])
+
+    assert mongo.calls == 1
+    assert spool.pending == 2
+
+
+@pytest.mark.asyncio
+async def test_read_timeouts_open_breaker_and_open_breaker_fails_reads_fast(tmp_path):
+    mongo = FlakyVerifications()
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=60.0)
+    metrics = MetricsRegistry()
+    spool = VerificationSpool(str(tmp_path / "spool.jsonl"))
+    repository = ResilientVerificationRepository(mongo, breaker, spool, metrics)
+    await repository.save_verifications([record("p1")])
+    assert (await repository.find_by_product_id("p1"))["product_id"] == "p1"
+
+    mongo.available = False
+    for _ in range(2):
+        with pytest.raises(VerificationStoreUnavailableError):
+            await repository.find_history("p1")
+    assert breaker.state == CircuitBreaker.OPEN
+
+    calls = mongo.calls
+    with pytest.raises(VerificationStoreUnavailableError):
+        await repository.find_by_product_id("p1")
+    with pytest.raises(VerificationStoreUnavailableError):
+        await repository.find_history("p1")
+    assert mongo.calls == calls
+    assert metrics.counter("verification_reads_rejected") == 2